@@ -12,13 +12,14 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
 import json
 import math
 import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 
 @dataclass(frozen=True)
@@ -198,21 +199,28 @@ def _format_s5_sample_starvation_detail(metrics: Dict[str, Any]) -> str:
     return "；sample_starvation: " + "; ".join(parts)
 
 
+# 日志行以时间戳开头，docker compose 输出会在前面加 "<service>  | "。
+# 以时间戳开头的 RUNTIME 正则锚定到行首（MULTILINE），finditer 不再在行内每个数字处尝试匹配时间戳。
+LOG_LINE_PREFIX_PATTERN = r"^(?:[^\n|]*\|[ \t]*)?"
 RUNTIME_ACCOUNT_RE = re.compile(
-    r"(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?"
+    LOG_LINE_PREFIX_PATTERN
+    + r"(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?"
     r"RUNTIME_STATUS:.*?equity=(?P<equity>-?[0-9]+(?:\.[0-9]+)?), "
     r"drawdown_pct=(?P<drawdown_pct>-?[0-9]+(?:\.[0-9]+)?), "
-    r"notional=(?P<notional>-?[0-9]+(?:\.[0-9]+)?)"
+    r"notional=(?P<notional>-?[0-9]+(?:\.[0-9]+)?)",
+    re.MULTILINE,
 )
 RUNTIME_ACCOUNT_SAMPLE_RE = re.compile(
-    r"(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?"
+    LOG_LINE_PREFIX_PATTERN
+    + r"(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?"
     r"RUNTIME_STATUS:\s*ticks=(?P<tick>\d+),.*?"
     r"account=\{equity=(?P<equity>-?[0-9]+(?:\.[0-9]+)?), "
     r"drawdown_pct=(?P<drawdown_pct>-?[0-9]+(?:\.[0-9]+)?), "
     r"notional=(?P<notional>-?[0-9]+(?:\.[0-9]+)?), "
     r"realized_pnl=(?P<realized>-?[0-9]+(?:\.[0-9]+)?), "
     r"fees=(?P<fees>-?[0-9]+(?:\.[0-9]+)?), "
-    r"realized_net=(?P<net>-?[0-9]+(?:\.[0-9]+)?)"
+    r"realized_net=(?P<net>-?[0-9]+(?:\.[0-9]+)?)",
+    re.MULTILINE,
 )
 RUNTIME_ACCOUNT_REALIZED_RE = re.compile(
     r"RUNTIME_STATUS:.*?account=\{[^}]*?"
@@ -246,30 +254,66 @@ RUNTIME_ENTRY_GATE_RE = re.compile(
     r"(?:, [^}]*?observed_near_miss_allowed_ratio="
     r"(?P<observed_near_miss_allowed_ratio>-?[0-9]+(?:\.[0-9]+)?))?"
 )
-RUNTIME_CONCENTRATION_RE = re.compile(
-    r"RUNTIME_STATUS:.*?concentration=\{[^}]*?"
-    r"gross_notional_usd=(?P<gross_notional_usd>-?[0-9]+(?:\.[0-9]+)?), "
-    r"top1_abs_notional_usd=(?P<top1_abs_notional_usd>-?[0-9]+(?:\.[0-9]+)?), "
-    r"top1_symbol=(?P<top1_symbol>[^,}]+), "
-    r"top1_share=(?P<top1_share>-?[0-9]+(?:\.[0-9]+)?), "
-    r"symbol_count=(?P<symbol_count>\d+)"
-)
-RUNTIME_EXECUTION_QUALITY_GUARD_RE = re.compile(
-    r"RUNTIME_STATUS:.*?execution_quality_guard=\{[^}]*?"
-    r"enabled=(?P<enabled>true|false), "
-    r"active=(?P<active>true|false), "
-    r"bad_streak=(?P<bad_streak>-?[0-9]+), "
-    r"good_streak=(?P<good_streak>-?[0-9]+), "
-    r"no_fill_windows=(?P<no_fill_windows>-?[0-9]+), "
-    r"min_fills=(?P<min_fills>-?[0-9]+), "
-    r"trigger_streak=(?P<trigger_streak>-?[0-9]+), "
-    r"release_streak=(?P<release_streak>-?[0-9]+), "
-    r"min_realized_net_per_fill_usd=(?P<min_realized_net_per_fill_usd>-?[0-9]+(?:\.[0-9]+)?), "
-    r"max_fee_bps_per_fill=(?P<max_fee_bps_per_fill>-?[0-9]+(?:\.[0-9]+)?), "
-    r"applied_penalty_bps=(?P<applied_penalty_bps>-?[0-9]+(?:\.[0-9]+)?)"
-    r"(?:, symbol_active_count=(?P<symbol_active_count>-?[0-9]+), "
-    r"symbol_state_count=(?P<symbol_state_count>-?[0-9]+))?"
-)
+# find + split 切出的子块字段按原整行正则的取值文法 fullmatch 校验（见
+# runtime_block_matches）：空值、nan、多余符号等原正则不接受的样本依旧跳过。
+LOG_BOOL_RE = re.compile(r"true|false")
+LOG_ENUM_RE = re.compile(r"[A-Z_]+")
+LOG_INT_RE = re.compile(r"-?[0-9]+")
+LOG_UINT_RE = re.compile(r"[0-9]+")
+LOG_DECIMAL_RE = re.compile(r"-?[0-9]+(?:\.[0-9]+)?")
+LOG_UDECIMAL_RE = re.compile(r"[0-9]+(?:\.[0-9]+)?")
+LOG_TOKEN_RE = re.compile(r"[^,}]+")
+RUNTIME_REGIME_CURRENT_FIELDS = {
+    "trend_threshold_ratio": LOG_UDECIMAL_RE,
+    "trend_candidate": LOG_BOOL_RE,
+}
+# pending 确认字段整组出现；任一字段畸形则整组视为缺失（与原正则的可选组一致）。
+RUNTIME_REGIME_PENDING_FIELDS = {
+    "raw_regime": LOG_ENUM_RE,
+    "raw_bucket": LOG_ENUM_RE,
+    "pending_regime": LOG_ENUM_RE,
+    "pending_bucket": LOG_ENUM_RE,
+    "pending_regime_ticks": LOG_INT_RE,
+    "confirm_ticks_required": LOG_INT_RE,
+    "pending_regime_elapsed_ms": LOG_INT_RE,
+    "confirm_elapsed_ms_required": LOG_INT_RE,
+    "pending_trend_confirmation": LOG_BOOL_RE,
+}
+# 以下子块按 find + split 解析（见 iter_runtime_status_blocks），缺任一必需字段或取值
+# 不合文法的样本跳过。
+RUNTIME_CONCENTRATION_FIELDS = {
+    "gross_notional_usd": LOG_DECIMAL_RE,
+    "top1_abs_notional_usd": LOG_DECIMAL_RE,
+    "top1_symbol": LOG_TOKEN_RE,
+    "top1_share": LOG_DECIMAL_RE,
+    "symbol_count": LOG_UINT_RE,
+}
+RUNTIME_EXECUTION_QUALITY_GUARD_FIELDS = {
+    "enabled": LOG_BOOL_RE,
+    "active": LOG_BOOL_RE,
+    "bad_streak": LOG_INT_RE,
+    "good_streak": LOG_INT_RE,
+    "no_fill_windows": LOG_INT_RE,
+    "min_fills": LOG_INT_RE,
+    "trigger_streak": LOG_INT_RE,
+    "release_streak": LOG_INT_RE,
+    "min_realized_net_per_fill_usd": LOG_DECIMAL_RE,
+    "max_fee_bps_per_fill": LOG_DECIMAL_RE,
+    "applied_penalty_bps": LOG_DECIMAL_RE,
+}
+# symbol 级计数成对出现，缺一或畸形视为旧格式，不影响样本本身。
+RUNTIME_EXECUTION_QUALITY_GUARD_SYMBOL_FIELDS = {
+    "symbol_active_count": LOG_INT_RE,
+    "symbol_state_count": LOG_INT_RE,
+}
+RUNTIME_RECONCILE_RUNTIME_FIELDS = {
+    "anomaly_streak": LOG_INT_RE,
+    "healthy_streak": LOG_INT_RE,
+    "anomaly_reduce_only": LOG_BOOL_RE,
+    "anomaly_reduce_only_threshold": LOG_INT_RE,
+    "anomaly_halt_threshold": LOG_INT_RE,
+    "anomaly_resume_threshold": LOG_INT_RE,
+}
 RUNTIME_ENTRY_EDGE_ADJUST_RE = re.compile(
     r"RUNTIME_STATUS:.*?funnel_window=\{[^}]*?"
     r"entry_regime_adjust_avg_bps=(?P<regime_adjust>-?[0-9]+(?:\.[0-9]+)?), "
@@ -278,40 +322,9 @@ RUNTIME_ENTRY_EDGE_ADJUST_RE = re.compile(
     r"(?:, entry_concentration_adjust_avg_bps="
     r"(?P<concentration_adjust>-?[0-9]+(?:\.[0-9]+)?))?"
 )
-RUNTIME_RECONCILE_RUNTIME_RE = re.compile(
-    r"RUNTIME_STATUS:.*?reconcile_runtime=\{[^}]*?"
-    r"anomaly_streak=(?P<anomaly_streak>-?[0-9]+), "
-    r"healthy_streak=(?P<healthy_streak>-?[0-9]+), "
-    r"anomaly_reduce_only=(?P<anomaly_reduce_only>true|false), "
-    r"anomaly_reduce_only_threshold=(?P<anomaly_reduce_only_threshold>-?[0-9]+), "
-    r"anomaly_halt_threshold=(?P<anomaly_halt_threshold>-?[0-9]+), "
-    r"anomaly_resume_threshold=(?P<anomaly_resume_threshold>-?[0-9]+)"
-)
 RUNTIME_REGIME_CURRENT_RE = re.compile(
     r"RUNTIME_STATUS:.*?regime_current=\{[^}]*?bucket=(?P<bucket>[A-Z_]+)"
 )
-RUNTIME_REGIME_CURRENT_DIAGNOSTICS_RE = re.compile(
-    r"RUNTIME_STATUS:.*?regime_current=\{[^}]*?"
-    r"(?:warmup=(?P<warmup>true|false)[^}]*?)?"
-    r"trend_threshold_ratio=(?P<trend_threshold_ratio>[0-9]+(?:\.[0-9]+)?), "
-    r"(?:volatility_threshold_ratio=(?P<volatility_threshold_ratio>[0-9]+(?:\.[0-9]+)?), )?"
-    r"trend_candidate=(?P<trend_candidate>true|false)"
-    r"(?:, warmup_trend_candidate=(?P<warmup_trend_candidate>true|false))?"
-    r"(?:, raw_regime=(?P<raw_regime>[A-Z_]+), "
-    r"raw_bucket=(?P<raw_bucket>[A-Z_]+), "
-    r"pending_regime=(?P<pending_regime>[A-Z_]+), "
-    r"pending_bucket=(?P<pending_bucket>[A-Z_]+), "
-    r"pending_regime_ticks=(?P<pending_regime_ticks>-?\d+), "
-    r"confirm_ticks_required=(?P<confirm_ticks_required>-?\d+), "
-    r"pending_regime_elapsed_ms=(?P<pending_regime_elapsed_ms>-?\d+), "
-    r"confirm_elapsed_ms_required=(?P<confirm_elapsed_ms_required>-?\d+), "
-    r"pending_trend_confirmation=(?P<pending_trend_confirmation>true|false))?"
-)
-RUNTIME_REGIME_WINDOW_CANDIDATE_RE = re.compile(
-    r"RUNTIME_STATUS:.*?regime_window=\{[^}]*?"
-    r"trend_candidate_ticks=(?P<trend_candidate_ticks>[0-9]+)"
-    r"(?:, warmup_trend_candidate_ticks=(?P<warmup_trend_candidate_ticks>[0-9]+))?"
-)
 REGIME_CHANGE_RE = re.compile(
     r"REGIME_CHANGE: symbol=(?P<symbol>[^,]+), "
     r"regime=(?P<regime>[A-Z_]+), bucket=(?P<bucket>[A-Z_]+), "
@@ -344,7 +357,9 @@ RUNTIME_STATUS_BOOT_START_RE = re.compile(
     r"startup_utc=(?P<startup>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z)"
 )
 RUNTIME_STATUS_TS_RE = re.compile(
-    r"(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?RUNTIME_STATUS:"
+    LOG_LINE_PREFIX_PATTERN
+    + r"(?P<ts>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}).*?RUNTIME_STATUS:",
+    re.MULTILINE,
 )
 ACCOUNT_EQUITY_CONTINUITY_RE = re.compile(
     r"ACCOUNT_EQUITY_CONTINUITY: status=(?P<status>[A-Z_]+), "
@@ -361,7 +376,10 @@ ACCOUNT_EQUITY_CONTINUITY_RE = re.compile(
     r"previous_positions_flat=(?P<previous_flat>true|false), "
     r"current_positions_flat=(?P<current_flat>true|false)"
 )
-FEATURES_RE = re.compile(r"FEATURES:\s*(?P<body>.*)")
+FEATURES_RE = re.compile(r"FEATURES:[ \t]*(?P<body>.*)")
+# 值用前瞻捕获、不消费，嵌套在值里的 key=value（如 meta={side=Sell}）也能被扫到。
+LOG_FIELD_RE = re.compile(r"\b(\w+)=(?=([^,\s}]+))")
+LOG_FIELD_VALUE_RE = re.compile(r"[^,\s}]+")
 FEATURE_VALUE_RE = re.compile(
     r"(?P<name>[A-Za-z_][A-Za-z0-9_]*)="
     r"(?P<value>-?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?|nan|inf|-inf)"
@@ -519,10 +537,128 @@ def load_text(path: Path) -> str:
         return path.read_text(encoding="utf-8", errors="replace")
 
 
+COUNT_LITERAL_CHARS = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_:=,- "
+)
+
+
+@functools.lru_cache(maxsize=None)
+def count_literal_prefix(pattern: str) -> str:
+    # 取 pattern 开头必然出现的字面量，用于在跑正则前先做 `in` 预筛。
+    # 含顶层或分组 "|" 的 pattern 无法保证字面前缀，直接放弃预筛。
+    if "|" in pattern:
+        return ""
+    end = 0
+    while end < len(pattern) and pattern[end] in COUNT_LITERAL_CHARS:
+        end += 1
+    # 紧跟量词时最后一个字符可选，不能算入必现前缀。
+    if end < len(pattern) and pattern[end] in "?*{":
+        end -= 1
+    return pattern[:max(end, 0)]
+
+
 def count(pattern: str, text: str) -> int:
+    # 大多数事件在一份日志里根本不出现，先用 `in` 排除，省掉整段正则扫描。
+    literal = count_literal_prefix(pattern)
+    if literal and literal not in text:
+        return 0
     return len(re.findall(pattern, text, flags=re.MULTILINE))
 
 
+def count_word(word: str, text: str) -> int:
+    # 统计整词出现次数，结果与 count(r"\b<word>\b", text) 一致。
+    # 前导 \b 会让 re 放弃字面前缀的快速扫描，整段日志逐字符回溯；
+    # 改为按 "<word>\b" 扫描，再在 Python 侧校验左边界。
+    if word not in text:
+        return 0
+    total = 0
+    for match in re.finditer(re.escape(word) + r"\b", text):
+        start = match.start()
+        if start == 0:
+            total += 1
+            continue
+        prev = text[start - 1]
+        if not (prev.isalnum() or prev == "_"):
+            total += 1
+    return total
+
+
+def iter_log_lines(text: str) -> Iterator[str]:
+    # 逐行惰性切片，替代 splitlines() 一次性建整张行列表；行边界只认 "\n"，
+    # 行尾 "\r" 去掉以保持 CRLF 日志与 splitlines() 结果一致。
+    pos = 0
+    text_len = len(text)
+    while pos < text_len:
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            line_end = text_len
+        line = text[pos:line_end]
+        if line.endswith("\r"):
+            line = line[:-1]
+        yield line
+        pos = line_end + 1
+
+
+def iter_lines_containing(text: str, marker: str) -> Iterator[str]:
+    # 按 marker 用 str.find 直接跳到命中行，不必 splitlines() 整段切分再逐行 `in`。
+    # 行边界只认 "\n"（与日志写出一致），同一行多次命中只产出一次。
+    pos = text.find(marker)
+    while pos != -1:
+        line_start = text.rfind("\n", 0, pos) + 1
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            yield text[line_start:]
+            return
+        yield text[line_start:line_end]
+        pos = text.find(marker, line_end + 1)
+
+
+def parse_log_kv_block(raw: str) -> Dict[str, str]:
+    out: Dict[str, str] = {}
+    for item in raw.split(","):
+        token = item.strip()
+        if not token or "=" not in token:
+            continue
+        key, value = token.split("=", 1)
+        out[key.strip()] = value.strip()
+    return out
+
+
+def runtime_block_matches(
+    fields: Dict[str, str], grammar: Dict[str, re.Pattern[str]]
+) -> bool:
+    for key, pattern in grammar.items():
+        value = fields.get(key)
+        if value is None or pattern.fullmatch(value) is None:
+            return False
+    return True
+
+
+def finditer_runtime_block(
+    pattern: re.Pattern[str], text: str, marker: str
+) -> Iterator[re.Match[str]]:
+    # 子块正则以 "RUNTIME_STATUS:.*?<block>={" 开头；日志里根本没有该子块时，
+    # finditer 会在每条 RUNTIME_STATUS 行上懒惰扫到行尾才失败，先整段 `in` 排除。
+    if marker not in text:
+        return iter(())
+    return pattern.finditer(text)
+
+
+def iter_runtime_status_blocks(text: str, block: str) -> Iterator[Dict[str, str]]:
+    # RUNTIME_STATUS 子块（如 regime_current={...}）是定长 key=value 列表，
+    # 用 find + split 切出字段，替代带大量可选命名组的整行正则回溯。
+    opener = block + "={"
+    for line in iter_lines_containing(text, "RUNTIME_STATUS:"):
+        start = line.find(opener, line.find("RUNTIME_STATUS:"))
+        if start == -1:
+            continue
+        start += len(opener)
+        end = line.find("}", start)
+        if end == -1:
+            continue
+        yield parse_log_kv_block(line[start:end])
+
+
 def max_tick(text: str) -> int:
     matches = re.findall(r"RUNTIME_STATUS:\s*ticks=(\d+)", text)
     if not matches:
@@ -580,9 +716,7 @@ def extract_integrator_runtime_identity_events(text: str) -> List[Dict[str, str]
 
 def extract_integrator_feature_contract_events(text: str) -> List[Dict[str, Any]]:
     events: List[Dict[str, Any]] = []
-    for line in text.splitlines():
-        if "INTEGRATOR_INIT:" not in line:
-            continue
+    for line in iter_lines_containing(text, "INTEGRATOR_INIT:"):
         training_symbol = extract_log_field(line, "training_symbol")
         bar_interval = extract_float_log_field(line, "bar_interval_ms")
         feature_samples = extract_float_log_field(line, "feature_samples")
@@ -599,15 +733,34 @@ def extract_integrator_feature_contract_events(text: str) -> List[Dict[str, Any]
 
 
 def extract_log_field(line: str, key: str) -> Optional[str]:
-    match = re.search(rf"\b{re.escape(key)}=([^,\s}}]+)", line)
-    if not match:
-        return None
-    value = match.group(1).strip()
-    return value if value else None
+    # 字段名是纯字面量：str.find 定位 "key="，手工校验词边界后只对值做一次锚定 match，
+    # 比逐 key 编译的 `\bkey=` search 少走整行 SRE 扫描。
+    needle = key + "="
+    pos = line.find(needle)
+    while pos != -1:
+        prev = line[pos - 1] if pos > 0 else ""
+        if not (prev.isalnum() or prev == "_"):
+            match = LOG_FIELD_VALUE_RE.match(line, pos + len(needle))
+            if match:
+                return match.group(0)
+        pos = line.find(needle, pos + 1)
+    return None
 
 
 def extract_float_log_field(line: str, key: str) -> Optional[float]:
-    raw_value = extract_log_field(line, key)
+    return parse_float_field(extract_log_field(line, key))
+
+
+def parse_log_fields(line: str) -> Dict[str, str]:
+    # 同一行需要取多个字段时一次 findall 拿全，不再按字段各扫一遍整行。
+    # 同名字段保留首次出现，与 extract_log_field 一致。
+    fields: Dict[str, str] = {}
+    for key, value in LOG_FIELD_RE.findall(line):
+        fields.setdefault(key, value)
+    return fields
+
+
+def parse_float_field(raw_value: Optional[str]) -> Optional[float]:
     if raw_value is None:
         return None
     try:
@@ -677,14 +830,14 @@ def normalize_counter_key(key: Optional[str]) -> str:
     return normalized or "UNKNOWN"
 
 
-def extract_fill_direction(line: str) -> int:
-    raw_direction = extract_float_log_field(line, "direction")
+def extract_fill_direction(fields: Dict[str, str]) -> int:
+    raw_direction = parse_float_field(fields.get("direction"))
     if raw_direction is not None:
         if raw_direction > 0:
             return 1
         if raw_direction < 0:
             return -1
-    side = str(extract_log_field(line, "side") or "").strip().lower()
+    side = str(fields.get("side") or "").strip().lower()
     if side == "buy":
         return 1
     if side == "sell":
@@ -796,7 +949,7 @@ def extract_execution_attribution(text: str) -> Dict[str, object]:
     probe_fill_ids: set[str] = set()
     position_state: Dict[str, Dict[str, float]] = {}
 
-    for line in text.splitlines():
+    for line in iter_lines_containing(text, "TREND_CANDIDATE_PROBE_"):
         if (
             "TREND_CANDIDATE_PROBE_SIGNAL:" in line
             or "TREND_CANDIDATE_PROBE_ENQUEUED:" in line
@@ -856,7 +1009,7 @@ def extract_execution_attribution(text: str) -> Dict[str, object]:
     assert isinstance(orders, dict)
     assert isinstance(runtime_fill_windows, dict)
 
-    for line in text.splitlines():
+    for line in iter_log_lines(text):
         if "BYBIT_SUBMIT:" in line:
             submit["total"] = int(submit.get("total", 0)) + 1
             for field_name, counter_name in (
@@ -883,14 +1036,15 @@ def extract_execution_attribution(text: str) -> Dict[str, object]:
                 bump_counter(counter, extract_log_field(line, "symbol"))
 
         if "FILL_APPLIED:" in line:
-            symbol = extract_log_field(line, "symbol")
-            liquidity = extract_log_field(line, "liquidity")
-            fill_id = extract_log_field(line, "fill_id")
-            client_order_id = extract_log_field(line, "client_order_id")
-            fee_usd = extract_float_log_field(line, "fee") or 0.0
-            qty = extract_float_log_field(line, "qty") or 0.0
-            price = extract_float_log_field(line, "price") or 0.0
-            notional_abs_usd = extract_float_log_field(line, "notional_abs_usd")
+            fill_fields = parse_log_fields(line)
+            symbol = fill_fields.get("symbol")
+            liquidity = fill_fields.get("liquidity")
+            fill_id = fill_fields.get("fill_id")
+            client_order_id = fill_fields.get("client_order_id")
+            fee_usd = parse_float_field(fill_fields.get("fee")) or 0.0
+            qty = parse_float_field(fill_fields.get("qty")) or 0.0
+            price = parse_float_field(fill_fields.get("price")) or 0.0
+            notional_abs_usd = parse_float_field(fill_fields.get("notional_abs_usd"))
             if notional_abs_usd is None:
                 if qty > 0.0 and price > 0.0:
                     notional_abs_usd = abs(qty * price)
@@ -934,7 +1088,7 @@ def extract_execution_attribution(text: str) -> Dict[str, object]:
                     quality_by_symbol,
                     position_state,
                     symbol=symbol,
-                    direction=extract_fill_direction(line),
+                    direction=extract_fill_direction(fill_fields),
                     qty=qty,
                     price=price,
                     fee_usd=fee_usd,
@@ -967,7 +1121,7 @@ def extract_execution_attribution(text: str) -> Dict[str, object]:
 def extract_replay_terminal_settlement(text: str) -> Dict[str, object]:
     done_events: List[Dict[str, float]] = []
     failed_reasons: List[str] = []
-    for line in text.splitlines():
+    for line in iter_lines_containing(text, "REPLAY_TERMINAL_SETTLEMENT_"):
         if "REPLAY_TERMINAL_SETTLEMENT_DONE:" in line:
             realized_net_usd = extract_float_log_field(line, "realized_net_usd")
             fees_usd = extract_float_log_field(line, "fees_usd")
@@ -1029,9 +1183,7 @@ def extract_exit_capture_samples(text: str) -> Dict[str, object]:
     low_by_symbol: Dict[str, int] = {}
     low_capture_count = 0
 
-    for line in text.splitlines():
-        if "EXIT_CAPTURE_SAMPLE:" not in line:
-            continue
+    for line in iter_lines_containing(text, "EXIT_CAPTURE_SAMPLE:"):
         symbol = normalize_counter_key(extract_log_field(line, "symbol"))
         purpose = normalize_counter_key(extract_log_field(line, "purpose"))
         path_mfe_bps = float(extract_float_log_field(line, "path_mfe_bps") or 0.0)
@@ -1153,7 +1305,7 @@ def extract_runtime_notional_samples(text: str) -> list[tuple[dt.datetime, float
 def filter_log_since(text: str, cutoff_ts: dt.datetime) -> str:
     lines_out: list[str] = []
     include_line = False
-    for raw_line in text.splitlines():
+    for raw_line in iter_log_lines(text):
         ts_match = LOG_LINE_TS_RE.search(raw_line)
         if ts_match:
             try:
@@ -1469,7 +1621,9 @@ def extract_strategy_mix_series(text: str) -> Dict[str, float]:
     sample_values: list[int] = []
     policy_flat_values: list[int] = []
 
-    for m in RUNTIME_STRATEGY_MIX_RE.finditer(text):
+    for m in finditer_runtime_block(
+        RUNTIME_STRATEGY_MIX_RE, text, "strategy_mix={"
+    ):
         try:
             latest_trend_values.append(float(m.group("latest_trend")))
             latest_defensive_values.append(float(m.group("latest_defensive")))
@@ -1525,7 +1679,9 @@ def extract_strategy_mix_series(text: str) -> Dict[str, float]:
 
 def extract_regime_current_counts(text: str) -> Dict[str, int]:
     counts = {"TREND": 0, "RANGE": 0, "EXTREME": 0}
-    for m in RUNTIME_REGIME_CURRENT_RE.finditer(text):
+    for m in finditer_runtime_block(
+        RUNTIME_REGIME_CURRENT_RE, text, "regime_current={"
+    ):
         bucket = str(m.group("bucket") or "").upper()
         if bucket in counts:
             counts[bucket] += 1
@@ -1545,58 +1701,52 @@ def extract_regime_runtime_diagnostics(text: str) -> Dict[str, Any]:
     window_candidate_count = 0
     window_warmup_candidate_count = 0
 
-    for match in RUNTIME_REGIME_CURRENT_DIAGNOSTICS_RE.finditer(text):
-        try:
-            trend_ratio = float(match.group("trend_threshold_ratio"))
-            trend_threshold_ratios.append(trend_ratio)
-            if match.group("volatility_threshold_ratio") is not None:
-                volatility_threshold_ratios.append(
-                    float(match.group("volatility_threshold_ratio"))
-                )
-        except ValueError:
+    for fields in iter_runtime_status_blocks(text, "regime_current"):
+        if not runtime_block_matches(fields, RUNTIME_REGIME_CURRENT_FIELDS):
             continue
-        if str(match.group("trend_candidate")).lower() == "true":
+        volatility_ratio_raw = fields.get("volatility_threshold_ratio")
+        if (
+            volatility_ratio_raw is not None
+            and LOG_UDECIMAL_RE.fullmatch(volatility_ratio_raw) is None
+        ):
+            continue
+        trend_ratio = float(fields["trend_threshold_ratio"])
+        trend_threshold_ratios.append(trend_ratio)
+        if volatility_ratio_raw is not None:
+            volatility_threshold_ratios.append(float(volatility_ratio_raw))
+        if fields["trend_candidate"] == "true":
             current_candidate_count += 1
-        warmup_candidate = (
-            str(match.group("warmup_trend_candidate") or "").lower() == "true"
-        )
+        warmup_candidate = fields.get("warmup_trend_candidate") == "true"
         if not warmup_candidate:
             warmup_candidate = (
-                str(match.group("warmup") or "").lower() == "true"
+                fields.get("warmup") == "true"
                 and trend_ratio >= TREND_CANDIDATE_MIN_THRESHOLD_RATIO
             )
         if warmup_candidate:
             current_warmup_candidate_count += 1
         if (
-            str(match.group("pending_trend_confirmation") or "").lower()
-            == "true"
+            runtime_block_matches(fields, RUNTIME_REGIME_PENDING_FIELDS)
+            and fields["pending_trend_confirmation"] == "true"
         ):
             current_pending_trend_confirmation_count += 1
-            try:
-                pending_trend_ticks.append(int(match.group("pending_regime_ticks")))
-                confirm_ticks_required_values.append(
-                    int(match.group("confirm_ticks_required"))
-                )
-                pending_trend_elapsed_ms.append(
-                    int(match.group("pending_regime_elapsed_ms"))
-                )
-                confirm_elapsed_required_values.append(
-                    int(match.group("confirm_elapsed_ms_required"))
-                )
-            except (TypeError, ValueError):
-                pass
+            pending_trend_ticks.append(int(fields["pending_regime_ticks"]))
+            confirm_ticks_required_values.append(
+                int(fields["confirm_ticks_required"])
+            )
+            pending_trend_elapsed_ms.append(int(fields["pending_regime_elapsed_ms"]))
+            confirm_elapsed_required_values.append(
+                int(fields["confirm_elapsed_ms_required"])
+            )
 
-    for match in RUNTIME_REGIME_WINDOW_CANDIDATE_RE.finditer(text):
-        try:
-            if int(match.group("trend_candidate_ticks")) > 0:
-                window_candidate_count += 1
-            if (
-                match.group("warmup_trend_candidate_ticks") is not None
-                and int(match.group("warmup_trend_candidate_ticks")) > 0
-            ):
-                window_warmup_candidate_count += 1
-        except ValueError:
+    for fields in iter_runtime_status_blocks(text, "regime_window"):
+        candidate_ticks = fields.get("trend_candidate_ticks")
+        if candidate_ticks is None or LOG_UINT_RE.fullmatch(candidate_ticks) is None:
             continue
+        if int(candidate_ticks) > 0:
+            window_candidate_count += 1
+        warmup_ticks = fields.get("warmup_trend_candidate_ticks", "0")
+        if LOG_UINT_RE.fullmatch(warmup_ticks) is not None and int(warmup_ticks) > 0:
+            window_warmup_candidate_count += 1
 
     if not trend_threshold_ratios:
         return {
@@ -1862,16 +2012,6 @@ def extract_regime_change_series(text: str) -> Dict[str, Any]:
 
 
 def extract_execution_window_series(text: str) -> Dict[str, float]:
-    def parse_kv_map(raw: str) -> Dict[str, str]:
-        out: Dict[str, str] = {}
-        for item in raw.split(","):
-            token = item.strip()
-            if not token or "=" not in token:
-                continue
-            key, value = token.split("=", 1)
-            out[key.strip()] = value.strip()
-        return out
-
     def map_float(raw_map: Dict[str, str], key: str, default: float = 0.0) -> float:
         raw = raw_map.get(key)
         if raw is None or raw == "":
@@ -1908,8 +2048,10 @@ def extract_execution_window_series(text: str) -> Dict[str, float]:
     maker_fill_ratios: list[float] = []
     liquidity_source_runtime_count = 0
 
-    for m in RUNTIME_EXECUTION_WINDOW_RE.finditer(text):
-        values = parse_kv_map(m.group("body"))
+    for m in finditer_runtime_block(
+        RUNTIME_EXECUTION_WINDOW_RE, text, "execution_window={"
+    ):
+        values = parse_log_kv_block(m.group("body"))
         if "filtered_cost_ratio" not in values:
             continue
         filtered_cost_ratios.append(map_float(values, "filtered_cost_ratio", 0.0))
@@ -2083,20 +2225,20 @@ def extract_execution_quality_guard_series(text: str) -> Dict[str, float]:
     symbol_active_counts: list[int] = []
     symbol_state_counts: list[int] = []
 
-    for m in RUNTIME_EXECUTION_QUALITY_GUARD_RE.finditer(text):
-        active_flags.append(1.0 if m.group("active") == "true" else 0.0)
-        enabled_flags.append(1.0 if m.group("enabled") == "true" else 0.0)
-        try:
-            applied_penalty_bps.append(float(m.group("applied_penalty_bps")))
-            bad_streaks.append(int(m.group("bad_streak")))
-            good_streaks.append(int(m.group("good_streak")))
-            no_fill_windows.append(int(m.group("no_fill_windows")))
-            if m.group("symbol_active_count") is not None:
-                symbol_active_counts.append(int(m.group("symbol_active_count")))
-            if m.group("symbol_state_count") is not None:
-                symbol_state_counts.append(int(m.group("symbol_state_count")))
-        except ValueError:
+    for fields in iter_runtime_status_blocks(text, "execution_quality_guard"):
+        if not runtime_block_matches(fields, RUNTIME_EXECUTION_QUALITY_GUARD_FIELDS):
             continue
+        active_flags.append(1.0 if fields["active"] == "true" else 0.0)
+        enabled_flags.append(1.0 if fields["enabled"] == "true" else 0.0)
+        applied_penalty_bps.append(float(fields["applied_penalty_bps"]))
+        bad_streaks.append(int(fields["bad_streak"]))
+        good_streaks.append(int(fields["good_streak"]))
+        no_fill_windows.append(int(fields["no_fill_windows"]))
+        if runtime_block_matches(
+            fields, RUNTIME_EXECUTION_QUALITY_GUARD_SYMBOL_FIELDS
+        ):
+            symbol_active_counts.append(int(fields["symbol_active_count"]))
+            symbol_state_counts.append(int(fields["symbol_state_count"]))
 
     runtime_count = len(active_flags)
     if runtime_count <= 0:
@@ -2145,7 +2287,9 @@ def extract_entry_gate_series(text: str) -> Dict[str, float]:
     observed_near_miss_ratio_values: list[float] = []
     observed_near_miss_allowed_ratio_values: list[float] = []
 
-    for m in RUNTIME_ENTRY_GATE_RE.finditer(text):
+    for m in finditer_runtime_block(
+        RUNTIME_ENTRY_GATE_RE, text, "entry_gate={"
+    ):
         try:
             near_miss_tolerance_values.append(
                 float(m.group("near_miss_tolerance_bps"))
@@ -2195,14 +2339,13 @@ def extract_concentration_series(text: str) -> Dict[str, float]:
     top1_abs_notional_values: list[float] = []
     gross_notional_values: list[float] = []
 
-    for m in RUNTIME_CONCENTRATION_RE.finditer(text):
-        try:
-            top1_share_values.append(float(m.group("top1_share")))
-            symbol_count_values.append(int(m.group("symbol_count")))
-            top1_abs_notional_values.append(float(m.group("top1_abs_notional_usd")))
-            gross_notional_values.append(float(m.group("gross_notional_usd")))
-        except ValueError:
+    for fields in iter_runtime_status_blocks(text, "concentration"):
+        if not runtime_block_matches(fields, RUNTIME_CONCENTRATION_FIELDS):
             continue
+        top1_share_values.append(float(fields["top1_share"]))
+        symbol_count_values.append(int(fields["symbol_count"]))
+        top1_abs_notional_values.append(float(fields["top1_abs_notional_usd"]))
+        gross_notional_values.append(float(fields["gross_notional_usd"]))
 
     runtime_count = len(top1_share_values)
     if runtime_count <= 0:
@@ -2235,7 +2378,9 @@ def extract_entry_edge_adjust_series(text: str) -> Dict[str, float]:
     liquidity_adjust_values: list[float] = []
     concentration_adjust_values: list[float] = []
 
-    for m in RUNTIME_ENTRY_EDGE_ADJUST_RE.finditer(text):
+    for m in finditer_runtime_block(
+        RUNTIME_ENTRY_EDGE_ADJUST_RE, text, "entry_regime_adjust_avg_bps="
+    ):
         try:
             regime_adjust_values.append(float(m.group("regime_adjust")))
             volatility_adjust_values.append(float(m.group("volatility_adjust")))
@@ -2269,14 +2414,13 @@ def extract_reconcile_runtime_series(text: str) -> Dict[str, float]:
     anomaly_streaks: list[int] = []
     reduce_only_flags: list[float] = []
 
-    for m in RUNTIME_RECONCILE_RUNTIME_RE.finditer(text):
+    for fields in iter_runtime_status_blocks(text, "reconcile_runtime"):
+        if not runtime_block_matches(fields, RUNTIME_RECONCILE_RUNTIME_FIELDS):
+            continue
         reduce_only_flags.append(
-            1.0 if m.group("anomaly_reduce_only") == "true" else 0.0
+            1.0 if fields["anomaly_reduce_only"] == "true" else 0.0
         )
-        try:
-            anomaly_streaks.append(int(m.group("anomaly_streak")))
-        except ValueError:
-            continue
+        anomaly_streaks.append(int(fields["anomaly_streak"]))
 
     runtime_count = len(reduce_only_flags)
     if runtime_count <= 0:
@@ -2318,76 +2462,73 @@ def extract_feature_scale_diagnostics(text: str) -> Dict[str, object]:
     sanitized_by_symbol: Dict[str, int] = {}
     sanitized_examples: List[Dict[str, object]] = []
 
-    for line in text.splitlines():
-        if "INTEGRATOR_FEATURE_SANITIZED:" in line:
-            sanitized_count += 1
-            fields = {
-                item.group("name"): item.group("value")
-                for item in INTEGRATOR_NAN_SKIP_FIELD_RE.finditer(line)
+    for line in iter_lines_containing(text, "INTEGRATOR_FEATURE_SANITIZED:"):
+        sanitized_count += 1
+        fields = {
+            item.group("name"): item.group("value")
+            for item in INTEGRATOR_NAN_SKIP_FIELD_RE.finditer(line)
+        }
+        feature_name = fields.get("feature_name", "unknown")
+        symbol = fields.get("symbol", "unknown")
+        sanitized_by_feature[feature_name] = (
+            int(sanitized_by_feature.get(feature_name, 0)) + 1
+        )
+        sanitized_by_symbol[symbol] = int(sanitized_by_symbol.get(symbol, 0)) + 1
+        if len(sanitized_examples) < 5:
+            example: Dict[str, object] = {
+                "feature_name": feature_name,
+                "symbol": symbol,
             }
-            feature_name = fields.get("feature_name", "unknown")
-            symbol = fields.get("symbol", "unknown")
-            sanitized_by_feature[feature_name] = (
-                int(sanitized_by_feature.get(feature_name, 0)) + 1
-            )
-            sanitized_by_symbol[symbol] = int(sanitized_by_symbol.get(symbol, 0)) + 1
-            if len(sanitized_examples) < 5:
-                example: Dict[str, object] = {
-                    "feature_name": feature_name,
-                    "symbol": symbol,
-                }
-                for key in (
-                    "feature_index",
-                    "raw_value",
-                    "sanitized_value",
-                    "regime",
-                    "bucket",
-                    "raw_regime",
-                    "raw_bucket",
-                    "model_version",
-                    "sanitize_count",
-                ):
-                    if key in fields:
-                        example[key] = fields[key]
-                sanitized_examples.append(example)
-
-        if "INTEGRATOR_SKIP: NaN feature detected" in line:
-            nan_skip_count += 1
-            fields = {
-                item.group("name"): item.group("value")
-                for item in INTEGRATOR_NAN_SKIP_FIELD_RE.finditer(line)
+            for key in (
+                "feature_index",
+                "raw_value",
+                "sanitized_value",
+                "regime",
+                "bucket",
+                "raw_regime",
+                "raw_bucket",
+                "model_version",
+                "sanitize_count",
+            ):
+                if key in fields:
+                    example[key] = fields[key]
+            sanitized_examples.append(example)
+
+    for line in iter_lines_containing(text, "INTEGRATOR_SKIP: NaN feature detected"):
+        nan_skip_count += 1
+        fields = {
+            item.group("name"): item.group("value")
+            for item in INTEGRATOR_NAN_SKIP_FIELD_RE.finditer(line)
+        }
+        if "feature_name" not in fields or "feature_index" not in fields:
+            legacy = INTEGRATOR_NAN_SKIP_LEGACY_RE.search(line)
+            if legacy:
+                fields.setdefault("feature_index", legacy.group("feature_index"))
+                fields.setdefault("feature_name", legacy.group("feature_name"))
+        feature_name = fields.get("feature_name", "unknown")
+        symbol = fields.get("symbol", "unknown")
+        nan_skip_by_feature[feature_name] = int(nan_skip_by_feature.get(feature_name, 0)) + 1
+        nan_skip_by_symbol[symbol] = int(nan_skip_by_symbol.get(symbol, 0)) + 1
+        if len(nan_skip_examples) < 5:
+            example: Dict[str, object] = {
+                "feature_name": feature_name,
+                "symbol": symbol,
             }
-            if "feature_name" not in fields or "feature_index" not in fields:
-                legacy = INTEGRATOR_NAN_SKIP_LEGACY_RE.search(line)
-                if legacy:
-                    fields.setdefault("feature_index", legacy.group("feature_index"))
-                    fields.setdefault("feature_name", legacy.group("feature_name"))
-            feature_name = fields.get("feature_name", "unknown")
-            symbol = fields.get("symbol", "unknown")
-            nan_skip_by_feature[feature_name] = int(nan_skip_by_feature.get(feature_name, 0)) + 1
-            nan_skip_by_symbol[symbol] = int(nan_skip_by_symbol.get(symbol, 0)) + 1
-            if len(nan_skip_examples) < 5:
-                example: Dict[str, object] = {
-                    "feature_name": feature_name,
-                    "symbol": symbol,
-                }
-                for key in (
-                    "feature_index",
-                    "raw_value",
-                    "regime",
-                    "bucket",
-                    "raw_regime",
-                    "raw_bucket",
-                    "model_version",
-                    "skip_count",
-                ):
-                    if key in fields:
-                        example[key] = fields[key]
-                nan_skip_examples.append(example)
+            for key in (
+                "feature_index",
+                "raw_value",
+                "regime",
+                "bucket",
+                "raw_regime",
+                "raw_bucket",
+                "model_version",
+                "skip_count",
+            ):
+                if key in fields:
+                    example[key] = fields[key]
+            nan_skip_examples.append(example)
 
-        match = FEATURES_RE.search(line)
-        if not match:
-            continue
+    for match in FEATURES_RE.finditer(text):
         feature_line_count += 1
         line_has_large = False
         for item in FEATURE_VALUE_RE.finditer(match.group("body")):
@@ -2520,11 +2661,14 @@ def assess(
         regime_change,
     ) = extract_views(text)
 
-    if flat_start_rebased:
+    # rebase 后仍有有效策略信号窗口时无需回退，也就不必再扫一遍完整原文。
+    if (
+        flat_start_rebased
+        and int(strategy_mix.get("nonzero_window_count", 0.0)) <= 0
+    ):
         original_strategy_mix = extract_strategy_mix_series(original_text)
-        rebased_nonzero = int(strategy_mix.get("nonzero_window_count", 0.0))
         original_nonzero = int(original_strategy_mix.get("nonzero_window_count", 0.0))
-        if rebased_nonzero <= 0 and original_nonzero > 0:
+        if original_nonzero > 0:
             text = original_text
             flat_start_rebased = False
             flat_start_rebase_cutoff_utc = None
@@ -2692,8 +2836,8 @@ def assess(
     metrics = {
         "runtime_status_count": count(r"RUNTIME_STATUS:", text),
         "max_runtime_tick": max_tick(text),
-        "critical_count": count(r"\bCRITICAL\b", text),
-        "trading_halted_event_count": count(r"\bTRADING_HALTED\b", text),
+        "critical_count": count_word("CRITICAL", text),
+        "trading_halted_event_count": count_word("TRADING_HALTED", text),
         "trade_ok_false_count": count(r"RUNTIME_STATUS:.*trade_ok=false", text),
         "adapter_trade_not_ok_count": count(
             r"RUNTIME_STATUS:.*trade_health=\{[^}]*adapter_trade_ok=false",
@@ -2733,7 +2877,7 @@ def assess(
         "ws_unhealthy_count": count(
             r"RUNTIME_STATUS:.*(?:public_ws_healthy=false|private_ws_healthy=false)", text
         ),
-        "ws_degraded_count": count(r"\bDEGRADED\b", text),
+        "ws_degraded_count": count_word("DEGRADED", text),
         "gate_check_passed_count": count(r"GATE_CHECK_PASSED", text),
         "gate_policy_flat_pass_count": count(
             r"GATE_CHECK_PASSED:.*policy_flat=true", text
@@ -20,6 +20,7 @@ import argparse
 import ast
 import csv
 import datetime as dt
+import gc
 import hashlib
 import json
 import math
@@ -37,9 +38,13 @@ except ImportError:  # pragma: no cover
     np = None  # type: ignore[assignment]
 
 try:
-    from catboost import CatBoostClassifier
+    from catboost import CatBoostClassifier, Pool
 except ImportError:  # pragma: no cover
     CatBoostClassifier = None
+    Pool = None
+
+# walk-forward 每训练若干切分主动回收一次，避免 CatBoost 模型与预测数组滞留抬高峰值 RSS。
+SPLIT_GC_INTERVAL = 8
 
 
 def log_info(message: str) -> None:
@@ -1462,7 +1467,10 @@ def build_catboost_classifier(
     random_strength: float,
     subsample: float,
     rsm: float,
+    boosting_type: str = "Plain",
 ) -> CatBoostClassifier:
+    # boosting_type 由 --boosting_type 选择（默认 Plain，Ordered 更慢），切分/对照/调参/最终模型
+    # 统一使用同一取值；bootstrap_type 固定为 Bernoulli 以便 subsample 生效。
     return CatBoostClassifier(
         loss_function="Logloss",
         eval_metric="AUC",
@@ -1472,6 +1480,7 @@ def build_catboost_classifier(
         learning_rate=learning_rate,
         l2_leaf_reg=l2_leaf_reg,
         random_strength=random_strength,
+        boosting_type=boosting_type,
         bootstrap_type="Bernoulli",
         subsample=subsample,
         rsm=rsm,
@@ -1480,6 +1489,41 @@ def build_catboost_classifier(
     )
 
 
+def load_or_build_quantized_pool(
+    x: np.ndarray,
+    y: np.ndarray,
+    *,
+    cache_dir: pathlib.Path,
+    schema_hash: str,
+) -> Tuple[Pool, str]:
+    """按 schema_hash + 训练矩阵内容复用已量化的 Pool，跳过重复的边界计算。
+
+    每个不同的训练矩阵都会留下一个 Pool 文件，这里不做淘汰；缓存目录会随运行次数
+    无限增长，需要按需手工清理（删除任意文件只会导致下次重新量化）。
+    """
+    x_contiguous = np.ascontiguousarray(x, dtype=np.float64)
+    y_contiguous = np.ascontiguousarray(y, dtype=np.float64)
+    digest = hashlib.sha256()
+    digest.update(schema_hash.encode("utf-8"))
+    digest.update(repr(x_contiguous.shape).encode("utf-8"))
+    digest.update(x_contiguous.tobytes())
+    digest.update(y_contiguous.tobytes())
+    pool_path = cache_dir / f"integrator_pool_{schema_hash}_{digest.hexdigest()[:16]}.bin"
+    if pool_path.exists():
+        return Pool(f"quantized://{pool_path}"), "hit"
+    pool = Pool(x_contiguous, label=y_contiguous)
+    pool.quantize()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # 临时文件名带 pid：多个训练进程共享缓存目录时不会互相覆盖写到一半的 Pool。
+    tmp_path = pool_path.with_name(f".{pool_path.name}.tmp-{os.getpid()}")
+    try:
+        pool.save(str(tmp_path))
+        os.replace(tmp_path, pool_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return pool, "miss"
+
+
 def run_random_label_control_trials(
     *,
     x_train: np.ndarray,
@@ -1495,6 +1539,7 @@ def run_random_label_control_trials(
     subsample: float,
     rsm: float,
     trials: int,
+    boosting_type: str = "Plain",
 ) -> List[float]:
     auc_values: List[float] = []
     if trials <= 0:
@@ -1512,6 +1557,7 @@ def run_random_label_control_trials(
             random_strength=max(1.0, random_strength),
             subsample=subsample,
             rsm=rsm,
+            boosting_type=boosting_type,
         )
         control_model.fit(x_train, shuffled_y)
         control_score = control_model.predict_proba(x_test)[:, 1]
@@ -1723,6 +1769,12 @@ def main() -> int:
         default=0.80,
         help="CatBoost 列采样比例 (0,1]",
     )
+    parser.add_argument(
+        "--boosting_type",
+        choices=["Plain", "Ordered"],
+        default="Plain",
+        help="CatBoost boosting 模式（Plain 更快；Ordered 可用于最终模型质量优先场景）",
+    )
     parser.add_argument(
         "--validation_fraction",
         type=float,
@@ -1879,6 +1931,11 @@ def main() -> int:
         default=0.0,
         help="特征稳健裁剪分位数；0 表示关闭，0.001 表示按 0.1%%/99.9%% 裁剪",
     )
+    parser.add_argument(
+        "--quantized_pool_cache_dir",
+        default="",
+        help="最终模型量化 Pool 缓存目录；为空表示关闭（同 schema 与训练矩阵的重复运行复用量化结果；不自动淘汰，需手工清理）",
+    )
     parser.add_argument(
         "--fail_on_governance",
         action="store_true",
@@ -2209,6 +2266,7 @@ def main() -> int:
             random_strength=float(args.random_strength),
             subsample=float(args.subsample),
             rsm=float(args.rsm),
+            boosting_type=str(args.boosting_type),
         )
         fit_kwargs = {}
         validation_auc = float("nan")
@@ -2338,6 +2396,11 @@ def main() -> int:
             f"auc={auc:.6f}, baseline_auc={base_auc:.6f}, "
             f"mean_net_edge_bps={split_mean_net:.6f}"
         )
+        # 只保留下游需要的标量指标；first_trained_split 仍持有对照试验所需的首个切分矩阵。
+        del model, train_score, score, economic_score, baseline_score
+        del X_fit_raw, X_val_raw, X_fit, X_val, X_test, X_economic_test
+        if trained_split_count % SPLIT_GC_INTERVAL == 0:
+            gc.collect()
 
     if trained_split_count == 0:
         raise ValueError(
@@ -2374,6 +2437,7 @@ def main() -> int:
             random_strength=float(args.random_strength),
             subsample=float(args.subsample),
             rsm=float(args.rsm),
+            boosting_type=str(args.boosting_type),
             trials=int(args.random_label_trials),
         )
         random_label_auc_mean = mean_ignore_nan(random_label_auc_values)
@@ -2455,6 +2519,7 @@ def main() -> int:
             random_strength=float(args.random_strength),
             subsample=float(args.subsample),
             rsm=float(args.rsm),
+            boosting_type=str(args.boosting_type),
         )
         tune_model.fit(
             X_final_fit,
@@ -2475,8 +2540,26 @@ def main() -> int:
         random_strength=float(args.random_strength),
         subsample=float(args.subsample),
         rsm=float(args.rsm),
+        boosting_type=str(args.boosting_type),
     )
-    final_model.fit(X, y)
+    schema_seed = "feature_transform=clip_plus_robust_norm_v2|" + "|".join(feature_names)
+    schema_hash = hashlib.sha256(schema_seed.encode("utf-8")).hexdigest()[:16]
+    quantized_pool_cache = "disabled"
+    pool_cache_dir_text = str(args.quantized_pool_cache_dir or "").strip()
+    if pool_cache_dir_text:
+        final_pool, quantized_pool_cache = load_or_build_quantized_pool(
+            X,
+            y,
+            cache_dir=pathlib.Path(pool_cache_dir_text),
+            schema_hash=schema_hash,
+        )
+        log_info(
+            "INTEGRATOR_QUANTIZED_POOL: "
+            f"cache={quantized_pool_cache}, dir={pool_cache_dir_text}"
+        )
+        final_model.fit(final_pool)
+    else:
+        final_model.fit(X, y)
 
     importance = final_model.get_feature_importance()
     feature_importance = sorted(
@@ -2492,8 +2575,6 @@ def main() -> int:
         reverse=True,
     )
 
-    schema_seed = "feature_transform=clip_plus_robust_norm_v2|" + "|".join(feature_names)
-    schema_hash = hashlib.sha256(schema_seed.encode("utf-8")).hexdigest()[:16]
     model_hash_seed = (
         f"{schema_hash}|{args.split_method}|{args.predict_horizon_bars}|"
         f"{int(args.execution_latency_bars)}|"
@@ -2765,6 +2846,8 @@ def main() -> int:
             "random_strength": float(args.random_strength),
             "subsample": float(args.subsample),
             "rsm": float(args.rsm),
+            "boosting_type": str(args.boosting_type),
+            "quantized_pool_cache": quantized_pool_cache,
             "validation_fraction": float(args.validation_fraction),
             "min_validation_samples": int(args.min_validation_samples),
             "early_stopping_rounds": int(args.early_stopping_rounds),
@@ -34,6 +34,7 @@ EXPECTED_MODEL_OBJECTIVE = (
 )
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 CLOSED_LOOP_CONTRACT_PATH = PROJECT_ROOT / "config" / "closed_loop_contract.json"
+SANITIZE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
 
 
 def is_allowed_activation_gate_warning(reason: str) -> bool:
@@ -397,8 +398,7 @@ def holdout_artifact_contract(domain_result: Dict[str, Any]) -> Tuple[str, str]:
 
 
 def sanitize_name(raw: str) -> str:
-    value = re.sub(r"[^A-Za-z0-9._-]+", "_", raw.strip())
-    value = value.strip("._-")
+    value = SANITIZE_NAME_RE.sub("_", raw.strip()).strip("._-")
     return value or "unknown_model"
 
 
@@ -13,15 +13,31 @@ Steps:
 from __future__ import annotations
 
 import argparse
+import contextlib
 import csv
 import datetime as dt
+import importlib.util
 import json
+import os
 import pathlib
 import shlex
 import subprocess
 import sys
+import threading
+import time
+import traceback
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, TextIO, Tuple
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - 无 PyYAML 时回退到内置最小解析器
+    yaml = None
+
+if yaml is not None:
+    YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+else:  # pragma: no cover
+    YAML_LOADER = None
 
 
 @dataclass
@@ -35,12 +51,21 @@ class StepResult:
     started_at_utc: str = ""
     finished_at_utc: str = ""
     error: str = ""
+    log_path: str = ""
+    duration_sec: float = 0.0
 
 
 def now_utc_iso() -> str:
     return dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+def finish_step(step: StepResult, started_monotonic: float) -> StepResult:
+    # 耗时用 monotonic 计算，不受墙钟调整影响；墙钟时间戳仅用于审计展示。
+    step.finished_at_utc = now_utc_iso()
+    step.duration_sec = round(time.monotonic() - started_monotonic, 3)
+    return step
+
+
 def parse_scalar(raw: str) -> Any:
     text = raw.strip()
     if text.lower() in {"true", "yes", "on"}:
@@ -62,6 +87,60 @@ def parse_scalar(raw: str) -> Any:
 
 
 def load_yaml(path: pathlib.Path) -> Dict[str, Any]:
+    """
+    Load the pipeline config, preferring PyYAML's libyaml-backed CSafeLoader.
+    Falls back to the minimal parser when PyYAML is not installed.
+    """
+    text = path.read_text(encoding="utf-8")
+    if YAML_LOADER is None:
+        return parse_minimal_yaml(text)
+    payload = yaml.load(text, Loader=YAML_LOADER)
+    return payload if isinstance(payload, dict) else {}
+
+
+def load_yaml_cached(path: pathlib.Path) -> Dict[str, Any]:
+    """
+    Load the config through a JSON sidecar keyed on (mtime_ns, size, parser).
+    The sidecar write is best-effort: read-only config mounts just re-parse.
+    """
+    stat = path.stat()
+    # 解析器身份也进入缓存键：PyYAML 与最小解析器对同一文件的结果不同
+    # （如未加引号的日期、嵌套列表），装卸 PyYAML 后不能复用对方的缓存。
+    parser = YAML_LOADER.__name__ if YAML_LOADER is not None else "minimal"
+    cache_path = path.with_suffix(path.suffix + ".cache.json")
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if (
+            isinstance(cached, dict)
+            and cached.get("mtime_ns") == stat.st_mtime_ns
+            and cached.get("size") == stat.st_size
+            and cached.get("parser") == parser
+            and isinstance(cached.get("data"), dict)
+        ):
+            return cached["data"]
+    except (OSError, ValueError):
+        pass
+    data = load_yaml(path)
+    payload = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "parser": parser,
+        "data": data,
+    }
+    # 临时文件名带 pid：调度器并发启动多个 pipeline 时不会互相覆盖写到一半的 sidecar。
+    tmp_path = cache_path.with_name(f".{cache_path.name}.tmp-{os.getpid()}")
+    try:
+        tmp_path.write_text(
+            json.dumps(payload, ensure_ascii=False, default=str),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+    return data
+
+
+def parse_minimal_yaml(text: str) -> Dict[str, Any]:
     """
     Minimal YAML parser for this project config format:
     - mapping only
@@ -70,7 +149,7 @@ def load_yaml(path: pathlib.Path) -> Dict[str, Any]:
     """
     root: Dict[str, Any] = {}
     stack: List[tuple[int, Dict[str, Any]]] = [(-1, root)]
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
+    for raw_line in text.splitlines():
         if not raw_line.strip():
             continue
         stripped = raw_line.lstrip()
@@ -97,13 +176,18 @@ def load_yaml(path: pathlib.Path) -> Dict[str, Any]:
     return root
 
 
-def deep_get(root: Dict[str, Any], keys: List[str], default: Any) -> Any:
-    current: Any = root
-    for key in keys:
-        if not isinstance(current, dict) or key not in current:
-            return default
-        current = current[key]
-    return current
+def flatten_config(
+    root: Dict[str, Any],
+    prefix: Tuple[str, ...] = (),
+) -> Dict[Tuple[str, ...], Any]:
+    """Flatten nested mappings once so config lookups are single tuple-key hits."""
+    flat: Dict[Tuple[str, ...], Any] = {}
+    for key, value in root.items():
+        path = prefix + (str(key),)
+        flat[path] = value
+        if isinstance(value, dict):
+            flat.update(flatten_config(value, path))
+    return flat
 
 
 def as_bool(value: Any, default: bool) -> bool:
@@ -132,33 +216,191 @@ def as_float(value: Any, default: float) -> float:
         return default
 
 
-def run_command(step: StepResult, dry_run: bool) -> StepResult:
+# (flag, 配置路径, 默认值, 类型转换)；按表一次性展开为 argv。
+# 类型转换只接收配置值，转换失败（TypeError/ValueError）时由 build_config_args 回退默认值。
+ConfigArgSpec = Tuple[str, Tuple[str, ...], Any, Callable[[Any], Any]]
+
+WALKFORWARD_CONFIG_ARGS: Tuple[ConfigArgSpec, ...] = (
+    ("--train-window", ("walkforward", "train_window"), 2400, int),
+    ("--test-window", ("walkforward", "test_window"), 480, int),
+    ("--step-window", ("walkforward", "step_window"), 480, int),
+    ("--fee-bps", ("walkforward", "fee_bps"), 6.0, float),
+    ("--slippage-bps", ("walkforward", "slippage_bps"), 1.5, float),
+    ("--signal-threshold", ("walkforward", "signal_threshold"), 0.0002, float),
+    ("--max-leverage", ("walkforward", "max_leverage"), 1.5, float),
+    ("--pred-scale", ("walkforward", "pred_scale"), 0.002, float),
+    ("--interval-minutes", ("walkforward", "interval_minutes"), 5, int),
+    ("--model", ("walkforward", "model"), "linear", str),
+    ("--catboost-iterations", ("walkforward", "catboost_iterations"), 300, int),
+    ("--catboost-depth", ("walkforward", "catboost_depth"), 6, int),
+    (
+        "--catboost-learning-rate",
+        ("walkforward", "catboost_learning_rate"),
+        0.05,
+        float,
+    ),
+    ("--random-seed", ("walkforward", "random_seed"), 42, int),
+    ("--min-hold-bars", ("walkforward", "min_hold_bars"), 3, int),
+    ("--rebalance-deadband", ("walkforward", "rebalance_deadband"), 0.10, float),
+    ("--min-calibration-ic", ("walkforward", "min_calibration_ic"), 0.0, float),
+    ("--label-horizon-bars", ("feature_store", "forward_bars"), 12, int),
+    ("--embargo-bars", ("walkforward", "embargo_bars"), -1, int),
+    ("--min-traded-splits", ("walkforward", "min_traded_splits"), 1, int),
+    ("--min-total-trades", ("walkforward", "min_total_trades"), 1, int),
+    ("--min-avg-split-return", ("walkforward", "min_avg_split_return"), 0.0, float),
+    (
+        "--min-traded-avg-split-return",
+        ("walkforward", "min_traded_avg_split_return"),
+        0.0,
+        float,
+    ),
+    ("--max-worst-drawdown", ("walkforward", "max_worst_drawdown"), 1.0, float),
+)
+
+
+def build_config_args(
+    flat_config: Dict[Tuple[str, ...], Any],
+    specs: Tuple[ConfigArgSpec, ...],
+) -> List[str]:
+    argv: List[str] = []
+    for flag, keys, default, cast in specs:
+        try:
+            value = cast(flat_config.get(keys, default))
+        except (TypeError, ValueError):
+            value = default
+        argv += [flag, str(value)]
+    return argv
+
+
+class TeeWriter:
+    """Minimal text sink that forwards writes to several streams."""
+
+    def __init__(self, *streams: TextIO) -> None:
+        self._streams = streams
+
+    def write(self, text: str) -> int:
+        for stream in self._streams:
+            stream.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        for stream in self._streams:
+            stream.flush()
+
+
+def relay_lines(
+    source: TextIO,
+    sink: TextIO,
+    log_handle: TextIO | None,
+    lock: threading.Lock,
+) -> None:
+    """Forward a child pipe line by line to `sink`, teeing into the step log."""
+    for line in source:
+        # stdout/stderr 两个转发线程共用步骤日志，按整行加锁避免交错。
+        with lock:
+            sink.write(line)
+            sink.flush()
+            if log_handle is not None:
+                log_handle.write(line)
+
+
+def run_step_in_process(command: List[str], out: TextIO, err: TextIO) -> int:
+    """
+    Run `<python> <tool.py> args...` by importing the tool and calling main()
+    with the same argv, skipping a fresh interpreter start per step.
+    """
+    script_path = pathlib.Path(command[1])
+    module_name = f"_pipeline_step_{script_path.stem}"
+    saved_argv = sys.argv
+    sys.argv = [str(script_path), *command[2:]]
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                spec = importlib.util.spec_from_file_location(module_name, script_path)
+                if spec is None or spec.loader is None:
+                    raise RuntimeError(f"failed to load step module: {script_path}")
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                spec.loader.exec_module(module)
+                return_code = module.main()
+            except SystemExit as exc:
+                return_code = exc.code
+            except Exception:  # 与子进程一致：未捕获异常即步骤失败
+                traceback.print_exc()
+                return 1
+            if return_code is None:
+                return 0
+            if isinstance(return_code, int):
+                return return_code
+            print(return_code, file=sys.stderr)
+            return 1
+    finally:
+        sys.argv = saved_argv
+        sys.modules.pop(module_name, None)
+
+
+def run_command(
+    step: StepResult,
+    dry_run: bool,
+    log_dir: pathlib.Path | None = None,
+    in_process: bool = False,
+) -> StepResult:
+    started_monotonic = time.monotonic()
     step.started_at_utc = now_utc_iso()
     if not step.enabled:
         step.status = "skipped"
-        step.finished_at_utc = now_utc_iso()
-        return step
+        return finish_step(step, started_monotonic)
 
     print(f"[PIPELINE] {step.name}: {' '.join(shlex.quote(x) for x in step.command)}")
     if dry_run:
         step.status = "planned"
         step.return_code = 0
-        step.finished_at_utc = now_utc_iso()
-        return step
-
-    completed = subprocess.run(step.command, capture_output=True, text=True)
-    if completed.stdout:
-        print(completed.stdout.rstrip())
-    if completed.stderr:
-        print(completed.stderr.rstrip(), file=sys.stderr)
-    step.return_code = completed.returncode
-    if completed.returncode == 0:
+        return finish_step(step, started_monotonic)
+
+    # 逐行转发子进程输出，长步骤可实时看到进度且内存有界；stdout/stderr 各自转发到
+    # 父进程的 stdout/stderr（调用方的重定向与告警仍按流区分），同时 tee 到 run_dir
+    # 下的步骤日志，便于事后排查。
+    log_handle = None
+    if log_dir is not None:
+        log_path = log_dir / f"{step.name}.log"
+        log_handle = log_path.open("w", encoding="utf-8")
+        step.log_path = str(log_path)
+    try:
+        if in_process:
+            out_sinks = [sys.stdout] if log_handle is None else [sys.stdout, log_handle]
+            err_sinks = [sys.stderr] if log_handle is None else [sys.stderr, log_handle]
+            return_code = run_step_in_process(
+                step.command, TeeWriter(*out_sinks), TeeWriter(*err_sinks)
+            )
+        else:
+            log_lock = threading.Lock()
+            with subprocess.Popen(
+                step.command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+            ) as proc:
+                assert proc.stdout is not None and proc.stderr is not None
+                stderr_relay = threading.Thread(
+                    target=relay_lines,
+                    args=(proc.stderr, sys.stderr, log_handle, log_lock),
+                    daemon=True,
+                )
+                stderr_relay.start()
+                relay_lines(proc.stdout, sys.stdout, log_handle, log_lock)
+                stderr_relay.join()
+                return_code = proc.wait()
+    finally:
+        if log_handle is not None:
+            log_handle.close()
+    step.return_code = return_code
+    if return_code == 0:
         step.status = "ok"
     else:
         step.status = "fail"
-        step.error = f"return_code={completed.returncode}"
-    step.finished_at_utc = now_utc_iso()
-    return step
+        step.error = f"return_code={return_code}"
+    return finish_step(step, started_monotonic)
 
 
 def validate_source_contract(
@@ -332,6 +574,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="build data/feature outputs without running walk-forward",
     )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="run each step tool in this interpreter instead of a child process",
+    )
     parser.add_argument("--dry-run", action="store_true")
     return parser.parse_args()
 
@@ -339,7 +586,8 @@ def parse_args() -> argparse.Namespace:
 def main() -> int:
     args = parse_args()
     config_path = pathlib.Path(args.config)
-    config = load_yaml(config_path)
+    config = load_yaml_cached(config_path)
+    flat_config = flatten_config(config)
 
     run_dir = pathlib.Path(args.run_dir) if args.run_dir else pathlib.Path(
         f"data/reports/closed_loop/data_pipeline/{dt.datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}"
@@ -348,36 +596,36 @@ def main() -> int:
 
     ohlcv_path = pathlib.Path(
         args.ohlcv_out
-        or deep_get(config, ["paths", "ohlcv_csv"], "data/research/ohlcv_5m.csv")
+        or flat_config.get(("paths", "ohlcv_csv"), "data/research/ohlcv_5m.csv")
     )
     feature_path = pathlib.Path(
         args.feature_out
-        or deep_get(config, ["paths", "feature_csv"], str(run_dir / "feature_store_5m.csv"))
+        or flat_config.get(("paths", "feature_csv"), str(run_dir / "feature_store_5m.csv"))
     )
     backtest_path = pathlib.Path(
         args.backtest_report
-        or deep_get(config, ["paths", "backtest_report"], str(run_dir / "walkforward_report.json"))
+        or flat_config.get(("paths", "backtest_report"), str(run_dir / "walkforward_report.json"))
     )
 
-    symbol = str(args.symbol or deep_get(config, ["common", "symbol"], "BTCUSDT")).upper()
-    interval_min = as_int(deep_get(config, ["common", "interval_minutes"], 5), 5)
-    category = str(deep_get(config, ["common", "category"], "linear"))
+    symbol = str(args.symbol or flat_config.get(("common", "symbol"), "BTCUSDT")).upper()
+    interval_min = as_int(flat_config.get(("common", "interval_minutes"), 5), 5)
+    category = str(flat_config.get(("common", "category"), "linear"))
 
     py = sys.executable
     steps: List[StepResult] = []
 
-    archive_enabled = as_bool(deep_get(config, ["archive", "enabled"], True), True)
+    archive_enabled = as_bool(flat_config.get(("archive", "enabled"), True), True)
     archive_provider = str(
-        deep_get(config, ["archive", "provider"], "bybit")
+        flat_config.get(("archive", "provider"), "bybit")
     ).strip().lower()
     archive_category = str(
-        deep_get(config, ["archive", "category"], category)
+        flat_config.get(("archive", "category"), category)
     ).strip()
     incremental_category = str(
-        deep_get(config, ["incremental", "category"], category)
+        flat_config.get(("incremental", "category"), category)
     ).strip()
     gap_fill_category = str(
-        deep_get(config, ["gap_fill", "category"], category)
+        flat_config.get(("gap_fill", "category"), category)
     ).strip()
     if not archive_enabled:
         raise ValueError(
@@ -397,7 +645,7 @@ def main() -> int:
     archive_days = (
         max(1, int(args.archive_days))
         if int(args.archive_days or 0) > 0
-        else as_int(deep_get(config, ["archive", "days"], 365), 365)
+        else as_int(flat_config.get(("archive", "days"), 365), 365)
     )
     archive_cmd = [
         py,
@@ -405,27 +653,32 @@ def main() -> int:
         "--symbol",
         symbol,
         "--interval",
-        str(deep_get(config, ["archive", "interval_minutes"], interval_min)),
+        str(flat_config.get(("archive", "interval_minutes"), interval_min)),
         "--category",
         archive_category,
         "--days",
         str(archive_days),
         "--base-url",
-        str(deep_get(config, ["archive", "base_url"], "https://api.bybit.com")),
+        str(flat_config.get(("archive", "base_url"), "https://api.bybit.com")),
         "--output",
         str(ohlcv_path),
         "--report",
         str(run_dir / "archive_report.json"),
     ]
-    start_date = args.archive_start_date or deep_get(config, ["archive", "start_date"], "")
-    end_date = args.archive_end_date or deep_get(config, ["archive", "end_date"], "")
+    start_date = args.archive_start_date or flat_config.get(("archive", "start_date"), "")
+    end_date = args.archive_end_date or flat_config.get(("archive", "end_date"), "")
+    # PyYAML 会把未加引号的 YYYY-MM-DD 解析为 date 对象。
+    if isinstance(start_date, dt.date):
+        start_date = start_date.isoformat()
+    if isinstance(end_date, dt.date):
+        end_date = end_date.isoformat()
     if isinstance(start_date, str) and start_date.strip():
         archive_cmd += ["--start-date", start_date.strip()]
     if isinstance(end_date, str) and end_date.strip():
         archive_cmd += ["--end-date", end_date.strip()]
     steps.append(StepResult(name="archive_download", enabled=archive_enabled, command=archive_cmd))
 
-    incremental_enabled = as_bool(deep_get(config, ["incremental", "enabled"], True), True)
+    incremental_enabled = as_bool(flat_config.get(("incremental", "enabled"), True), True)
     steps.append(
         StepResult(
             name="incremental_update",
@@ -436,17 +689,17 @@ def main() -> int:
                 "--symbol",
                 symbol,
                 "--interval",
-                str(deep_get(config, ["incremental", "interval_minutes"], interval_min)),
+                str(flat_config.get(("incremental", "interval_minutes"), interval_min)),
                 "--category",
                 incremental_category,
                 "--base-url",
-                str(deep_get(config, ["archive", "base_url"], "https://api.bybit.com")),
+                str(flat_config.get(("archive", "base_url"), "https://api.bybit.com")),
                 "--bars",
-                str(as_int(deep_get(config, ["incremental", "bars"], 240), 240)),
+                str(as_int(flat_config.get(("incremental", "bars"), 240), 240)),
                 "--iterations",
-                str(as_int(deep_get(config, ["incremental", "iterations"], 1), 1)),
+                str(as_int(flat_config.get(("incremental", "iterations"), 1), 1)),
                 "--sleep-sec",
-                str(as_float(deep_get(config, ["incremental", "sleep_sec"], 5.0), 5.0)),
+                str(as_float(flat_config.get(("incremental", "sleep_sec"), 5.0), 5.0)),
                 "--output",
                 str(ohlcv_path),
                 "--report",
@@ -455,7 +708,7 @@ def main() -> int:
         )
     )
 
-    gap_fill_enabled = as_bool(deep_get(config, ["gap_fill", "enabled"], True), True)
+    gap_fill_enabled = as_bool(flat_config.get(("gap_fill", "enabled"), True), True)
     gap_cmd = [
         py,
         "tools/gap_fill_klines.py",
@@ -466,21 +719,24 @@ def main() -> int:
         "--symbol",
         symbol,
         "--interval",
-        str(deep_get(config, ["gap_fill", "interval_minutes"], interval_min)),
+        str(flat_config.get(("gap_fill", "interval_minutes"), interval_min)),
         "--category",
         gap_fill_category,
         "--base-url",
-        str(deep_get(config, ["archive", "base_url"], "https://api.bybit.com")),
+        str(flat_config.get(("archive", "base_url"), "https://api.bybit.com")),
         "--max-ranges",
-        str(as_int(deep_get(config, ["gap_fill", "max_ranges"], 200), 200)),
+        str(as_int(flat_config.get(("gap_fill", "max_ranges"), 200), 200)),
         "--report",
         str(run_dir / "gap_fill_report.json"),
     ]
-    if as_bool(deep_get(config, ["gap_fill", "strict"], False), False):
+    if as_bool(flat_config.get(("gap_fill", "strict"), False), False):
         gap_cmd.append("--strict")
     steps.append(StepResult(name="gap_fill", enabled=gap_fill_enabled, command=gap_cmd))
 
-    feature_enabled = as_bool(deep_get(config, ["feature_store", "enabled"], True), True)
+    # gap_fill -> feature_store -> walkforward 之间刻意经由 CSV 交接：
+    # ohlcv/feature CSV 本身是必须产物（source contract 校验读取最终 OHLCV），
+    # 且 feature CSV 的 %.10f 精度就是回测输入口径，内存直传会改变回测数值。
+    feature_enabled = as_bool(flat_config.get(("feature_store", "enabled"), True), True)
     feature_cmd = [
         py,
         "tools/build_feature_store.py",
@@ -489,16 +745,16 @@ def main() -> int:
         "--output",
         str(feature_path),
         "--forward-bars",
-        str(as_int(deep_get(config, ["feature_store", "forward_bars"], 12), 12)),
+        str(as_int(flat_config.get(("feature_store", "forward_bars"), 12), 12)),
         "--report",
         str(run_dir / "feature_store_report.json"),
     ]
-    if as_bool(deep_get(config, ["feature_store", "keep_na"], False), False):
+    if as_bool(flat_config.get(("feature_store", "keep_na"), False), False):
         feature_cmd.append("--keep-na")
     steps.append(StepResult(name="feature_store", enabled=feature_enabled, command=feature_cmd))
 
     walk_enabled = (
-        as_bool(deep_get(config, ["walkforward", "enabled"], True), True)
+        as_bool(flat_config.get(("walkforward", "enabled"), True), True)
         and not bool(args.skip_walkforward)
     )
     steps.append(
@@ -513,131 +769,23 @@ def main() -> int:
                 str(feature_path),
                 "--output",
                 str(backtest_path),
-                "--train-window",
-                str(as_int(deep_get(config, ["walkforward", "train_window"], 2400), 2400)),
-                "--test-window",
-                str(as_int(deep_get(config, ["walkforward", "test_window"], 480), 480)),
-                "--step-window",
-                str(as_int(deep_get(config, ["walkforward", "step_window"], 480), 480)),
-                "--fee-bps",
-                str(as_float(deep_get(config, ["walkforward", "fee_bps"], 6.0), 6.0)),
-                "--slippage-bps",
-                str(as_float(deep_get(config, ["walkforward", "slippage_bps"], 1.5), 1.5)),
-                "--signal-threshold",
-                str(
-                    as_float(deep_get(config, ["walkforward", "signal_threshold"], 0.0002), 0.0002)
-                ),
-                "--max-leverage",
-                str(as_float(deep_get(config, ["walkforward", "max_leverage"], 1.5), 1.5)),
-                "--pred-scale",
-                str(as_float(deep_get(config, ["walkforward", "pred_scale"], 0.002), 0.002)),
-                "--interval-minutes",
-                str(as_int(deep_get(config, ["walkforward", "interval_minutes"], 5), 5)),
-                "--model",
-                str(deep_get(config, ["walkforward", "model"], "linear")),
-                "--catboost-iterations",
-                str(
-                    as_int(
-                        deep_get(config, ["walkforward", "catboost_iterations"], 300),
-                        300,
-                    )
-                ),
-                "--catboost-depth",
-                str(as_int(deep_get(config, ["walkforward", "catboost_depth"], 6), 6)),
-                "--catboost-learning-rate",
-                str(
-                    as_float(
-                        deep_get(config, ["walkforward", "catboost_learning_rate"], 0.05),
-                        0.05,
-                    )
-                ),
-                "--random-seed",
-                str(as_int(deep_get(config, ["walkforward", "random_seed"], 42), 42)),
-                "--min-hold-bars",
-                str(as_int(deep_get(config, ["walkforward", "min_hold_bars"], 3), 3)),
-                "--rebalance-deadband",
-                str(
-                    as_float(
-                        deep_get(config, ["walkforward", "rebalance_deadband"], 0.10),
-                        0.10,
-                    )
-                ),
-                "--min-calibration-ic",
-                str(
-                    as_float(
-                        deep_get(config, ["walkforward", "min_calibration_ic"], 0.0),
-                        0.0,
-                    )
-                ),
-                "--label-horizon-bars",
-                str(
-                    as_int(
-                        deep_get(config, ["feature_store", "forward_bars"], 12),
-                        12,
-                    )
-                ),
-                "--embargo-bars",
-                str(
-                    as_int(
-                        deep_get(config, ["walkforward", "embargo_bars"], -1),
-                        -1,
-                    )
-                ),
-                "--min-traded-splits",
-                str(
-                    as_int(
-                        deep_get(config, ["walkforward", "min_traded_splits"], 1),
-                        1,
-                    )
-                ),
-                "--min-total-trades",
-                str(
-                    as_int(
-                        deep_get(config, ["walkforward", "min_total_trades"], 1),
-                        1,
-                    )
-                ),
-                "--min-avg-split-return",
-                str(
-                    as_float(
-                        deep_get(
-                            config,
-                            ["walkforward", "min_avg_split_return"],
-                            0.0,
-                        ),
-                        0.0,
-                    )
-                ),
-                "--min-traded-avg-split-return",
-                str(
-                    as_float(
-                        deep_get(
-                            config,
-                            ["walkforward", "min_traded_avg_split_return"],
-                            0.0,
-                        ),
-                        0.0,
-                    )
-                ),
-                "--max-worst-drawdown",
-                str(
-                    as_float(
-                        deep_get(
-                            config,
-                            ["walkforward", "max_worst_drawdown"],
-                            1.0,
-                        ),
-                        1.0,
-                    )
-                ),
+                *build_config_args(flat_config, WALKFORWARD_CONFIG_ARGS),
             ],
         )
     )
 
     status = "PASS"
     diagnostic_status = "PASS"
+    # 步骤依赖是一条链：archive/incremental/gap_fill 原地读写同一个 ohlcv_path，
+    # feature_store 读取其最终结果，walkforward 读取 feature_path。
+    # 任何两步并发都会竞争同一文件或读到半成品，因此保持严格串行。
     for step in steps:
-        result = run_command(step, dry_run=bool(args.dry_run))
+        result = run_command(
+            step,
+            dry_run=bool(args.dry_run),
+            log_dir=run_dir,
+            in_process=bool(args.in_process),
+        )
         if result.status == "fail":
             if result.required:
                 status = "FAIL"
@@ -650,7 +798,7 @@ def main() -> int:
             run_dir=run_dir,
             enabled_steps={item.name: item.enabled for item in steps},
             expected_base_url=str(
-                deep_get(config, ["archive", "base_url"], "https://api.bybit.com")
+                flat_config.get(("archive", "base_url"), "https://api.bybit.com")
             ),
             expected_category=category,
             expected_symbol=symbol,
@@ -707,6 +855,8 @@ def main() -> int:
                 "started_at_utc": item.started_at_utc,
                 "finished_at_utc": item.finished_at_utc,
                 "error": item.error,
+                "log_path": item.log_path,
+                "duration_sec": item.duration_sec,
             }
             for item in steps
         ],
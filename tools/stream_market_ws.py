@@ -9,19 +9,32 @@ can run in cron/scheduler without extra websocket dependencies.
 from __future__ import annotations
 
 import argparse
-import csv
+import http.client
 import json
+import os
 import pathlib
+import pickle
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Sequence, Tuple
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from typing import Any, Dict, List, NamedTuple, Sequence, TextIO, Tuple
+from urllib.parse import urlencode, urlsplit
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 可选加速依赖
+    orjson = None
 
-@dataclass(frozen=True)
-class Candle:
+
+REQUEST_HEADERS = {"User-Agent": "ai-trade-incremental-updater/1.0"}
+CSV_HEADER = "timestamp,open,high,low,close,volume\r\n"
+CSV_ROW_FORMAT = "%d,%.8f,%.8f,%.8f,%.8f,%.8f\r\n"
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+class Candle(NamedTuple):
     timestamp_ms: int
     open: float
     high: float
@@ -58,14 +71,31 @@ def keep_closed_candles(
     return closed, len(candles) - len(closed)
 
 
+def decode_json_bytes(raw: bytes) -> Any:
+    # orjson 直接解析 bytes；标准库 json.loads 同样接受 bytes，省去一次 decode 拷贝。
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def open_http_connection(base_url: str, timeout_sec: float) -> http.client.HTTPConnection:
+    """One keep-alive connection per run; polling loops reuse its TCP/TLS session."""
+    parts = urlsplit(base_url)
+    if parts.scheme not in {"http", "https"} or not parts.netloc:
+        raise ValueError(f"invalid base url: {base_url}")
+    if parts.scheme == "https":
+        return http.client.HTTPSConnection(parts.netloc, timeout=timeout_sec)
+    return http.client.HTTPConnection(parts.netloc, timeout=timeout_sec)
+
+
 def request_bybit_latest_klines(
     *,
+    connection: http.client.HTTPConnection,
     base_url: str,
     category: str,
     symbol: str,
     interval: str,
     bars: int,
-    timeout_sec: float,
 ) -> Tuple[List[Candle], int, int]:
     params = {
         "category": category,
@@ -73,16 +103,24 @@ def request_bybit_latest_klines(
         "interval": interval,
         "limit": str(max(1, min(1000, int(bars)))),
     }
-    endpoint = f"{base_url.rstrip('/')}/v5/market/kline?{urlencode(params)}"
-    req = Request(endpoint, headers={"User-Agent": "ai-trade-incremental-updater/1.0"})
-    try:
-        with urlopen(req, timeout=timeout_sec) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
-    except HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="replace") if exc.fp else ""
-        raise RuntimeError(f"HTTP error: status={exc.code}, body={body}") from exc
-    except URLError as exc:
-        raise RuntimeError(f"network error: {exc}") from exc
+    base_path = urlsplit(base_url).path.rstrip("/")
+    endpoint = f"{base_path}/v5/market/kline?{urlencode(params)}"
+    # 复用连接时服务端可能已回收空闲 keep-alive；关闭后重连重试一次即可。
+    for attempt in range(2):
+        try:
+            connection.request("GET", endpoint, headers=REQUEST_HEADERS)
+            resp = connection.getresponse()
+            body = resp.read()
+            break
+        except (OSError, http.client.HTTPException) as exc:
+            connection.close()
+            if attempt == 0 and isinstance(exc, STALE_CONNECTION_ERRORS):
+                continue
+            raise RuntimeError(f"network error: {exc}") from exc
+    if resp.status != 200:
+        text = body.decode("utf-8", errors="replace")
+        raise RuntimeError(f"HTTP error: status={resp.status}, body={text}")
+    payload = decode_json_bytes(body)
 
     if int(payload.get("retCode", -1)) != 0:
         raise RuntimeError(
@@ -121,53 +159,154 @@ def request_bybit_latest_klines(
     return candles, dropped_open_bar_count, server_time_ms
 
 
-def read_csv(path: pathlib.Path) -> Dict[int, Candle]:
+def read_csv_checked(path: pathlib.Path) -> Tuple[Dict[int, Candle], bool]:
+    """
+    Parse the CSV and report whether it is safe to append to: the header is
+    exactly CSV_HEADER's column order, no data row was skipped, and the file
+    ends in a complete line.
+    """
     if not path.exists():
-        return {}
+        return {}, False
     out: Dict[int, Candle] = {}
-    with path.open("r", encoding="utf-8") as fp:
-        reader = csv.DictReader(fp)
-        for row in reader:
+    skipped = 0
+    with path.open("r", encoding="utf-8", newline="") as fp:
+        header_line = fp.readline()
+        header = header_line.strip().split(",")
+        try:
+            columns = [
+                header.index(name)
+                for name in ("timestamp", "open", "high", "low", "close", "volume")
+            ]
+        except ValueError:
+            return {}, False
+        ts_i, open_i, high_i, low_i, close_i, volume_i = columns
+        last_line = header_line
+        # 纯数值列按逗号切分即可，避免 csv.DictReader 每行构造 dict 的开销。
+        for line in fp:
+            last_line = line
+            fields = line.rstrip("\r\n").split(",")
             try:
                 candle = Candle(
-                    timestamp_ms=int(row["timestamp"]),
-                    open=float(row["open"]),
-                    high=float(row["high"]),
-                    low=float(row["low"]),
-                    close=float(row["close"]),
-                    volume=float(row["volume"]),
+                    timestamp_ms=int(fields[ts_i]),
+                    open=float(fields[open_i]),
+                    high=float(fields[high_i]),
+                    low=float(fields[low_i]),
+                    close=float(fields[close_i]),
+                    volume=float(fields[volume_i]),
                 )
-            except (ValueError, KeyError):
+            except (ValueError, IndexError):
+                skipped += 1
                 continue
             out[candle.timestamp_ms] = candle
-    return out
+    appendable = (
+        header_line.rstrip("\r\n") == CSV_HEADER.rstrip("\r\n")
+        and skipped == 0
+        and last_line.endswith("\n")
+    )
+    return dict(sorted(out.items())), appendable
+
+
+def csv_ends_with_newline(path: pathlib.Path) -> bool:
+    # 被中断的写入可能留下半行；直接在其后追加会把两行拼成一行“合法”的坏数据。
+    try:
+        with path.open("rb") as fp:
+            fp.seek(-1, os.SEEK_END)
+            return fp.read(1) == b"\n"
+    except OSError:
+        return False
+
+
+def candle_cache_path(path: pathlib.Path) -> pathlib.Path:
+    return path.with_suffix(path.suffix + ".cache.pkl")
+
+
+def load_candles_checked(path: pathlib.Path) -> Tuple[Dict[int, Candle], bool]:
+    """
+    read_csv_checked behind a pickle sidecar keyed on the CSV's (mtime_ns, size).
+    main() only writes the sidecar for an append-safe file; the tail is still
+    re-checked on a hit so a sidecar left by an older version cannot vouch for
+    a torn file.
+    """
+    if not path.exists():
+        return {}, False
+    stat = path.stat()
+    try:
+        with candle_cache_path(path).open("rb") as fp:
+            mtime_ns, size, rows = pickle.load(fp)
+        if mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            return {row[0]: Candle(*row) for row in rows}, csv_ends_with_newline(path)
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError, TypeError):
+        pass
+    return read_csv_checked(path)
+
+
+def save_candle_cache(path: pathlib.Path, candles: Dict[int, Candle]) -> None:
+    # 缓存只存纯元组，避免 pickle 绑定 Candle 所在的模块名（__main__ 或流水线进程内加载名）。
+    stat = path.stat()
+    payload = (stat.st_mtime_ns, stat.st_size, [tuple(c) for c in candles.values()])
+    cache_path = candle_cache_path(path)
+    # 临时文件名带 pid：同一 symbol/interval 的多个采集进程不会写同一个临时文件。
+    tmp_path = cache_path.with_name(f".{cache_path.name}.tmp-{os.getpid()}")
+    try:
+        with tmp_path.open("wb") as fp:
+            pickle.dump(payload, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
 
 
 def merge_candles(existing: Dict[int, Candle], incoming: Sequence[Candle]) -> int:
+    """
+    Merge into a timestamp-ordered dict. New bars normally land at the tail,
+    which keeps the order without re-sorting; only a back-fill re-sorts.
+    """
     added = 0
+    last_ts = next(reversed(existing)) if existing else None
+    needs_sort = False
     for candle in incoming:
-        if candle.timestamp_ms not in existing:
+        ts = candle.timestamp_ms
+        if ts not in existing:
             added += 1
-        existing[candle.timestamp_ms] = candle
+            if last_ts is not None and ts < last_ts:
+                needs_sort = True
+            else:
+                last_ts = ts
+        existing[ts] = candle
+    if needs_sort:
+        ordered = sorted(existing.items())
+        existing.clear()
+        existing.update(ordered)
     return added
 
 
 def write_csv(path: pathlib.Path, candles: Sequence[Candle]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8", newline="") as fp:
-        writer = csv.writer(fp)
-        writer.writerow(["timestamp", "open", "high", "low", "close", "volume"])
-        for c in candles:
-            writer.writerow(
-                [
-                    c.timestamp_ms,
-                    f"{c.open:.8f}",
-                    f"{c.high:.8f}",
-                    f"{c.low:.8f}",
-                    f"{c.close:.8f}",
-                    f"{c.volume:.8f}",
-                ]
-            )
+        fp.write(CSV_HEADER)
+        write_rows(fp, candles)
+
+
+def append_csv(path: pathlib.Path, candles: Sequence[Candle]) -> None:
+    with path.open("a", encoding="utf-8", newline="") as fp:
+        write_rows(fp, candles)
+
+
+def write_rows(fp: TextIO, candles: Sequence[Candle]) -> None:
+    # Candle 本身就是元组，直接套用预编译格式串，与 csv.writer 输出逐字节一致。
+    write = fp.write
+    for c in candles:
+        write(CSV_ROW_FORMAT % c)
+
+
+def rewrites_history(existing: Dict[int, Candle], incoming: Sequence[Candle]) -> bool:
+    """True unless every incoming bar is either unchanged or strictly newer than the tail."""
+    if not existing:
+        return True
+    last_ts = next(reversed(existing))
+    return any(
+        candle.timestamp_ms <= last_ts and existing.get(candle.timestamp_ms) != candle
+        for candle in incoming
+    )
 
 
 def parse_args() -> argparse.Namespace:
@@ -190,40 +329,61 @@ def main() -> int:
     interval = normalize_interval(args.interval)
     output_path = pathlib.Path(args.output)
 
-    existing = read_csv(output_path)
+    existing, csv_appendable = load_candles_checked(output_path)
     loops = 0
     total_added = 0
     total_seen = len(existing)
     total_dropped_open_bars = 0
     latest_server_time_ms = 0
-    last_ts_before = max(existing.keys()) if existing else None
-
-    while True:
-        loops += 1
-        candles, dropped_open_bars, server_time_ms = request_bybit_latest_klines(
-            base_url=args.base_url,
-            category=args.category,
-            symbol=args.symbol,
-            interval=interval,
-            bars=max(1, int(args.bars)),
-            timeout_sec=float(args.timeout_sec),
-        )
-        total_dropped_open_bars += dropped_open_bars
-        latest_server_time_ms = server_time_ms
-        added = merge_candles(existing, candles)
-        total_added += added
-        sorted_candles = sorted(existing.values(), key=lambda item: item.timestamp_ms)
-        write_csv(output_path, sorted_candles)
-        total_seen = len(sorted_candles)
-        newest_ts = sorted_candles[-1].timestamp_ms if sorted_candles else None
-        log_info(
-            f"loop={loops} added={added} total={total_seen} newest_ts={newest_ts}"
-        )
+    last_ts_before = next(reversed(existing)) if existing else None
 
-        if args.iterations > 0 and loops >= int(args.iterations):
-            break
-        sleep_sec = max(0.1, float(args.sleep_sec))
-        time.sleep(sleep_sec)
+    connection = open_http_connection(args.base_url, float(args.timeout_sec))
+    try:
+        while True:
+            loops += 1
+            candles, dropped_open_bars, server_time_ms = request_bybit_latest_klines(
+                connection=connection,
+                base_url=args.base_url,
+                category=args.category,
+                symbol=args.symbol,
+                interval=interval,
+                bars=max(1, int(args.bars)),
+            )
+            total_dropped_open_bars += dropped_open_bars
+            latest_server_time_ms = server_time_ms
+            previous_last_ts = next(reversed(existing)) if existing else None
+            # 文件头列序非固定格式或有被跳过的行时不能在其后追加，整体重写修复。
+            full_rewrite = not csv_appendable or rewrites_history(existing, candles)
+            added = merge_candles(existing, candles)
+            total_added += added
+            sorted_candles = list(existing.values())
+            if not full_rewrite and added > 0 and not csv_ends_with_newline(output_path):
+                full_rewrite = True
+            if full_rewrite:
+                write_csv(output_path, sorted_candles)
+                csv_appendable = True
+            elif added > 0:
+                # 只追加尾部新 bar，历史行未变化时不重写整个文件。
+                append_csv(
+                    output_path,
+                    [c for c in candles if c.timestamp_ms > previous_last_ts],
+                )
+            total_seen = len(sorted_candles)
+            newest_ts = sorted_candles[-1].timestamp_ms if sorted_candles else None
+            log_info(
+                f"loop={loops} added={added} total={total_seen} newest_ts={newest_ts}"
+            )
+
+            if args.iterations > 0 and loops >= int(args.iterations):
+                break
+            sleep_sec = max(0.1, float(args.sleep_sec))
+            time.sleep(sleep_sec)
+    finally:
+        connection.close()
+    # 只在整体重写或通过尾行检查的追加之后写 sidecar，保证缓存与 CSV 内容一致；
+    # 否则正确的内存数据会掩盖磁盘上的坏行，而 gap_fill/特征库仍读到坏 CSV。
+    if csv_appendable and output_path.exists():
+        save_candle_cache(output_path, existing)
 
     summary = {
         "symbol": args.symbol.upper(),
@@ -241,7 +401,7 @@ def main() -> int:
         "dropped_open_bar_count": total_dropped_open_bars,
         "server_time_ms": latest_server_time_ms,
         "last_timestamp_before": last_ts_before,
-        "last_timestamp_after": (max(existing.keys()) if existing else None),
+        "last_timestamp_after": (next(reversed(existing)) if existing else None),
         "output": str(output_path),
     }
     if args.report:
@@ -4,6 +4,7 @@ import importlib.util
 import pathlib
 import sys
 import datetime as dt
+import functools
 import json
 import re
 import subprocess
@@ -13,6 +14,10 @@ import unittest
 
 def load_assess_module():
     module_path = pathlib.Path(__file__).with_name("assess_run_log.py")
+    # 测试发现/并行运行可能重复导入本文件，同一路径的模块已加载时直接复用。
+    existing = sys.modules.get("assess_run_log")
+    if existing is not None and getattr(existing, "__file__", None) == str(module_path):
+        return existing
     spec = importlib.util.spec_from_file_location("assess_run_log", module_path)
     if spec is None or spec.loader is None:
         raise RuntimeError(f"failed to load module: {module_path}")
@@ -24,8 +29,277 @@ def load_assess_module():
 
 ASSESS = load_assess_module()
 
+# 构造“字段缺失”日志时用于剔除对应片段。
+_EXECUTION_WINDOW_FIELD_RE = re.compile(r", execution_window=\{[^}]*\},")
+
+# SELF_EVOLUTION 用例反复使用的“仅评估未更新”动作行。
+_SKIPPED_EVOLUTION_ACTION = (
+    "2026-02-14 15:00:10 [INFO] SELF_EVOLUTION_ACTION: type=skipped, bucket=RANGE, "
+    "reason=EVOLUTION_COUNTERFACTUAL_IMPROVEMENT_TOO_SMALL, counterfactual_search=true, "
+    "learnability={enabled=true, passed=true, t_stat=1.200000, samples=140}\n"
+)
+
+# 日志里的布尔字段统一小写。
+_BOOL = ("false", "true")
+
+# _runtime_line 可覆盖的字段及默认值。
+_RUNTIME_DEFAULTS: dict[str, object] = {
+    "reduce_only": False,
+    "trading_halted": False,
+    "adapter_trade_ok": True,
+    "force_reduce_only": False,
+    "protection_reduce_only": False,
+    "gate_reduce_only": False,
+    "reconcile_reduce_only": False,
+    "public_ws_healthy": True,
+    "private_ws_healthy": True,
+    "funnel_enqueued": 0,
+    "funnel_fills": 0,
+    "strategy_mix_samples": 1,
+    "strategy_mix_policy_flat_samples": 0,
+    "strategy_mix_latest_trend": 180.0,
+    "strategy_mix_latest_defensive": -60.0,
+    "strategy_mix_latest_blended": 120.0,
+    "strategy_mix_avg_abs_trend": 180.0,
+    "strategy_mix_avg_abs_defensive": 60.0,
+    "strategy_mix_avg_abs_blended": 120.0,
+    "filtered_cost_ratio": 0.0,
+    "filtered_cost_near_miss_ratio": 0.0,
+    "passed_cost_near_miss_ratio": 0.0,
+    "rebalance_gap_avg_abs_usd": 0.0,
+    "rebalance_gap_max_abs_usd": 0.0,
+    "rebalance_within_min_notional_avg_abs_usd": 0.0,
+    "rebalance_within_min_notional_ratio": 0.0,
+    "min_rebalance_notional_usd": 25.0,
+    "entry_edge_gap_avg_bps": 0.0,
+    "candidate_probe_cost_gate_samples": 0,
+    "candidate_probe_cost_gate_long_count": 0,
+    "candidate_probe_cost_gate_short_count": 0,
+    "candidate_probe_cost_gate_expected_edge_avg_bps": 0.0,
+    "candidate_probe_cost_gate_required_edge_avg_bps": 0.0,
+    "candidate_probe_cost_gate_edge_gap_avg_bps": 0.0,
+    "candidate_probe_cost_gate_edge_gap_max_bps": 0.0,
+    "candidate_probe_cost_gate_trend_ratio_avg": 0.0,
+    "realized_net_per_fill": 0.0,
+    "fee_bps_per_fill": 0.0,
+    "maker_fills": 0,
+    "taker_fills": 0,
+    "unknown_fills": 0,
+    "explicit_liquidity_fills": 0,
+    "fee_sign_fallback_fills": 0,
+    "unknown_fill_ratio": 0.0,
+    "explicit_liquidity_fill_ratio": 0.0,
+    "fee_sign_fallback_fill_ratio": 0.0,
+    "maker_fee_bps": 0.0,
+    "taker_fee_bps": 0.0,
+    "maker_fill_ratio": 0.0,
+    "entry_gate_near_miss_tolerance_bps": 0.0,
+    "entry_gate_near_miss_maker_allow": False,
+    "entry_gate_near_miss_maker_max_gap_bps": 0.0,
+    "entry_gate_observed_filtered_ratio": 0.0,
+    "entry_gate_observed_near_miss_ratio": 0.0,
+    "entry_gate_observed_near_miss_allowed_ratio": 0.0,
+    "concentration_top1_share": 0.0,
+    "concentration_symbol_count": 0,
+    "execution_quality_guard_active": False,
+    "execution_quality_guard_penalty_bps": 0.0,
+    "execution_quality_guard_no_fill_windows": 0,
+    "execution_quality_guard_symbol_active_count": 0,
+    "execution_quality_guard_symbol_state_count": 0,
+    "reconcile_anomaly_streak": 0,
+    "reconcile_anomaly_reduce_only": False,
+    "regime_bucket": "RANGE",
+    "equity": 100000.0,
+    "realized_pnl": 0.0,
+    "fees": 0.0,
+    "realized_net": 0.0,
+}
+
+# 以 true/false 文本写入日志的字段。
+_RUNTIME_BOOL_FIELDS = (
+    "reduce_only",
+    "trading_halted",
+    "adapter_trade_ok",
+    "force_reduce_only",
+    "protection_reduce_only",
+    "gate_reduce_only",
+    "reconcile_reduce_only",
+    "public_ws_healthy",
+    "private_ws_healthy",
+    "execution_quality_guard_active",
+    "reconcile_anomaly_reduce_only",
+    "entry_gate_near_miss_maker_allow",
+)
+
+# 需要固定小数位输出的字段，其余字段按 str() 形式输出。
+_RUNTIME_FIELD_FORMATS = {
+    "notional": "%.6f",
+    "equity": "%.6f",
+    "realized_pnl": "%.6f",
+    "fees": "%.6f",
+    "realized_net": "%.6f",
+}
+
+# 测试日志以固定时刻为基准，tick 即秒偏移；各用例的 tick 集合很小，按 tick 缓存时间戳。
+_TS_BASE = dt.datetime(2026, 2, 14, 15, 0, 0)
+_TS_CACHE: dict[int, str] = {}
+
+# RUNTIME_STATUS 行模板只解析一次：前缀、时间戳、tick 每次按位置参数一次性拼出，
+# 其余字段在同一组参数下完全相同，由 _runtime_body 缓存。
+_RUNTIME_LINE_FMT = "%s [INFO] RUNTIME_STATUS: ticks=%s, %s"
+_RUNTIME_BODY_TMPL = (
+    "trade_ok=true, trading_halted=%(trading_halted)s, "
+    "ws={market_channel=public_ws, fill_channel=private_ws, "
+    "public_ws_healthy=%(public_ws_healthy)s, private_ws_healthy=%(private_ws_healthy)s"
+    "}, "
+    "trade_health={"
+    "adapter_trade_ok=%(adapter_trade_ok)s, "
+    "force_reduce_only=%(force_reduce_only)s, "
+    "protection_reduce_only=%(protection_reduce_only)s, "
+    "gate_reduce_only=%(gate_reduce_only)s, "
+    "reconcile_reduce_only=%(reconcile_reduce_only)s, "
+    "trading_halted=%(trading_halted)s"
+    "}, "
+    "account={equity=%(equity)s, drawdown_pct=0.000100, "
+    "notional=%(notional)s, realized_pnl=%(realized_pnl)s, "
+    "fees=%(fees)s, realized_net=%(realized_net)s}, "
+    "concentration={gross_notional_usd=1000.0, top1_abs_notional_usd=800.0, "
+    "top1_symbol=BTCUSDT, top1_share=%(concentration_top1_share)s, "
+    "symbol_count=%(concentration_symbol_count)s}, "
+    "funnel_window={raw=1, risk_adjusted=1, intents_generated=1, "
+    "intents_filtered_inactive_symbol=0, intents_filtered_min_notional=0, "
+    "intents_filtered_fee_aware=0, throttled=0, "
+    "enqueued=%(funnel_enqueued)s, async_ok=0, async_failed=0, fills=%(funnel_fills)s, "
+    "gate_alerts=0, evolution_updates=0, evolution_rollbacks=0, evolution_skipped=0, "
+    "entry_edge_samples=1, entry_edge_avg_bps=2.0, entry_required_avg_bps=1.0}, "
+    "strategy_mix={latest_trend_notional="
+    "%(strategy_mix_latest_trend)s, latest_defensive_notional=%(strategy_mix_latest_defensive)s, "
+    "latest_blended_notional=%(strategy_mix_latest_blended)s, avg_abs_trend_notional=%(strategy_mix_avg_abs_trend)s, "
+    "avg_abs_defensive_notional=%(strategy_mix_avg_abs_defensive)s, avg_abs_blended_notional=%(strategy_mix_avg_abs_blended)s, "
+    "samples=%(strategy_mix_samples)s, policy_flat_samples=%(strategy_mix_policy_flat_samples)s}, "
+    "regime_current={symbol=BTCUSDT, regime=%(regime_bucket)s, bucket=%(regime_bucket)s, warmup=false}, "
+    "entry_gate={enabled=true, round_trip_cost_bps=13.0, "
+    "min_expected_edge_bps=1.0, required_edge_cap_bps=8.0, "
+    "near_miss_tolerance_bps=%(entry_gate_near_miss_tolerance_bps)s, "
+    "near_miss_maker_allow="
+    "%(entry_gate_near_miss_maker_allow)s, "
+    "near_miss_maker_max_gap_bps="
+    "%(entry_gate_near_miss_maker_max_gap_bps)s, "
+    "quality_guard_penalty_bps=0.0, "
+    "observed_filtered_ratio=%(entry_gate_observed_filtered_ratio)s, "
+    "observed_near_miss_ratio=%(entry_gate_observed_near_miss_ratio)s, "
+    "observed_near_miss_allowed_ratio=%(entry_gate_observed_near_miss_allowed_ratio)s}, "
+    "execution_window={filtered_cost_ratio="
+    "%(filtered_cost_ratio)s, filtered_cost_near_miss_ratio=%(filtered_cost_near_miss_ratio)s, "
+    "passed_cost_near_miss_ratio=%(passed_cost_near_miss_ratio)s, "
+    "rebalance_gap_avg_abs_usd=%(rebalance_gap_avg_abs_usd)s, "
+    "rebalance_gap_max_abs_usd=%(rebalance_gap_max_abs_usd)s, "
+    "rebalance_within_min_notional_avg_abs_usd="
+    "%(rebalance_within_min_notional_avg_abs_usd)s, "
+    "rebalance_within_min_notional_ratio=%(rebalance_within_min_notional_ratio)s, "
+    "min_rebalance_notional_usd=%(min_rebalance_notional_usd)s, "
+    "entry_edge_gap_avg_bps=%(entry_edge_gap_avg_bps)s, realized_net_delta_usd=0.0, "
+    "candidate_probe_cost_gate_samples=%(candidate_probe_cost_gate_samples)s, "
+    "candidate_probe_cost_gate_long_count=%(candidate_probe_cost_gate_long_count)s, "
+    "candidate_probe_cost_gate_short_count=%(candidate_probe_cost_gate_short_count)s, "
+    "candidate_probe_cost_gate_expected_edge_avg_bps="
+    "%(candidate_probe_cost_gate_expected_edge_avg_bps)s, "
+    "candidate_probe_cost_gate_required_edge_avg_bps="
+    "%(candidate_probe_cost_gate_required_edge_avg_bps)s, "
+    "candidate_probe_cost_gate_edge_gap_avg_bps="
+    "%(candidate_probe_cost_gate_edge_gap_avg_bps)s, "
+    "candidate_probe_cost_gate_edge_gap_max_bps="
+    "%(candidate_probe_cost_gate_edge_gap_max_bps)s, "
+    "candidate_probe_cost_gate_trend_ratio_avg="
+    "%(candidate_probe_cost_gate_trend_ratio_avg)s, "
+    "realized_net_per_fill=%(realized_net_per_fill)s, fee_delta_usd=0.0, "
+    "fee_bps_per_fill=%(fee_bps_per_fill)s, maker_fills=%(maker_fills)s, "
+    "taker_fills=%(taker_fills)s, unknown_fills=%(unknown_fills)s, "
+    "explicit_liquidity_fills=%(explicit_liquidity_fills)s, "
+    "fee_sign_fallback_fills=%(fee_sign_fallback_fills)s, "
+    "unknown_fill_ratio=%(unknown_fill_ratio)s, "
+    "explicit_liquidity_fill_ratio=%(explicit_liquidity_fill_ratio)s, "
+    "fee_sign_fallback_fill_ratio=%(fee_sign_fallback_fill_ratio)s, "
+    "maker_fee_bps=%(maker_fee_bps)s, taker_fee_bps=%(taker_fee_bps)s, "
+    "maker_fill_ratio=%(maker_fill_ratio)s}, "
+    "execution_quality_guard={enabled=true, "
+    "active=%(execution_quality_guard_active)s, bad_streak=0, good_streak=0, "
+    "no_fill_windows=%(execution_quality_guard_no_fill_windows)s, "
+    "min_fills=12, trigger_streak=2, release_streak=2, "
+    "min_realized_net_per_fill_usd=-0.005, max_fee_bps_per_fill=8.0, "
+    "applied_penalty_bps=%(execution_quality_guard_penalty_bps)s, "
+    "symbol_active_count=%(execution_quality_guard_symbol_active_count)s, "
+    "symbol_state_count=%(execution_quality_guard_symbol_state_count)s}, "
+    "reconcile_runtime={anomaly_streak="
+    "%(reconcile_anomaly_streak)s, healthy_streak=0, "
+    "anomaly_reduce_only=%(reconcile_anomaly_reduce_only)s, "
+    "anomaly_reduce_only_threshold=3, anomaly_halt_threshold=6, "
+    "anomaly_resume_threshold=3}, "
+    "integrator_mode=shadow, "
+    "gate_runtime={enabled=true, fail_streak=0, pass_streak=0, reduce_only=%(reduce_only)s, "
+    "reduce_only_cooldown_ticks=0, gate_halted=false, halt_cooldown_ticks=0, flat_ticks=0}}\n"
+)
+
+
+def _render_runtime_field(name: str, value: object) -> str:
+    if name in _RUNTIME_BOOL_FIELDS:
+        return _BOOL[bool(value)]
+    fmt = _RUNTIME_FIELD_FORMATS.get(name)
+    return str(value) if fmt is None else fmt % value
+
+
+# 默认值的文本形式只渲染一次；每行只需渲染被覆盖的字段。
+_RUNTIME_DEFAULT_TEXT = {
+    name: _render_runtime_field(name, value) for name, value in _RUNTIME_DEFAULTS.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _runtime_body(overrides: tuple) -> str:
+    # overrides 为 (字段名, 类型, 值) 元组；带上类型避免 True 与 1 命中同一缓存项。
+    values = dict(_RUNTIME_DEFAULT_TEXT)
+    for name, _, value in overrides:
+        values[name] = _render_runtime_field(name, value)
+    return _RUNTIME_BODY_TMPL % values
+
+
+def _runtime_line(tick: int, notional: float, **overrides) -> str:
+    unknown = overrides.keys() - _RUNTIME_DEFAULTS.keys()
+    if unknown:
+        raise TypeError(f"unknown runtime fields: {sorted(unknown)}")
+    body = _runtime_body(
+        (("notional", type(notional), notional),)
+        + tuple((name, type(value), value) for name, value in sorted(overrides.items()))
+    )
+    ts = _TS_CACHE.get(tick)
+    if ts is None:
+        ts = (_TS_BASE + dt.timedelta(seconds=tick)).strftime("%Y-%m-%d %H:%M:%S")
+        _TS_CACHE[tick] = ts
+    return _RUNTIME_LINE_FMT % (ts, tick, body)
+
+
+def _with_compose_prefix(text: str, prefix: str = "ai-trade  | ") -> str:
+    # 模拟 docker compose logs 输出：每行前加 "<service>  | "，一次 replace 完成。
+    if text.endswith("\n"):
+        return prefix + text[:-1].replace("\n", "\n" + prefix) + "\n"
+    return prefix + text.replace("\n", "\n" + prefix)
+
+
+class AssessRunLogTestBase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.S3_RULES = ASSESS.STAGE_RULES["S3"]
+        cls.S5_RULES = ASSESS.STAGE_RULES["S5"]
+        cls.DEPLOY_RULES = ASSESS.STAGE_RULES["DEPLOY"]
+        cls.SMOKE_RULES = ASSESS.STAGE_RULES["SMOKE"]
 
-class AssessRunLogTest(unittest.TestCase):
+    @staticmethod
+    def _has_reason(reasons, token):
+        # 原因文本都是单行，拼接后一次子串查找即可判断任一原因是否包含 token。
+        return token in "\n".join(reasons)
+
+
+class AssessRunLogTest(AssessRunLogTestBase):
     def test_report_only_preserves_fail_verdict_but_exits_successfully(self):
         script = pathlib.Path(__file__).with_name("assess_run_log.py")
         with tempfile.TemporaryDirectory() as tmp:
@@ -96,195 +370,95 @@ class AssessRunLogTest(unittest.TestCase):
             )
             self.assertEqual(missing_log.returncode, 2)
 
-    @staticmethod
-    def _runtime_line(
-        tick: int,
-        notional: float,
-        reduce_only: bool = False,
-        trading_halted: bool = False,
-        adapter_trade_ok: bool = True,
-        force_reduce_only: bool = False,
-        protection_reduce_only: bool = False,
-        gate_reduce_only: bool = False,
-        reconcile_reduce_only: bool = False,
-        public_ws_healthy: bool = True,
-        private_ws_healthy: bool = True,
-        funnel_enqueued: int = 0,
-        funnel_fills: int = 0,
-        strategy_mix_samples: int = 1,
-        strategy_mix_policy_flat_samples: int = 0,
-        strategy_mix_latest_trend: float = 180.0,
-        strategy_mix_latest_defensive: float = -60.0,
-        strategy_mix_latest_blended: float = 120.0,
-        strategy_mix_avg_abs_trend: float = 180.0,
-        strategy_mix_avg_abs_defensive: float = 60.0,
-        strategy_mix_avg_abs_blended: float = 120.0,
-        filtered_cost_ratio: float = 0.0,
-        filtered_cost_near_miss_ratio: float = 0.0,
-        passed_cost_near_miss_ratio: float = 0.0,
-        rebalance_gap_avg_abs_usd: float = 0.0,
-        rebalance_gap_max_abs_usd: float = 0.0,
-        rebalance_within_min_notional_avg_abs_usd: float = 0.0,
-        rebalance_within_min_notional_ratio: float = 0.0,
-        min_rebalance_notional_usd: float = 25.0,
-        entry_edge_gap_avg_bps: float = 0.0,
-        candidate_probe_cost_gate_samples: int = 0,
-        candidate_probe_cost_gate_long_count: int = 0,
-        candidate_probe_cost_gate_short_count: int = 0,
-        candidate_probe_cost_gate_expected_edge_avg_bps: float = 0.0,
-        candidate_probe_cost_gate_required_edge_avg_bps: float = 0.0,
-        candidate_probe_cost_gate_edge_gap_avg_bps: float = 0.0,
-        candidate_probe_cost_gate_edge_gap_max_bps: float = 0.0,
-        candidate_probe_cost_gate_trend_ratio_avg: float = 0.0,
-        realized_net_per_fill: float = 0.0,
-        fee_bps_per_fill: float = 0.0,
-        maker_fills: int = 0,
-        taker_fills: int = 0,
-        unknown_fills: int = 0,
-        explicit_liquidity_fills: int = 0,
-        fee_sign_fallback_fills: int = 0,
-        unknown_fill_ratio: float = 0.0,
-        explicit_liquidity_fill_ratio: float = 0.0,
-        fee_sign_fallback_fill_ratio: float = 0.0,
-        maker_fee_bps: float = 0.0,
-        taker_fee_bps: float = 0.0,
-        maker_fill_ratio: float = 0.0,
-        entry_gate_near_miss_tolerance_bps: float = 0.0,
-        entry_gate_near_miss_maker_allow: bool = False,
-        entry_gate_near_miss_maker_max_gap_bps: float = 0.0,
-        entry_gate_observed_filtered_ratio: float = 0.0,
-        entry_gate_observed_near_miss_ratio: float = 0.0,
-        entry_gate_observed_near_miss_allowed_ratio: float = 0.0,
-        concentration_top1_share: float = 0.0,
-        concentration_symbol_count: int = 0,
-        execution_quality_guard_active: bool = False,
-        execution_quality_guard_penalty_bps: float = 0.0,
-        execution_quality_guard_no_fill_windows: int = 0,
-        execution_quality_guard_symbol_active_count: int = 0,
-        execution_quality_guard_symbol_state_count: int = 0,
-        reconcile_anomaly_streak: int = 0,
-        reconcile_anomaly_reduce_only: bool = False,
-        regime_bucket: str = "RANGE",
-        equity: float = 100000.0,
-        realized_pnl: float = 0.0,
-        fees: float = 0.0,
-        realized_net: float = 0.0,
-        prefix: str = "",
-    ) -> str:
-        reduce_only_text = "true" if reduce_only else "false"
-        trading_halted_text = "true" if trading_halted else "false"
-        adapter_trade_ok_text = "true" if adapter_trade_ok else "false"
-        force_reduce_only_text = "true" if force_reduce_only else "false"
-        protection_reduce_only_text = "true" if protection_reduce_only else "false"
-        gate_reduce_only_text = "true" if gate_reduce_only else "false"
-        reconcile_reduce_only_text = "true" if reconcile_reduce_only else "false"
-        public_ws_healthy_text = "true" if public_ws_healthy else "false"
-        private_ws_healthy_text = "true" if private_ws_healthy else "false"
-        execution_quality_guard_active_text = (
-            "true" if execution_quality_guard_active else "false"
-        )
-        reconcile_anomaly_reduce_only_text = (
-            "true" if reconcile_anomaly_reduce_only else "false"
-        )
-        entry_gate_near_miss_maker_allow_text = (
-            "true" if entry_gate_near_miss_maker_allow else "false"
-        )
-        ts = (dt.datetime(2026, 2, 14, 15, 0, 0) + dt.timedelta(seconds=tick)).strftime(
-            "%Y-%m-%d %H:%M:%S"
-        )
-        return prefix + (
-            f"{ts} [INFO] RUNTIME_STATUS: ticks={tick}, "
-            f"trade_ok=true, trading_halted={trading_halted_text}, "
-            "ws={market_channel=public_ws, fill_channel=private_ws, "
-            f"public_ws_healthy={public_ws_healthy_text}, private_ws_healthy={private_ws_healthy_text}"
-            "}, "
-            "trade_health={"
-            f"adapter_trade_ok={adapter_trade_ok_text}, "
-            f"force_reduce_only={force_reduce_only_text}, "
-            f"protection_reduce_only={protection_reduce_only_text}, "
-            f"gate_reduce_only={gate_reduce_only_text}, "
-            f"reconcile_reduce_only={reconcile_reduce_only_text}, "
-            f"trading_halted={trading_halted_text}"
-            "}, "
-            f"account={{equity={equity:.6f}, drawdown_pct=0.000100, "
-            f"notional={notional:.6f}, realized_pnl={realized_pnl:.6f}, "
-            f"fees={fees:.6f}, realized_net={realized_net:.6f}}}, "
-            "concentration={gross_notional_usd=1000.0, top1_abs_notional_usd=800.0, "
-            f"top1_symbol=BTCUSDT, top1_share={concentration_top1_share}, "
-            f"symbol_count={concentration_symbol_count}}}, "
-            "funnel_window={raw=1, risk_adjusted=1, intents_generated=1, "
-            "intents_filtered_inactive_symbol=0, intents_filtered_min_notional=0, "
-            "intents_filtered_fee_aware=0, throttled=0, "
-            f"enqueued={funnel_enqueued}, async_ok=0, async_failed=0, fills={funnel_fills}, "
-            "gate_alerts=0, evolution_updates=0, evolution_rollbacks=0, evolution_skipped=0, "
-            "entry_edge_samples=1, entry_edge_avg_bps=2.0, entry_required_avg_bps=1.0}, "
-            "strategy_mix={latest_trend_notional="
-            f"{strategy_mix_latest_trend}, latest_defensive_notional={strategy_mix_latest_defensive}, "
-            f"latest_blended_notional={strategy_mix_latest_blended}, avg_abs_trend_notional={strategy_mix_avg_abs_trend}, "
-            f"avg_abs_defensive_notional={strategy_mix_avg_abs_defensive}, avg_abs_blended_notional={strategy_mix_avg_abs_blended}, "
-            f"samples={strategy_mix_samples}, policy_flat_samples={strategy_mix_policy_flat_samples}}}, "
-            f"regime_current={{symbol=BTCUSDT, regime={regime_bucket}, bucket={regime_bucket}, warmup=false}}, "
-            "entry_gate={enabled=true, round_trip_cost_bps=13.0, "
-            "min_expected_edge_bps=1.0, required_edge_cap_bps=8.0, "
-            f"near_miss_tolerance_bps={entry_gate_near_miss_tolerance_bps}, "
-            "near_miss_maker_allow="
-            f"{entry_gate_near_miss_maker_allow_text}, "
-            "near_miss_maker_max_gap_bps="
-            f"{entry_gate_near_miss_maker_max_gap_bps}, "
-            "quality_guard_penalty_bps=0.0, "
-            f"observed_filtered_ratio={entry_gate_observed_filtered_ratio}, "
-            f"observed_near_miss_ratio={entry_gate_observed_near_miss_ratio}, "
-            f"observed_near_miss_allowed_ratio={entry_gate_observed_near_miss_allowed_ratio}}}, "
-            "execution_window={filtered_cost_ratio="
-            f"{filtered_cost_ratio}, filtered_cost_near_miss_ratio={filtered_cost_near_miss_ratio}, "
-            f"passed_cost_near_miss_ratio={passed_cost_near_miss_ratio}, "
-            f"rebalance_gap_avg_abs_usd={rebalance_gap_avg_abs_usd}, "
-            f"rebalance_gap_max_abs_usd={rebalance_gap_max_abs_usd}, "
-            "rebalance_within_min_notional_avg_abs_usd="
-            f"{rebalance_within_min_notional_avg_abs_usd}, "
-            f"rebalance_within_min_notional_ratio={rebalance_within_min_notional_ratio}, "
-            f"min_rebalance_notional_usd={min_rebalance_notional_usd}, "
-            f"entry_edge_gap_avg_bps={entry_edge_gap_avg_bps}, realized_net_delta_usd=0.0, "
-            f"candidate_probe_cost_gate_samples={candidate_probe_cost_gate_samples}, "
-            f"candidate_probe_cost_gate_long_count={candidate_probe_cost_gate_long_count}, "
-            f"candidate_probe_cost_gate_short_count={candidate_probe_cost_gate_short_count}, "
-            "candidate_probe_cost_gate_expected_edge_avg_bps="
-            f"{candidate_probe_cost_gate_expected_edge_avg_bps}, "
-            "candidate_probe_cost_gate_required_edge_avg_bps="
-            f"{candidate_probe_cost_gate_required_edge_avg_bps}, "
-            "candidate_probe_cost_gate_edge_gap_avg_bps="
-            f"{candidate_probe_cost_gate_edge_gap_avg_bps}, "
-            "candidate_probe_cost_gate_edge_gap_max_bps="
-            f"{candidate_probe_cost_gate_edge_gap_max_bps}, "
-            "candidate_probe_cost_gate_trend_ratio_avg="
-            f"{candidate_probe_cost_gate_trend_ratio_avg}, "
-            f"realized_net_per_fill={realized_net_per_fill}, fee_delta_usd=0.0, "
-            f"fee_bps_per_fill={fee_bps_per_fill}, maker_fills={maker_fills}, "
-            f"taker_fills={taker_fills}, unknown_fills={unknown_fills}, "
-            f"explicit_liquidity_fills={explicit_liquidity_fills}, "
-            f"fee_sign_fallback_fills={fee_sign_fallback_fills}, "
-            f"unknown_fill_ratio={unknown_fill_ratio}, "
-            f"explicit_liquidity_fill_ratio={explicit_liquidity_fill_ratio}, "
-            f"fee_sign_fallback_fill_ratio={fee_sign_fallback_fill_ratio}, "
-            f"maker_fee_bps={maker_fee_bps}, taker_fee_bps={taker_fee_bps}, "
-            f"maker_fill_ratio={maker_fill_ratio}}}, "
-            "execution_quality_guard={enabled=true, "
-            f"active={execution_quality_guard_active_text}, bad_streak=0, good_streak=0, "
-            f"no_fill_windows={execution_quality_guard_no_fill_windows}, "
-            "min_fills=12, trigger_streak=2, release_streak=2, "
-            "min_realized_net_per_fill_usd=-0.005, max_fee_bps_per_fill=8.0, "
-            f"applied_penalty_bps={execution_quality_guard_penalty_bps}, "
-            f"symbol_active_count={execution_quality_guard_symbol_active_count}, "
-            f"symbol_state_count={execution_quality_guard_symbol_state_count}}}, "
-            "reconcile_runtime={anomaly_streak="
-            f"{reconcile_anomaly_streak}, healthy_streak=0, "
-            f"anomaly_reduce_only={reconcile_anomaly_reduce_only_text}, "
-            "anomaly_reduce_only_threshold=3, anomaly_halt_threshold=6, "
-            "anomaly_resume_threshold=3}, "
-            "integrator_mode=shadow, "
-            f"gate_runtime={{enabled=true, fail_streak=0, pass_streak=0, reduce_only={reduce_only_text}, "
-            "reduce_only_cooldown_ticks=0, gate_halted=false, halt_cooldown_ticks=0, flat_ticks=0}}\n"
+    def test_count_word_matches_word_boundary_regex(self):
+        text = (
+            "CRITICAL at start\n"
+            "2026-02-14 15:00:00 [CRITICAL] boom\n"
+            "NONCRITICAL CRITICAL_X _CRITICAL CRITICAL2 éCRITICAL\n"
+            "ws=DEGRADED, TRADING_HALTED; TRADING_HALTEDX\n"
+            "tail CRITICAL"
+        )
+        for word in ("CRITICAL", "TRADING_HALTED", "DEGRADED"):
+            self.assertEqual(
+                ASSESS.count_word(word, text),
+                ASSESS.count(rf"\b{word}\b", text),
+                msg=word,
+            )
+        self.assertEqual(ASSESS.count_word("CRITICAL", text), 3)
+
+    def test_count_literal_prefilter_matches_plain_findall(self):
+        text = (
+            "2026-02-14 15:00:00 [INFO] RUNTIME_STATUS: ticks=20, trade_ok=false\n"
+            "2026-02-14 15:00:01 [INFO] BYBIT_SUBMIT: symbol=BTCUSDT, order_type=Limit\n"
+            "2026-02-14 15:00:02 [INFO] ORDER_THROTTLED: symbol=BTCUSDT\n"
+        )
+        for pattern in (
+            r"RUNTIME_STATUS:.*trade_ok=false",
+            r"BYBIT_SUBMIT:.*order_type=Limit",
+            r"BYBIT_SUBMIT:.*order_type=Market",
+            r"FILL_OVERFILL_DROP",
+            r"ORDER_THROTTLED?:",
+            r"ORDER_(?:THROTTLED|FILTERED_COST):",
+        ):
+            self.assertEqual(
+                ASSESS.count(pattern, text),
+                len(re.findall(pattern, text, flags=re.MULTILINE)),
+                msg=pattern,
+            )
+        self.assertEqual(
+            ASSESS.count_literal_prefix(r"ORDER_THROTTLED?:"), "ORDER_THROTTLE"
+        )
+        self.assertEqual(ASSESS.count_literal_prefix(r"A|B"), "")
+
+    def test_parse_log_fields_matches_extract_log_field(self):
+        line = (
+            "2026-02-14 15:00:11 [INFO] FILL_APPLIED: fill_id=a1, symbol=BTCUSDT, "
+            "taker_fee=9, fee=0.01, qty=1.0, price=20.0, liquidity=maker, "
+            "meta={side=Sell}, side=Buy"
+        )
+        fields = ASSESS.parse_log_fields(line)
+        for key in ("fill_id", "symbol", "fee", "qty", "price", "liquidity", "side"):
+            self.assertEqual(
+                fields.get(key), ASSESS.extract_log_field(line, key), msg=key
+            )
+        self.assertNotIn("missing", fields)
+        self.assertEqual(ASSESS.extract_fill_direction(fields), -1)
+
+    def test_extract_log_field_respects_word_boundary_and_empty_values(self):
+        line = "fee=, taker_fee=9, xfee=7 fee=0.01}, fees_usd=2"
+        self.assertEqual(ASSESS.extract_log_field(line, "fee"), "0.01")
+        self.assertEqual(ASSESS.extract_log_field(line, "fees_usd"), "2")
+        self.assertEqual(ASSESS.extract_log_field("fee=3", "fee"), "3")
+        self.assertIsNone(ASSESS.extract_log_field(line, "maker_fee"))
+        self.assertIsNone(ASSESS.extract_float_log_field("fee=abc", "fee"))
+
+    def test_iter_lines_containing_matches_splitlines_filter(self):
+        text = (
+            "EXIT_CAPTURE_SAMPLE: symbol=BTCUSDT\n"
+            "2026-02-14 15:00:00 [INFO] RUNTIME_STATUS: ticks=20\n"
+            "\n"
+            "a EXIT_CAPTURE_SAMPLE: x EXIT_CAPTURE_SAMPLE: y\n"
+            "tail EXIT_CAPTURE_SAMPLE: z"
         )
+        for marker in ("EXIT_CAPTURE_SAMPLE:", "RUNTIME_STATUS:", "MISSING"):
+            self.assertEqual(
+                list(ASSESS.iter_lines_containing(text, marker)),
+                [line for line in text.splitlines() if marker in line],
+                msg=marker,
+            )
+
+    def test_iter_log_lines_matches_splitlines(self):
+        for text in (
+            "",
+            "\n",
+            "a\nb",
+            "a\n\nb\n",
+            "a\r\nb\r\n",
+            "RUNTIME_STATUS: ticks=1\nFILL_APPLIED: qty=1",
+        ):
+            self.assertEqual(
+                list(ASSESS.iter_log_lines(text)), text.splitlines(), msg=repr(text)
+            )
 
     def test_extract_strategy_mix_series_active(self):
         text = (
@@ -307,14 +481,14 @@ class AssessRunLogTest(unittest.TestCase):
         self.assertGreater(series["avg_defensive_share"], 0.0)
 
     def test_gate_reduce_only_metric_scoped_to_gate_runtime(self):
-        text = self._runtime_line(
+        text = _runtime_line(
             20,
             0.0,
             reduce_only=False,
             reconcile_anomaly_streak=6,
             reconcile_anomaly_reduce_only=True,
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["gate_reduce_only_true_count"], 0)
         self.assertEqual(metrics["reconcile_anomaly_reduce_only_true_count"], 1)
@@ -360,7 +534,7 @@ class AssessRunLogTest(unittest.TestCase):
         text = (
             "2026-02-14 15:02:18 [INFO] FEATURES: "
             "miner_00=-0.1, miner_01=75230.7, miner_02=-2046.1\n"
-            + self._runtime_line(
+            + _runtime_line(
                 20,
                 0.0,
                 strategy_mix_samples=0,
@@ -369,7 +543,7 @@ class AssessRunLogTest(unittest.TestCase):
             + "2026-02-14 15:00:20 [INFO] SELF_EVOLUTION_INIT: enabled=true\n"
             + "2026-02-14 15:00:21 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["feature_line_count"], 1)
         self.assertEqual(metrics["feature_large_abs_line_count"], 1)
@@ -385,7 +559,7 @@ class AssessRunLogTest(unittest.TestCase):
             "skip_count=1, symbol=BTCUSDT, regime=RANGE, bucket=RANGE, "
             "raw_regime=RANGE, raw_bucket=RANGE, feature_index=3, "
             "feature_name=miner_03, raw_value=nan, model_version=integrator_v1\n"
-            + self._runtime_line(
+            + _runtime_line(
                 20,
                 0.0,
                 strategy_mix_samples=0,
@@ -394,7 +568,7 @@ class AssessRunLogTest(unittest.TestCase):
             + "2026-02-14 15:00:20 [INFO] SELF_EVOLUTION_INIT: enabled=true\n"
             + "2026-02-14 15:00:21 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["integrator_nan_feature_skip_count"], 1)
         self.assertEqual(metrics["integrator_nan_feature_skip_by_feature"]["miner_03"], 1)
@@ -411,7 +585,7 @@ class AssessRunLogTest(unittest.TestCase):
             "raw_regime=RANGE, raw_bucket=RANGE, feature_index=0, "
             "feature_name=miner_00, raw_value=inf, sanitized_value=0, "
             "model_version=integrator_v1\n"
-            + self._runtime_line(
+            + _runtime_line(
                 20,
                 0.0,
                 strategy_mix_samples=0,
@@ -420,7 +594,7 @@ class AssessRunLogTest(unittest.TestCase):
             + "2026-02-14 15:00:20 [INFO] SELF_EVOLUTION_INIT: enabled=true\n"
             + "2026-02-14 15:00:21 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["integrator_feature_sanitized_count"], 1)
         self.assertEqual(
@@ -446,7 +620,7 @@ class AssessRunLogTest(unittest.TestCase):
             "realized_net_delta_usd=0.0, realized_net_per_fill=0.0, fee_delta_usd=0.0, "
             "fee_bps_per_fill=0.0}, integrator_mode=shadow\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["DEPLOY"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.DEPLOY_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["strategy_mix_runtime_count"], 1)
         self.assertEqual(metrics["strategy_mix_defensive_active_count"], 1)
@@ -537,7 +711,7 @@ class AssessRunLogTest(unittest.TestCase):
 
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["SMOKE"],
+            self.SMOKE_RULES,
             min_runtime_status=0,
         )
 
@@ -672,7 +846,7 @@ class AssessRunLogTest(unittest.TestCase):
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["SMOKE"],
+            self.SMOKE_RULES,
             min_runtime_status=0,
         )
         metrics = report["metrics"]
@@ -683,199 +857,9 @@ class AssessRunLogTest(unittest.TestCase):
         )
         self.assertEqual(metrics["integrator_model_version_latest"], "model-v1")
 
-    def test_s5_policy_flat_window_is_warn_not_fail(self):
-        text = (
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: bucket=RANGE\n"
-            "2026-02-14 15:00:01 [INFO] SELF_EVOLUTION_ACTION: source=counterfactual\n"
-            + self._runtime_line(
-                20,
-                0.0,
-                funnel_enqueued=0,
-                funnel_fills=0,
-                strategy_mix_samples=0,
-                strategy_mix_policy_flat_samples=12,
-                strategy_mix_latest_trend=0.0,
-                strategy_mix_latest_defensive=0.0,
-                strategy_mix_latest_blended=0.0,
-                strategy_mix_avg_abs_trend=0.0,
-                strategy_mix_avg_abs_defensive=0.0,
-                strategy_mix_avg_abs_blended=0.0,
-            )
-            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
-        )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
-        self.assertNotIn("未检测到 GATE_CHECK_PASSED（S5 要求至少一个通过窗口）", report["fail_reasons"])
-        self.assertNotIn("未检测到有效策略信号窗口（strategy_mix.samples>0），S5 至少要求 1 个窗口", report["fail_reasons"])
-        self.assertNotIn("执行样本不足（S5 强门禁）", "\n".join(report["fail_reasons"]))
-        self.assertEqual(report["protection_status"], "PASS")
-        self.assertEqual(report["execution_status"], "NOT_EVALUATED")
-        self.assertEqual(report["runtime_validation_mode"], "POLICY_FLAT_PROTECTION")
-        self.assertEqual(report["market_context_status"], "RANGE_ONLY")
-        self.assertEqual(report["account_sync_status"], "OK")
-        self.assertIn("策略窗口以 policy-flat 为主", "\n".join(report["warn_reasons"]))
-        self.assertIn("等待趋势样本阶段", "\n".join(report["warn_reasons"]))
-
-    def test_s5_policy_flat_open_position_fails(self):
-        text = (
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: bucket=RANGE\n"
-            "2026-02-14 15:00:01 [INFO] SELF_EVOLUTION_ACTION: source=counterfactual\n"
-            "2026-02-14 15:00:10 [INFO] POLICY_FLAT_RESIDUAL_POSITION: symbol=BNBUSDT, current_notional=-378.000000, has_reduce_intent=false\n"
-            + self._runtime_line(
-                20,
-                378.0,
-                funnel_enqueued=0,
-                funnel_fills=0,
-                strategy_mix_samples=0,
-                strategy_mix_policy_flat_samples=12,
-                strategy_mix_latest_trend=0.0,
-                strategy_mix_latest_defensive=0.0,
-                strategy_mix_latest_blended=0.0,
-                strategy_mix_avg_abs_trend=0.0,
-                strategy_mix_avg_abs_defensive=0.0,
-                strategy_mix_avg_abs_blended=0.0,
-            )
-            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
-        )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
-        self.assertEqual(report["account_sync_status"], "POLICY_FLAT_OPEN_POSITION")
-        self.assertEqual(report["execution_status"], "FAIL")
-        self.assertEqual(report["metrics"]["policy_flat_residual_position_count"], 1)
-        self.assertIn("policy-flat 窗口结束仍有残余仓位", "\n".join(report["fail_reasons"]))
-        self.assertIn("policy-flat 窗口仍检测到残余仓位", "\n".join(report["warn_reasons"]))
-
-    def test_s5_policy_flat_window_accepts_runtime_evolution_enabled_as_init_evidence(self):
-        runtime_line = self._runtime_line(
-            20,
-            0.0,
-            funnel_enqueued=0,
-            funnel_fills=0,
-            strategy_mix_samples=0,
-            strategy_mix_policy_flat_samples=12,
-            strategy_mix_latest_trend=0.0,
-            strategy_mix_latest_defensive=0.0,
-            strategy_mix_latest_blended=0.0,
-            strategy_mix_avg_abs_trend=0.0,
-            strategy_mix_avg_abs_defensive=0.0,
-            strategy_mix_avg_abs_blended=0.0,
-        )
-        runtime_line = runtime_line[:-1] + (
-            ", evolution={enabled=true, active_bucket=RANGE, active_trend_weight=0.5, "
-            "active_defensive_weight=0.5, next_eval_tick=600, cooldown=false, "
-            "cooldown_remaining_ticks=0}\n"
-        )
-        text = (
-            runtime_line
-            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
-        )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
-        self.assertEqual(report["verdict"], "PASS_WITH_ACTIONS")
-        self.assertNotIn(
-            "未检测到 SELF_EVOLUTION_INIT/SELF_EVOLUTION_ACTION",
-            report["fail_reasons"],
-        )
-        self.assertEqual(
-            report["metrics"]["self_evolution_runtime_enabled_total_count"], 1
-        )
-
-    def test_s5_warns_when_assess_window_is_fresh_boot(self):
-        runtime_line = self._runtime_line(
-            20,
-            0.0,
-            funnel_enqueued=0,
-            funnel_fills=0,
-            strategy_mix_samples=0,
-            strategy_mix_policy_flat_samples=12,
-            strategy_mix_latest_trend=0.0,
-            strategy_mix_latest_defensive=0.0,
-            strategy_mix_latest_blended=0.0,
-            strategy_mix_avg_abs_trend=0.0,
-            strategy_mix_avg_abs_defensive=0.0,
-            strategy_mix_avg_abs_blended=0.0,
-        )
-        runtime_line = runtime_line[:-1] + (
-            ", evolution={enabled=true, active_bucket=RANGE, active_trend_weight=0.5, "
-            "active_defensive_weight=0.5, next_eval_tick=600, cooldown=false, "
-            "cooldown_remaining_ticks=0}\n"
-        )
-        text = (
-            "2026-02-14 15:00:00 [INFO] PROCESS_START: "
-            "boot_id=boot-test, startup_utc=2026-02-14T15:00:00Z, "
-            "primary_symbol=BTCUSDT\n"
-            + runtime_line
-            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
-        )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
-        self.assertEqual(report["metrics"]["runtime_boot_age_seconds"], 20.0)
-        self.assertEqual(report["metrics"]["runtime_boot_id_latest"], "boot-test")
-        self.assertIn("运行进程启动时间过短", "\n".join(report["warn_reasons"]))
-
-    def test_s5_runtime_boot_startup_fallback_when_process_start_filtered(self):
-        runtime_line = self._runtime_line(
-            20,
-            0.0,
-            funnel_enqueued=0,
-            funnel_fills=0,
-            strategy_mix_samples=0,
-            strategy_mix_policy_flat_samples=12,
-            strategy_mix_latest_trend=0.0,
-            strategy_mix_latest_defensive=0.0,
-            strategy_mix_latest_blended=0.0,
-            strategy_mix_avg_abs_trend=0.0,
-            strategy_mix_avg_abs_defensive=0.0,
-            strategy_mix_avg_abs_blended=0.0,
-        )
-        runtime_line = runtime_line.replace(
-            "RUNTIME_STATUS: ticks=20, ",
-            "RUNTIME_STATUS: ticks=20, "
-            "boot={id=boot-fallback, startup_utc=2026-02-14T15:00:00Z}, ",
-        )
-        runtime_line = runtime_line[:-1] + (
-            ", evolution={enabled=true, active_bucket=RANGE, active_trend_weight=0.5, "
-            "active_defensive_weight=0.5, next_eval_tick=600, cooldown=false, "
-            "cooldown_remaining_ticks=0}\n"
-        )
-        text = (
-            runtime_line
-            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
-        )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
-        self.assertEqual(
-            report["metrics"]["process_start_utc"], "2026-02-14T15:00:00Z"
-        )
-        self.assertEqual(report["metrics"]["runtime_boot_age_seconds"], 20.0)
-        self.assertEqual(
-            report["metrics"]["runtime_boot_id_latest"], "boot-fallback"
-        )
-        self.assertIn("运行进程启动时间过短", "\n".join(report["warn_reasons"]))
-
-    def test_s5_policy_flat_window_without_evolution_evidence_still_fails(self):
-        text = (
-            self._runtime_line(
-                20,
-                0.0,
-                funnel_enqueued=0,
-                funnel_fills=0,
-                strategy_mix_samples=0,
-                strategy_mix_policy_flat_samples=12,
-                strategy_mix_latest_trend=0.0,
-                strategy_mix_latest_defensive=0.0,
-                strategy_mix_latest_blended=0.0,
-                strategy_mix_avg_abs_trend=0.0,
-                strategy_mix_avg_abs_defensive=0.0,
-                strategy_mix_avg_abs_blended=0.0,
-            )
-            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
-        )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
-        self.assertEqual(report["verdict"], "FAIL")
-        self.assertIn(
-            "未检测到 SELF_EVOLUTION_INIT/SELF_EVOLUTION_ACTION",
-            report["fail_reasons"],
-        )
-
     def test_policy_flat_runtime_exempt_count_is_reported(self):
         text = (
-            self._runtime_line(
+            _runtime_line(
                 20,
                 0.0,
                 funnel_enqueued=0,
@@ -893,7 +877,7 @@ class AssessRunLogTest(unittest.TestCase):
             + "2026-02-14 15:00:21 [INFO] GATE_RUNTIME_POLICY_FLAT_EXEMPT: policy_flat_signals=2, fail_streak_before=1\n"
             + "2026-02-14 15:00:22 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=2, policy_flat=true\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
         self.assertEqual(report["metrics"]["gate_runtime_policy_flat_exempt_count"], 1)
         self.assertIn(
             "Gate runtime 已豁免 policy-flat 部分窗口",
@@ -902,7 +886,7 @@ class AssessRunLogTest(unittest.TestCase):
 
     def test_flat_without_execution_but_large_equity_gap_marks_account_noise(self):
         text = (
-            self._runtime_line(
+            _runtime_line(
                 20,
                 0.0,
                 funnel_enqueued=0,
@@ -921,7 +905,7 @@ class AssessRunLogTest(unittest.TestCase):
                 fees=0.0,
                 realized_net=0.0,
             )
-            + self._runtime_line(
+            + _runtime_line(
                 40,
                 0.0,
                 funnel_enqueued=0,
@@ -942,10 +926,10 @@ class AssessRunLogTest(unittest.TestCase):
             )
             + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=8, policy_flat=true\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
         self.assertEqual(report["account_sync_status"], "EQUITY_DRIFT_WHILE_FLAT")
         self.assertFalse(
-            any("平仓且零执行窗口出现权益漂移" in x for x in report["warn_reasons"])
+            self._has_reason(report["warn_reasons"], "平仓且零执行窗口出现权益漂移")
         )
 
     def test_extract_runtime_account_series_rebases_cumulative_counters_after_restart(self):
@@ -977,6 +961,23 @@ class AssessRunLogTest(unittest.TestCase):
             series["realized_net_pnl_change_usd"], -6.2, places=6
         )
 
+    def test_extract_runtime_account_series_accepts_compose_prefix(self):
+        text = (
+            "ai-trade-1  | 2026-02-14 15:00:20 [INFO] RUNTIME_STATUS: ticks=20, "
+            "account={equity=100000.000000, drawdown_pct=0.000100, notional=0.000000, "
+            "realized_pnl=5.000000, fees=10.000000, realized_net=-5.000000}\n"
+            "ai-trade-1  | 2026-02-14 15:00:40 [INFO] RUNTIME_STATUS: ticks=40, "
+            "account={equity=99990.000000, drawdown_pct=0.000200, notional=0.000000, "
+            "realized_pnl=6.000000, fees=12.000000, realized_net=-6.000000}\n"
+            "note 2026-02-14 15:01:00 [INFO] RUNTIME_STATUS: ticks=60, "
+            "account={equity=1.000000, drawdown_pct=0.000300, notional=0.000000, "
+            "realized_pnl=0.500000, fees=0.200000, realized_net=0.300000}\n"
+        )
+        series = ASSESS.extract_runtime_account_series(text)
+        self.assertEqual(series["account_counter_reset_count"], 0)
+        self.assertAlmostEqual(series["realized_pnl_change_raw_usd"], 1.0, places=6)
+        self.assertAlmostEqual(series["fee_change_raw_usd"], 2.0, places=6)
+
     def test_cross_boot_unattributed_equity_delta_is_explicit(self):
         continuity = (
             "2026-08-06 15:00:00 [INFO] ACCOUNT_EQUITY_CONTINUITY: "
@@ -989,7 +990,7 @@ class AssessRunLogTest(unittest.TestCase):
             "current_fill_count=4465, previous_positions_flat=true, "
             "current_positions_flat=true\n"
         )
-        text = continuity + self._runtime_line(
+        text = continuity + _runtime_line(
             20,
             0.0,
             funnel_enqueued=0,
@@ -1000,7 +1001,7 @@ class AssessRunLogTest(unittest.TestCase):
             realized_net=0.0,
         )
         smoke = ASSESS.assess(
-            text, ASSESS.STAGE_RULES["SMOKE"], min_runtime_status=1
+            text, self.SMOKE_RULES, min_runtime_status=1
         )
         self.assertEqual(
             smoke["account_sync_status"], "CROSS_BOOT_EQUITY_UNATTRIBUTED"
@@ -1010,12 +1011,12 @@ class AssessRunLogTest(unittest.TestCase):
         )
         self.assertIn("跨进程权益变化无法", "\n".join(smoke["warn_reasons"]))
 
-        s5 = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
+        s5 = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
         self.assertIn("S5 盈利证据不连续", "\n".join(s5["fail_reasons"]))
 
     def test_open_position_gap_is_not_marked_as_noisy(self):
         text = (
-            self._runtime_line(
+            _runtime_line(
                 20,
                 0.0,
                 funnel_enqueued=0,
@@ -1028,7 +1029,7 @@ class AssessRunLogTest(unittest.TestCase):
                 fees=0.0,
                 realized_net=0.0,
             )
-            + self._runtime_line(
+            + _runtime_line(
                 40,
                 120.0,
                 funnel_enqueued=0,
@@ -1042,10 +1043,10 @@ class AssessRunLogTest(unittest.TestCase):
                 realized_net=0.0,
             )
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         self.assertEqual(report["account_sync_status"], "OPEN_POSITION_GAP")
         self.assertTrue(
-            any("末尾仍有持仓" in item for item in report["warn_reasons"])
+            self._has_reason(report["warn_reasons"], "末尾仍有持仓")
         )
 
     def test_assess_extracts_regime_change_distribution_metrics(self):
@@ -1053,9 +1054,9 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:00:01 [INFO] REGIME_CHANGE: symbol=BTCUSDT, regime=RANGE, bucket=RANGE, warmup=false, decision_interval_ms=5000, aggregated_events=5, instant_return=0.001000, trend_strength=0.000100, volatility=0.000200\n"
             "2026-02-14 15:00:06 [INFO] REGIME_CHANGE: symbol=ETHUSDT, regime=RANGE, bucket=RANGE, warmup=false, decision_interval_ms=5000, aggregated_events=7, instant_return=-0.002000, trend_strength=-0.000200, volatility=0.000300\n"
             "2026-02-14 15:00:11 [INFO] REGIME_CHANGE: symbol=SOLUSDT, regime=RANGE, bucket=RANGE, warmup=false, decision_interval_ms=5000, aggregated_events=9, instant_return=0.001500, trend_strength=0.000300, volatility=0.000500\n"
-            + self._runtime_line(20, 0.0)
+            + _runtime_line(20, 0.0)
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["regime_change_count"], 3)
         self.assertAlmostEqual(metrics["trend_strength_abs_max"], 0.0003, places=8)
@@ -1068,7 +1069,7 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:00:01 [INFO] REGIME_CHANGE: symbol=BTCUSDT, regime=RANGE, bucket=RANGE, warmup=false, decision_interval_ms=5000, aggregated_events=5, instant_return=0.000200, trend_strength=0.000210, volatility=0.000090, trend_threshold_ratio=0.700000, volatility_threshold_ratio=0.036000, trend_candidate=true\n"
             "2026-02-14 15:00:20 [INFO] RUNTIME_STATUS: ticks=20, trade_ok=true, trading_halted=false, account={equity=100000.000000, drawdown_pct=0.000000, notional=0.000000, realized_pnl=0.000000, fees=0.000000, realized_net=0.000000}, regime_window={trend_ticks=0, range_ticks=4, extreme_ticks=0, warmup_ticks=0, trend_candidate_ticks=4}, regime_current={symbol=BTCUSDT, regime=RANGE, bucket=RANGE, warmup=false, decision_interval_ms=5000, aggregated_events=5, trend_threshold_ratio=0.700000, volatility_threshold_ratio=0.036000, trend_candidate=true}\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(report["market_context_status"], "TREND_CANDIDATE")
         self.assertEqual(metrics["regime_change_trend_candidate_count"], 1)
@@ -1085,7 +1086,7 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:00:01 [INFO] REGIME_CHANGE: symbol=SOLUSDT, regime=RANGE, bucket=RANGE, warmup=false, decision_interval_ms=5000, aggregated_events=5, instant_return=0.000200, trend_strength=0.000360, volatility=0.000090, trend_threshold_ratio=1.200000, volatility_threshold_ratio=0.036000, trend_candidate=true, warmup_trend_candidate=false, raw_regime=UPTREND, raw_bucket=TREND, pending_regime=UPTREND, pending_bucket=TREND, pending_regime_ticks=3, confirm_ticks_required=5, pending_regime_elapsed_ms=15000, confirm_elapsed_ms_required=25000, pending_trend_confirmation=true\n"
             "2026-02-14 15:00:20 [INFO] RUNTIME_STATUS: ticks=20, trade_ok=true, trading_halted=false, account={equity=100000.000000, drawdown_pct=0.000000, notional=0.000000, realized_pnl=0.000000, fees=0.000000, realized_net=0.000000}, regime_window={trend_ticks=0, range_ticks=4, extreme_ticks=0, warmup_ticks=0, trend_candidate_ticks=4}, regime_current={symbol=SOLUSDT, regime=RANGE, bucket=RANGE, warmup=false, decision_interval_ms=5000, aggregated_events=5, trend_threshold_ratio=1.200000, volatility_threshold_ratio=0.036000, trend_candidate=true, warmup_trend_candidate=false, raw_regime=UPTREND, raw_bucket=TREND, pending_regime=UPTREND, pending_bucket=TREND, pending_regime_ticks=3, confirm_ticks_required=5, pending_regime_elapsed_ms=15000, confirm_elapsed_ms_required=25000, pending_trend_confirmation=true}\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["regime_change_pending_trend_confirmation_count"], 1)
         self.assertEqual(
@@ -1096,12 +1097,115 @@ class AssessRunLogTest(unittest.TestCase):
         self.assertEqual(metrics["regime_current_pending_trend_confirmation_count"], 1)
         self.assertEqual(metrics["regime_current_pending_trend_confirmation_ticks_max"], 3)
 
+    def test_regime_runtime_diagnostics_skip_malformed_blocks(self):
+        # 原整行正则拒绝的取值（nan、空值、带符号的无符号字段）仍须整条跳过，
+        # 畸形的 pending 确认组只作废该组而不作废样本。
+        prefix = "2026-02-14 15:00:20 [INFO] RUNTIME_STATUS: ticks=20, "
+        pending = (
+            "raw_regime=UPTREND, raw_bucket=TREND, pending_regime=UPTREND, "
+            "pending_bucket=TREND, pending_regime_ticks={ticks}, "
+            "confirm_ticks_required=5, pending_regime_elapsed_ms=15000, "
+            "confirm_elapsed_ms_required=25000, pending_trend_confirmation=true"
+        )
+        text = "".join(
+            prefix + f"regime_window={{{window}}}, regime_current={{{current}}}\n"
+            for window, current in (
+                (
+                    "trend_candidate_ticks=4",
+                    "trend_threshold_ratio=0.700000, trend_candidate=true, "
+                    + pending.format(ticks=3),
+                ),
+                ("trend_candidate_ticks=nan", "trend_threshold_ratio=nan, trend_candidate=true"),
+                ("trend_candidate_ticks=", "trend_threshold_ratio=, trend_candidate=true"),
+                ("trend_candidate_ticks=+4", "trend_threshold_ratio=-0.700000, trend_candidate=true"),
+                (
+                    "trend_candidate_ticks=0",
+                    "trend_threshold_ratio=0.500000, volatility_threshold_ratio=nan, "
+                    "trend_candidate=true",
+                ),
+                (
+                    "trend_candidate_ticks=0",
+                    "trend_threshold_ratio=0.600000, trend_candidate=false, "
+                    + pending.format(ticks="+9"),
+                ),
+            )
+        )
+        diagnostics = ASSESS.extract_regime_runtime_diagnostics(text)
+        self.assertEqual(diagnostics["runtime_count"], 2)
+        self.assertEqual(diagnostics["current_candidate_count"], 1)
+        self.assertAlmostEqual(diagnostics["trend_threshold_ratio_max"], 0.7, places=6)
+        self.assertEqual(diagnostics["current_pending_trend_confirmation_count"], 1)
+        self.assertEqual(diagnostics["pending_trend_confirmation_ticks_max"], 3)
+        self.assertEqual(diagnostics["window_candidate_count"], 1)
+
+    def test_runtime_block_series_skip_malformed_blocks(self):
+        prefix = "2026-02-14 15:00:20 [INFO] RUNTIME_STATUS: ticks=20, "
+        concentration = (
+            "concentration={{gross_notional_usd={gross}, top1_abs_notional_usd=800.0, "
+            "top1_symbol={symbol}, top1_share=0.8, symbol_count={count}}}"
+        )
+        guard = (
+            "execution_quality_guard={{enabled=true, active=true, bad_streak=2, "
+            "good_streak=0, no_fill_windows=1, min_fills={min_fills}, "
+            "trigger_streak=3, release_streak=2, "
+            "min_realized_net_per_fill_usd=-0.5, max_fee_bps_per_fill=4.0, "
+            "applied_penalty_bps={penalty}, symbol_active_count={active}, "
+            "symbol_state_count=2}}"
+        )
+        reconcile = (
+            "reconcile_runtime={{anomaly_streak={streak}, healthy_streak=0, "
+            "anomaly_reduce_only=true, anomaly_reduce_only_threshold=3, "
+            "anomaly_halt_threshold={halt}, anomaly_resume_threshold=2}}"
+        )
+        rows = (
+            ("1000.0", "BTCUSDT", "2", "1", "1.5", "1", "1", "5"),
+            ("nan", "BTCUSDT", "2", "", "1.5", "1", "", "5"),
+            ("1000.0", "", "+2", "nan", "nan", "1", "+1", "5"),
+            ("", "BTCUSDT", "-2", "1", "+1.5", "nan", "1", "nan"),
+        )
+        text = "".join(
+            prefix
+            + ", ".join(
+                (
+                    concentration.format(gross=gross, symbol=symbol, count=count),
+                    guard.format(min_fills=min_fills, penalty=penalty, active=active),
+                    reconcile.format(streak=streak, halt=halt),
+                )
+            )
+            + "\n"
+            for gross, symbol, count, min_fills, penalty, active, streak, halt in rows
+        )
+        concentration_series = ASSESS.extract_concentration_series(text)
+        self.assertEqual(concentration_series["runtime_count"], 1.0)
+        self.assertAlmostEqual(concentration_series["gross_notional_avg"], 1000.0)
+        guard_series = ASSESS.extract_execution_quality_guard_series(text)
+        self.assertEqual(guard_series["runtime_count"], 1.0)
+        self.assertAlmostEqual(guard_series["applied_penalty_bps_avg"], 1.5)
+        reconcile_series = ASSESS.extract_reconcile_runtime_series(text)
+        self.assertEqual(reconcile_series["runtime_count"], 1.0)
+        self.assertEqual(reconcile_series["anomaly_streak_max"], 1.0)
+
+    def test_runtime_guard_series_drops_malformed_symbol_counts_only(self):
+        text = (
+            "2026-02-14 15:00:20 [INFO] RUNTIME_STATUS: ticks=20, "
+            "execution_quality_guard={enabled=true, active=false, bad_streak=0, "
+            "good_streak=4, no_fill_windows=0, min_fills=1, trigger_streak=3, "
+            "release_streak=2, min_realized_net_per_fill_usd=-0.5, "
+            "max_fee_bps_per_fill=4.0, applied_penalty_bps=0.0, "
+            "symbol_active_count=nan, symbol_state_count=2}\n"
+        )
+        guard_series = ASSESS.extract_execution_quality_guard_series(text)
+        self.assertEqual(guard_series["runtime_count"], 1.0)
+        self.assertEqual(guard_series["good_streak_max"], 4.0)
+        self.assertEqual(guard_series["symbol_active_count_max"], 0.0)
+        self.assertEqual(guard_series["symbol_state_count_max"], 0.0)
+
     def test_warmup_trend_candidate_context_is_reported(self):
         text = (
             "2026-02-14 15:00:01 [INFO] REGIME_CHANGE: symbol=SOLUSDT, regime=RANGE, bucket=RANGE, warmup=true, decision_interval_ms=5000, aggregated_events=5, instant_return=0.000500, trend_strength=0.000700, volatility=0.000200, trend_threshold_ratio=0.700000, volatility_threshold_ratio=0.080000, trend_candidate=false, warmup_trend_candidate=true\n"
             "2026-02-14 15:00:20 [INFO] RUNTIME_STATUS: ticks=20, trade_ok=true, trading_halted=false, account={equity=100000.000000, drawdown_pct=0.000000, notional=0.000000, realized_pnl=0.000000, fees=0.000000, realized_net=0.000000}, regime_window={trend_ticks=0, range_ticks=4, extreme_ticks=0, warmup_ticks=4, trend_candidate_ticks=0, warmup_trend_candidate_ticks=4}, regime_current={symbol=SOLUSDT, regime=RANGE, bucket=RANGE, warmup=true, decision_interval_ms=5000, aggregated_events=5, trend_threshold_ratio=0.700000, volatility_threshold_ratio=0.080000, trend_candidate=false, warmup_trend_candidate=true}\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(report["market_context_status"], "RANGE_ONLY")
         self.assertEqual(metrics["regime_change_warmup_trend_candidate_count"], 1)
@@ -1134,7 +1238,7 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:00:05 [INFO] TREND_CANDIDATE_PROBE_SKIPPED: symbol=BTCUSDT, reason=ACTIVE_PROBE, trend_threshold_ratio=0.85, current_notional_usd=0.0, market_tick=24\n"
             "2026-02-14 15:00:20 [INFO] RUNTIME_STATUS: ticks=20, trade_ok=true, trading_halted=false, account={equity=100000.000000, drawdown_pct=0.000000, notional=0.000000, realized_pnl=0.000000, fees=0.000000, realized_net=0.000000}, funnel_window={raw=1, risk_adjusted=1, intents_generated=1, candidate_probe_signals=1, candidate_probe_strong_signals=1, candidate_probe_intents=1, candidate_probe_fee_overrides=1, candidate_probe_enqueued=1, candidate_probe_fills=1, candidate_probe_skipped_trend_ratio=1, candidate_probe_skipped_strong_trend_ratio=1, candidate_probe_skipped_cooldown=1, fills=1}, regime_window={trend_ticks=0, range_ticks=4, extreme_ticks=0, warmup_ticks=0, trend_candidate_ticks=4}, regime_current={symbol=BTCUSDT, regime=RANGE, bucket=RANGE, warmup=false, trend_threshold_ratio=0.910000, trend_candidate=true}\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["trend_candidate_probe_signal_count"], 1)
         self.assertEqual(metrics["trend_candidate_probe_strong_signal_count"], 1)
@@ -1177,7 +1281,7 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:00:05 [INFO] TREND_CANDIDATE_PROBE_SKIPPED: symbol=SOLUSDT, reason=WINDOW_LIMIT, trend_threshold_ratio=0.74, current_notional_usd=0.0, market_tick=25, max_per_window=3\n"
             "2026-02-14 15:00:20 [INFO] RUNTIME_STATUS: ticks=20, trade_ok=true, trading_halted=false, account={equity=100000.000000, drawdown_pct=0.000000, notional=0.000000, realized_pnl=0.000000, fees=0.000000, realized_net=0.000000}, funnel_window={raw=0, risk_adjusted=0, intents_generated=3, candidate_probe_signals=3, candidate_probe_filtered_fee=3, candidate_probe_enqueued=0, candidate_probe_skipped_window_limit=2, fills=0}, regime_window={trend_ticks=0, range_ticks=20, extreme_ticks=0, warmup_ticks=0, trend_candidate_ticks=6}, regime_current={symbol=SOLUSDT, regime=RANGE, bucket=RANGE, warmup=false, trend_threshold_ratio=0.740000, trend_candidate=true}\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["trend_candidate_probe_filtered_fee_count"], 3)
         self.assertEqual(metrics["trend_candidate_probe_skip_window_limit_count"], 2)
@@ -1186,7 +1290,7 @@ class AssessRunLogTest(unittest.TestCase):
             metrics["trend_candidate_probe_filtered_fee_window_pressure_count"], 2
         )
         self.assertTrue(
-            any("filtered_fee_window_pressure=2" in item for item in report["warn_reasons"])
+            self._has_reason(report["warn_reasons"], "filtered_fee_window_pressure=2")
         )
 
     def test_no_execution_reports_trade_not_ok_probe_blocker(self):
@@ -1198,15 +1302,15 @@ class AssessRunLogTest(unittest.TestCase):
             "regime_window={trend_ticks=0, range_ticks=20, extreme_ticks=0, warmup_ticks=0, trend_candidate_ticks=6}, "
             "regime_current={symbol=SOLUSDT, regime=RANGE, bucket=RANGE, warmup=false, trend_threshold_ratio=0.740000, trend_candidate=true}\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["trend_candidate_probe_skip_trade_not_ok_count"], 1)
         self.assertEqual(metrics["trade_ok_false_count"], 1)
         self.assertEqual(metrics["risk_mode_reduce_only_count"], 1)
         self.assertTrue(
-            any(
-                "TREND_CANDIDATE 探针被 TRADE_NOT_OK 阻断" in item
-                for item in report["execution_fail_reasons"]
+            self._has_reason(
+                report["execution_fail_reasons"],
+                "TREND_CANDIDATE 探针被 TRADE_NOT_OK 阻断",
             )
         )
 
@@ -1221,14 +1325,14 @@ class AssessRunLogTest(unittest.TestCase):
             "regime_window={trend_ticks=0, range_ticks=20, extreme_ticks=0, warmup_ticks=0, trend_candidate_ticks=6}, "
             "regime_current={symbol=SOLUSDT, regime=RANGE, bucket=RANGE, warmup=false, trend_threshold_ratio=0.740000, trend_candidate=true}\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["adapter_trade_not_ok_count"], 1)
         self.assertEqual(metrics["force_reduce_only_active_count"], 0)
         self.assertTrue(
-            any(
-                "blocker_sources=adapter_trade_ok=false:1" in item
-                for item in report["execution_fail_reasons"]
+            self._has_reason(
+                report["execution_fail_reasons"],
+                "blocker_sources=adapter_trade_ok=false:1",
             )
         )
 
@@ -1240,7 +1344,7 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:00:03 [INFO] TREND_CANDIDATE_PROBE_FILL: fill_id=probe-fill-1, client_order_id=BTCUSDT-probe-1, symbol=BTCUSDT, direction=1, qty=0.001, price=100000.0, fee=-0.020000, liquidity=maker, notional_abs_usd=100.0\n"
             "2026-02-14 15:00:04 [INFO] BYBIT_SUBMIT: symbol=BTCUSDT, client_order_id=BTCUSDT-main-1, side=Sell, order_type=Market, liquidity_preference=taker, purpose=3\n"
             "2026-02-14 15:00:05 [INFO] FILL_APPLIED: fill_id=main-fill-1, client_order_id=BTCUSDT-main-1, symbol=BTCUSDT, side=Sell, qty=0.001, price=100010.0, fee=-0.055000, liquidity=taker\n"
-            + self._runtime_line(
+            + _runtime_line(
                 20,
                 0.0,
                 funnel_fills=2,
@@ -1251,7 +1355,7 @@ class AssessRunLogTest(unittest.TestCase):
             )
             + "2026-02-14 15:00:21 [INFO] REPLAY_TERMINAL_SETTLEMENT_DONE: position_count=0, realized_net_usd=-0.080000, fees_usd=0.075000, funding_paid_usd=0.005000\n"
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         attribution = report["execution_attribution"]
         self.assertEqual(metrics["execution_attribution_submit_count"], 2)
@@ -1325,11 +1429,11 @@ class AssessRunLogTest(unittest.TestCase):
         text = (
             "2026-02-14 15:00:01 [ERROR] "
             "REPLAY_TERMINAL_SETTLEMENT_FAILED: reason=timeout\n"
-            + self._runtime_line(20, 0.0)
+            + _runtime_line(20, 0.0)
         )
 
         report = ASSESS.assess(
-            text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1
+            text, self.S3_RULES, min_runtime_status=1
         )
 
         self.assertEqual(
@@ -1347,10 +1451,10 @@ class AssessRunLogTest(unittest.TestCase):
         text = (
             "2026-02-14 15:00:01 [INFO] EXIT_CAPTURE_SAMPLE: symbol=SOLUSDT, client_order_id=sol-tp-1, purpose=take_profit, entry_direction=1, close_qty=1.0, avg_entry_price=100.0, exit_price=100.3, best_price=101.2, path_mfe_bps=120.0, captured_gross_bps=30.0, captured_net_bps=20.0, fee_bps=5.0, capture_ratio=0.25, low_capture=false, realized_pnl_usd=0.30, realized_net_usd=0.20, round_trip_cost_bps=13.0, holding_ticks=12, protection_state=true\n"
             "2026-02-14 15:00:02 [INFO] EXIT_CAPTURE_SAMPLE: symbol=ETHUSDT, client_order_id=eth-sl-1, purpose=stop_loss, entry_direction=1, close_qty=1.0, avg_entry_price=100.0, exit_price=99.95, best_price=101.0, path_mfe_bps=100.0, captured_gross_bps=-5.0, captured_net_bps=-12.0, fee_bps=7.0, capture_ratio=-0.05, low_capture=true, realized_pnl_usd=-0.05, realized_net_usd=-0.12, round_trip_cost_bps=13.0, holding_ticks=8, protection_state=true\n"
-            + self._runtime_line(20, 0.0, funnel_fills=2)
+            + _runtime_line(20, 0.0, funnel_fills=2)
         )
 
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         exit_capture_live = report["exit_capture_live"]
 
@@ -1371,10 +1475,10 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:00:01 [INFO] STRATEGY_REDUCE_COST_GUARD_BLOCKED: symbol=SOLUSDT, client_order_id=sol-reduce-1, estimated_gross_bps=1.0, estimated_net_bps=-4.5, required_net_bps=0.5, expected_exit_cost_bps=5.5, holding_ticks=20\n"
             "2026-02-14 15:00:01 [INFO] ORDER_THROTTLED: symbol=SOLUSDT, client_order_id=sol-reduce-1, reason=strategy_reduce_cost_guard\n"
             "2026-02-14 15:00:02 [INFO] STRATEGY_REDUCE_COST_GUARD_BYPASS: symbol=ETHUSDT, client_order_id=eth-reduce-1, reason=max_hold, estimated_gross_bps=0.0, estimated_net_bps=-5.5, required_net_bps=0.5, expected_exit_cost_bps=5.5, holding_ticks=720\n"
-            + self._runtime_line(20, 0.0)
+            + _runtime_line(20, 0.0)
         )
 
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
 
         self.assertEqual(metrics["strategy_reduce_cost_guard_blocked_count"], 1)
@@ -1395,9 +1499,9 @@ class AssessRunLogTest(unittest.TestCase):
                     f"2026-02-14 15:01:{idx * 2 + 1:02d} [INFO] FILL_APPLIED: fill_id=sol-close-{idx}, client_order_id=sol-close-{idx}, symbol=SOLUSDT, side=Sell, qty=1.0, price=20.0, fee=-0.040000, liquidity=maker",
                 ]
             )
-        text = "\n".join(lines) + "\n" + self._runtime_line(20, 0.0, funnel_fills=12)
+        text = "\n".join(lines) + "\n" + _runtime_line(20, 0.0, funnel_fills=12)
 
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
 
         self.assertEqual(metrics["execution_attribution_symbol_count"], 2)
@@ -1414,59 +1518,13 @@ class AssessRunLogTest(unittest.TestCase):
             -0.02,
         )
 
-    def test_s5_warns_when_all_active_symbols_have_negative_net_quality(self):
-        lines = [
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600",
-            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=10, effective_signals=10, fills=12",
-            "2026-02-14 15:00:01 [INFO] FILL_APPLIED: fill_id=btc-open, client_order_id=btc-open, symbol=BTCUSDT, side=Buy, qty=1.0, price=100.0, fee=0.000000, liquidity=maker",
-            "2026-02-14 15:00:02 [INFO] FILL_APPLIED: fill_id=btc-close, client_order_id=btc-close, symbol=BTCUSDT, side=Sell, qty=1.0, price=100.0, fee=-0.100000, liquidity=taker",
-        ]
-        for idx in range(5):
-            lines.extend(
-                [
-                    f"2026-02-14 15:01:{idx * 2:02d} [INFO] FILL_APPLIED: fill_id=sol-open-{idx}, client_order_id=sol-open-{idx}, symbol=SOLUSDT, side=Buy, qty=1.0, price=20.0, fee=0.000000, liquidity=maker",
-                    f"2026-02-14 15:01:{idx * 2 + 1:02d} [INFO] FILL_APPLIED: fill_id=sol-close-{idx}, client_order_id=sol-close-{idx}, symbol=SOLUSDT, side=Sell, qty=1.0, price=20.0, fee=-0.040000, liquidity=maker",
-                ]
-            )
-        runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1,
-                funnel_fills=1,
-                realized_net_per_fill=0.01,
-                fee_bps_per_fill=1.0,
-                maker_fills=1,
-                explicit_liquidity_fills=1,
-                explicit_liquidity_fill_ratio=1.0,
-                maker_fill_ratio=1.0,
-                regime_bucket="TREND",
-            )
-            for i in range(50)
-        )
-        text = "\n".join(lines) + "\n" + runtime
-
-        report = ASSESS.assess(
-            text,
-            ASSESS.STAGE_RULES["S5"],
-            min_runtime_status=50,
-            s5_min_fill_windows=0,
-        )
-        self.assertTrue(
-            any(
-                "所有成交币对按 realized_net_per_fill 统计均为负"
-                in item
-                for item in report["warn_reasons"]
-            )
-        )
-
     def test_transient_trend_regime_change_is_reported_separately(self):
         text = (
             "2026-02-14 15:00:01 [INFO] REGIME_CHANGE: symbol=BNBUSDT, regime=DOWNTREND, bucket=TREND, warmup=false, decision_interval_ms=5000, aggregated_events=5, instant_return=-0.001000, trend_strength=-0.000320, volatility=0.000200\n"
             "2026-02-14 15:00:06 [INFO] REGIME_CHANGE: symbol=BTCUSDT, regime=RANGE, bucket=RANGE, warmup=false, decision_interval_ms=5000, aggregated_events=7, instant_return=0.000200, trend_strength=0.000020, volatility=0.000100\n"
-            + self._runtime_line(20, 0.0, regime_bucket="RANGE")
+            + _runtime_line(20, 0.0, regime_bucket="RANGE")
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         metrics = report["metrics"]
         self.assertEqual(metrics["regime_trend_runtime_count"], 0)
         self.assertEqual(metrics["regime_change_trend_count"], 1)
@@ -1476,104 +1534,43 @@ class AssessRunLogTest(unittest.TestCase):
 
     def test_policy_flat_dominant_without_evolution_action_skips_missing_action_warn(self):
         runtime = "".join(
-            self._runtime_line(
-                tick,
-                0.0,
-                funnel_enqueued=0,
-                funnel_fills=0,
-                strategy_mix_samples=0,
-                strategy_mix_policy_flat_samples=8,
-                strategy_mix_latest_trend=0.0,
-                strategy_mix_latest_defensive=0.0,
-                strategy_mix_latest_blended=0.0,
-                strategy_mix_avg_abs_trend=0.0,
-                strategy_mix_avg_abs_defensive=0.0,
-                strategy_mix_avg_abs_blended=0.0,
-                regime_bucket="RANGE",
-                equity=100000.0,
-                realized_pnl=0.0,
-                fees=0.0,
-                realized_net=0.0,
-            )
-            for tick in range(20, 140, 20)
+            [
+                _runtime_line(
+                    tick,
+                    0.0,
+                    funnel_enqueued=0,
+                    funnel_fills=0,
+                    strategy_mix_samples=0,
+                    strategy_mix_policy_flat_samples=8,
+                    strategy_mix_latest_trend=0.0,
+                    strategy_mix_latest_defensive=0.0,
+                    strategy_mix_latest_blended=0.0,
+                    strategy_mix_avg_abs_trend=0.0,
+                    strategy_mix_avg_abs_defensive=0.0,
+                    strategy_mix_avg_abs_blended=0.0,
+                    regime_bucket="RANGE",
+                    equity=100000.0,
+                    realized_pnl=0.0,
+                    fees=0.0,
+                    realized_net=0.0,
+                )
+                for tick in range(20, 140, 20)
+            ]
         )
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
             "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=8, policy_flat=true\n"
             + runtime
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
         self.assertEqual(report["runtime_validation_mode"], "POLICY_FLAT_PROTECTION")
         self.assertFalse(
-            any("未观测到 SELF_EVOLUTION_ACTION" in x for x in report["warn_reasons"])
-        )
-
-    def test_s5_execution_active_window_sets_execution_pass(self):
-        runtime = "".join(
-            self._runtime_line(
-                tick,
-                0.0,
-                funnel_enqueued=1,
-                funnel_fills=1,
-                strategy_mix_samples=10,
-                strategy_mix_policy_flat_samples=0,
-                realized_net_per_fill=0.001,
-                fee_bps_per_fill=0.1,
-                maker_fills=1,
-                regime_bucket="TREND",
-            )
-            for tick in range(20, 240, 20)
-        )
-        text = (
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: bucket=TREND\n"
-            "2026-02-14 15:00:01 [INFO] SELF_EVOLUTION_ACTION: source=counterfactual\n"
-            "2026-02-14 15:00:10 [INFO] GATE_CHECK_PASSED: raw_signals=2, order_intents=1, effective_signals=2, fills=1\n"
-            + runtime
-        )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=1)
-        self.assertEqual(report["protection_status"], "PASS")
-        self.assertEqual(report["execution_status"], "PASS")
-        self.assertEqual(report["runtime_validation_mode"], "EXECUTION_ACTIVE")
-
-    def test_s5_trend_runtime_without_participation_fails_execution(self):
-        text = "".join(
-            self._runtime_line(
-                tick,
-                0.0,
-                funnel_enqueued=0,
-                funnel_fills=0,
-                strategy_mix_samples=0,
-                strategy_mix_policy_flat_samples=0,
-                strategy_mix_latest_trend=0.0,
-                strategy_mix_latest_defensive=0.0,
-                strategy_mix_latest_blended=0.0,
-                strategy_mix_avg_abs_trend=0.0,
-                strategy_mix_avg_abs_defensive=0.0,
-                strategy_mix_avg_abs_blended=0.0,
-                regime_bucket="TREND",
-            )
-            for tick in range(20, 220, 20)
-        )
-        text = (
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: bucket=TREND\n"
-            "2026-02-14 15:00:01 [INFO] SELF_EVOLUTION_ACTION: source=counterfactual\n"
-            "2026-02-14 15:00:10 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=0, policy_flat=false\n"
-            + text
-        )
-        report = ASSESS.assess(
-            text,
-            ASSESS.STAGE_RULES["S5"],
-            min_runtime_status=1,
-            s5_min_fill_windows=0,
-            s5_min_trend_runtime_windows=5,
+            self._has_reason(report["warn_reasons"], "未观测到 SELF_EVOLUTION_ACTION")
         )
-        self.assertEqual(report["protection_status"], "PASS")
-        self.assertEqual(report["execution_status"], "FAIL")
-        self.assertIn("TREND 桶出现但未形成策略参与或执行样本", "\n".join(report["execution_fail_reasons"]))
 
     def test_assess_extracts_execution_window_metrics(self):
         runtime = (
-            self._runtime_line(
+            _runtime_line(
                 20,
                 0.0,
                 filtered_cost_ratio=0.95,
@@ -1599,7 +1596,7 @@ class AssessRunLogTest(unittest.TestCase):
                 candidate_probe_cost_gate_edge_gap_max_bps=10.2,
                 candidate_probe_cost_gate_trend_ratio_avg=0.64,
             )
-            + self._runtime_line(
+            + _runtime_line(
                 40,
                 0.0,
                 filtered_cost_ratio=0.85,
@@ -1626,7 +1623,7 @@ class AssessRunLogTest(unittest.TestCase):
                 candidate_probe_cost_gate_trend_ratio_avg=0.66,
             )
         )
-        report = ASSESS.assess(runtime, ASSESS.STAGE_RULES["S3"], min_runtime_status=2)
+        report = ASSESS.assess(runtime, self.S3_RULES, min_runtime_status=2)
         metrics = report["metrics"]
         self.assertEqual(metrics["execution_window_runtime_count"], 2)
         self.assertAlmostEqual(metrics["filtered_cost_ratio_avg"], 0.9, places=6)
@@ -1693,7 +1690,7 @@ class AssessRunLogTest(unittest.TestCase):
 
     def test_assess_extracts_entry_gate_and_near_miss_metrics(self):
         runtime = (
-            self._runtime_line(
+            _runtime_line(
                 20,
                 0.0,
                 filtered_cost_ratio=0.60,
@@ -1705,7 +1702,7 @@ class AssessRunLogTest(unittest.TestCase):
                 entry_gate_observed_near_miss_ratio=0.25,
                 entry_gate_observed_near_miss_allowed_ratio=0.08,
             )
-            + self._runtime_line(
+            + _runtime_line(
                 40,
                 0.0,
                 filtered_cost_ratio=0.40,
@@ -1722,7 +1719,7 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:00:00 [INFO] GATE_CHECK_PASSED: raw_signals=4, order_intents=2, effective_signals=4, fills=1\n"
             + runtime
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=2)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=2)
         metrics = report["metrics"]
         self.assertEqual(metrics["entry_gate_runtime_count"], 2)
         self.assertAlmostEqual(
@@ -1749,8 +1746,8 @@ class AssessRunLogTest(unittest.TestCase):
 
     def test_assess_warn_on_high_concentration(self):
         runtime = (
-            self._runtime_line(20, 0.0, concentration_top1_share=0.92, concentration_symbol_count=3)
-            + self._runtime_line(
+            _runtime_line(20, 0.0, concentration_top1_share=0.92, concentration_symbol_count=3)
+            + _runtime_line(
                 40, 0.0, concentration_top1_share=0.95, concentration_symbol_count=3
             )
         )
@@ -1758,18 +1755,18 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:00:00 [INFO] GATE_CHECK_PASSED: raw_signals=4, order_intents=2, effective_signals=4, fills=1\n"
             + runtime
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=2)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=2)
         metrics = report["metrics"]
         self.assertEqual(report["verdict"], "PASS_WITH_ACTIONS")
         self.assertEqual(metrics["concentration_runtime_count"], 2)
         self.assertAlmostEqual(metrics["concentration_top1_share_avg"], 0.935, places=6)
         self.assertAlmostEqual(metrics["concentration_top1_share_max"], 0.95, places=6)
         self.assertEqual(metrics["concentration_high_count"], 2)
-        self.assertTrue(any("仓位集中度偏高" in x for x in report["warn_reasons"]))
+        self.assertTrue(self._has_reason(report["warn_reasons"], "仓位集中度偏高"))
 
     def test_assess_extracts_quality_guard_and_reconcile_metrics(self):
         runtime = (
-            self._runtime_line(
+            _runtime_line(
                 20,
                 0.0,
                 execution_quality_guard_active=True,
@@ -1780,7 +1777,7 @@ class AssessRunLogTest(unittest.TestCase):
                 reconcile_anomaly_streak=2,
                 reconcile_anomaly_reduce_only=True,
             )
-            + self._runtime_line(
+            + _runtime_line(
                 40,
                 0.0,
                 execution_quality_guard_active=False,
@@ -1800,7 +1797,7 @@ class AssessRunLogTest(unittest.TestCase):
             "order_state_before=cancelled, account_already_reflected=true\n"
             + runtime
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=2)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=2)
         metrics = report["metrics"]
         self.assertEqual(metrics["execution_quality_guard_runtime_count"], 2)
         self.assertEqual(metrics["execution_quality_guard_active_count"], 1)
@@ -1832,13 +1829,13 @@ class AssessRunLogTest(unittest.TestCase):
 
     def test_transient_symbol_quality_guard_exit_does_not_warn(self):
         runtime = (
-            self._runtime_line(
+            _runtime_line(
                 20,
                 0.0,
                 execution_quality_guard_symbol_active_count=1,
                 execution_quality_guard_symbol_state_count=1,
             )
-            + self._runtime_line(
+            + _runtime_line(
                 40,
                 0.0,
                 execution_quality_guard_symbol_active_count=0,
@@ -1851,7 +1848,7 @@ class AssessRunLogTest(unittest.TestCase):
             + runtime
         )
 
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=2)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=2)
         metrics = report["metrics"]
 
         self.assertEqual(metrics["execution_symbol_quality_guard_enter_count"], 1)
@@ -1860,7 +1857,7 @@ class AssessRunLogTest(unittest.TestCase):
         self.assertEqual(metrics["execution_quality_guard_symbol_active_count_max"], 1)
         self.assertEqual(metrics["execution_quality_guard_symbol_active_count_latest"], 0)
         self.assertFalse(
-            any("symbol 级执行质量守卫触发" in x for x in report["warn_reasons"])
+            self._has_reason(report["warn_reasons"], "symbol 级执行质量守卫触发")
         )
 
     def test_assess_counts_symbol_quality_quarantine_throttle(self):
@@ -1869,15 +1866,15 @@ class AssessRunLogTest(unittest.TestCase):
             "client_order_id=main-entry-1, "
             "reason=symbol_quality_quarantine_remaining_ticks=120, "
             "quality_guard_trigger_count=2, allow_recovery_probe=true\n"
-            + self._runtime_line(20, 0.0)
+            + _runtime_line(20, 0.0)
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         self.assertEqual(
             report["metrics"]["order_throttled_symbol_quality_quarantine_count"], 1
         )
 
     def test_assess_warn_on_low_explicit_liquidity_ratio(self):
-        runtime = self._runtime_line(
+        runtime = _runtime_line(
             20,
             0.0,
             maker_fills=1,
@@ -1896,17 +1893,17 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=2, order_intents=2, effective_signals=2, fills=2\n"
             + runtime
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         self.assertEqual(report["verdict"], "PASS_WITH_ACTIONS")
         self.assertTrue(
-            any("显式流动性标签覆盖率偏低" in x for x in report["warn_reasons"])
+            self._has_reason(report["warn_reasons"], "显式流动性标签覆盖率偏低")
         )
         self.assertTrue(
-            any("fee 符号兜底占比偏高" in x for x in report["warn_reasons"])
+            self._has_reason(report["warn_reasons"], "fee 符号兜底占比偏高")
         )
 
     def test_assess_warn_on_missing_liquidity_source_fields(self):
-        runtime = self._runtime_line(
+        runtime = _runtime_line(
             20,
             0.0,
             maker_fills=1,
@@ -1921,283 +1918,739 @@ class AssessRunLogTest(unittest.TestCase):
             taker_fee_bps=8.5,
             maker_fill_ratio=0.5,
         )
-        runtime = re.sub(
-            r"explicit_liquidity_fills=\d+, fee_sign_fallback_fills=\d+, "
-            r"unknown_fill_ratio=-?[0-9]+(?:\.[0-9]+)?, "
-            r"explicit_liquidity_fill_ratio=-?[0-9]+(?:\.[0-9]+)?, "
-            r"fee_sign_fallback_fill_ratio=-?[0-9]+(?:\.[0-9]+)?, ",
-            "",
-            runtime,
+        # 入参固定，待剔除片段是已知字面量，直接按字面量删除。
+        liquidity_source_fields = (
+            "explicit_liquidity_fills=2, fee_sign_fallback_fills=0, "
+            "unknown_fill_ratio=0.0, explicit_liquidity_fill_ratio=1.0, "
+            "fee_sign_fallback_fill_ratio=0.0, "
         )
+        self.assertIn(liquidity_source_fields, runtime)
+        runtime = runtime.replace(liquidity_source_fields, "")
         text = (
             "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=2, order_intents=2, effective_signals=2, fills=2\n"
             + runtime
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S3"], min_runtime_status=1)
+        report = ASSESS.assess(text, self.S3_RULES, min_runtime_status=1)
         self.assertEqual(report["verdict"], "PASS_WITH_ACTIONS")
         self.assertTrue(
-            any("未观测到流动性来源细分字段" in x for x in report["warn_reasons"])
+            self._has_reason(report["warn_reasons"], "未观测到流动性来源细分字段")
         )
 
-    def test_s5_warn_when_evolution_actions_without_effective_updates(self):
+    def test_deploy_ignores_soft_warns(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1 if i == 0 else 0,
-                funnel_fills=1 if i == 1 else 0,
-            )
-            for i in range(60)
-        )
-        actions = "".join(
-            "2026-02-14 15:00:10 [INFO] SELF_EVOLUTION_ACTION: type=skipped, bucket=RANGE, "
-            "reason=EVOLUTION_COUNTERFACTUAL_IMPROVEMENT_TOO_SMALL, counterfactual_search=true, "
-            "learnability={enabled=true, passed=true, t_stat=1.200000, samples=140}\n"
-            for _ in range(35)
+            [
+                _runtime_line(20 + i * 20, 0.0, reduce_only=True)
+                for i in range(12)
+            ]
         )
         text = (
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
-            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=1, effective_signals=10, fills=1\n"
-            "2026-02-14 15:30:01 [INFO] BYBIT_SUBMIT: order_type=Limit, symbol=BTCUSDT\n"
-            + actions
+            "2026-02-14 15:30:00 [INFO] GATE_CHECK_FAILED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, fail_reasons=[FAIL_LOW_ACTIVITY_SIGNALS,FAIL_LOW_ACTIVITY_FILLS]\n"
+            "2026-02-14 15:30:01 [INFO] GATE_CHECK_FAILED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, fail_reasons=[FAIL_LOW_ACTIVITY_SIGNALS,FAIL_LOW_ACTIVITY_FILLS]\n"
             + runtime
         )
-        report = ASSESS.assess(
-            text,
-            ASSESS.STAGE_RULES["S5"],
-            min_runtime_status=50,
-            s5_min_fill_windows=0,
-        )
-        self.assertEqual(report["verdict"], "FAIL")
-        self.assertTrue(
-            any("SELF_EVOLUTION 有评估无有效更新" in x for x in report["fail_reasons"])
-        )
-        self.assertTrue(
-            any("SELF_EVOLUTION 长时间仅评估未更新" in x for x in report["warn_reasons"])
-        )
+        report = ASSESS.assess(text, self.DEPLOY_RULES, min_runtime_status=2)
+        self.assertEqual(report["verdict"], "PASS")
+        self.assertEqual(report["warn_reasons"], [])
 
-    def test_s5_no_warn_when_evolution_has_effective_updates(self):
+    def test_deploy_ignores_strategy_fail_like_signals(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1 if i == 0 else 0,
-                funnel_fills=1 if i == 1 else 0,
-            )
-            for i in range(60)
-        )
-        update_action = (
-            "2026-02-14 15:00:10 [INFO] SELF_EVOLUTION_ACTION: type=updated, bucket=RANGE, "
-            "reason=EVOLUTION_COUNTERFACTUAL_INCREASE_TREND, counterfactual_search=true, "
-            "learnability={enabled=true, passed=true, t_stat=1.200000, samples=140}\n"
-        )
-        non_update_actions = "".join(
-            "2026-02-14 15:00:10 [INFO] SELF_EVOLUTION_ACTION: type=skipped, bucket=RANGE, "
-            "reason=EVOLUTION_COUNTERFACTUAL_IMPROVEMENT_TOO_SMALL, counterfactual_search=true, "
-            "learnability={enabled=true, passed=true, t_stat=1.200000, samples=140}\n"
-            for _ in range(34)
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    180.0 if i == 0 else 0.0,
+                    reduce_only=True,
+                    trading_halted=True,
+                )
+                for i in range(12)
+            ]
         )
         text = (
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
-            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=1, effective_signals=10, fills=1\n"
-            "2026-02-14 15:30:01 [INFO] BYBIT_SUBMIT: order_type=Limit, symbol=BTCUSDT\n"
-            + update_action
-            + non_update_actions
+            "2026-02-14 15:30:00 [INFO] GATE_CHECK_FAILED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, fail_reasons=[FAIL_LOW_ACTIVITY_SIGNALS,FAIL_LOW_ACTIVITY_FILLS]\n"
+            "2026-02-14 15:30:01 [INFO] GATE_CHECK_FAILED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, fail_reasons=[FAIL_LOW_ACTIVITY_SIGNALS,FAIL_LOW_ACTIVITY_FILLS]\n"
             + runtime
         )
+        report = ASSESS.assess(text, self.DEPLOY_RULES, min_runtime_status=2)
+        self.assertEqual(report["verdict"], "PASS")
+        self.assertEqual(report["fail_reasons"], [])
+        self.assertEqual(report["warn_reasons"], [])
+
+    def test_deploy_fail_on_ws_unhealthy(self):
+        text = _runtime_line(20, 0.0, public_ws_healthy=False)
+        report = ASSESS.assess(text, self.DEPLOY_RULES, min_runtime_status=1)
+        self.assertEqual(report["verdict"], "FAIL")
+        self.assertTrue(self._has_reason(report["fail_reasons"], "WS 健康检查失败次数"))
+
+    def test_deploy_fail_on_critical(self):
+        text = "2026-02-14 15:30:01 [CRITICAL] fatal error\n" + _runtime_line(20, 0.0)
+        report = ASSESS.assess(text, self.DEPLOY_RULES, min_runtime_status=1)
+        self.assertEqual(report["verdict"], "FAIL")
+        self.assertTrue(self._has_reason(report["fail_reasons"], "出现 CRITICAL"))
+
+    def test_deploy_allows_zero_runtime_status(self):
+        text = "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
-            min_runtime_status=50,
-            s5_min_fill_windows=0,
+            self.DEPLOY_RULES,
+            min_runtime_status=self.DEPLOY_RULES.min_runtime_status,
         )
         self.assertEqual(report["verdict"], "PASS")
-        self.assertFalse(
-            any("SELF_EVOLUTION 长时间仅评估未更新" in x for x in report["warn_reasons"])
-        )
 
-    def test_s5_objective_update_counts_as_effective_update(self):
+    def test_smoke_allows_short_health_window_without_strategy_activity(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1 if i == 0 else 0,
-                funnel_fills=1 if i == 1 else 0,
-            )
-            for i in range(60)
-        )
-        update_action = (
-            "2026-02-14 15:00:10 [INFO] SELF_EVOLUTION_ACTION: type=updated, bucket=RANGE, "
-            "reason=EVOLUTION_WEIGHT_INCREASE_TREND, counterfactual_search=true, "
-            "learnability={enabled=true, passed=true, t_stat=1.200000, samples=140}\n"
-        )
-        non_update_actions = "".join(
-            "2026-02-14 15:00:10 [INFO] SELF_EVOLUTION_ACTION: type=skipped, bucket=RANGE, "
-            "reason=EVOLUTION_COUNTERFACTUAL_IMPROVEMENT_TOO_SMALL, counterfactual_search=true, "
-            "learnability={enabled=true, passed=true, t_stat=1.200000, samples=140}\n"
-            for _ in range(34)
-        )
-        text = (
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
-            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=1, effective_signals=10, fills=1\n"
-            "2026-02-14 15:30:01 [INFO] BYBIT_SUBMIT: order_type=Limit, symbol=BTCUSDT\n"
-            + update_action
-            + non_update_actions
-            + runtime
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=0,
+                    funnel_fills=0,
+                    strategy_mix_samples=0,
+                    strategy_mix_latest_trend=0.0,
+                    strategy_mix_latest_defensive=0.0,
+                    strategy_mix_latest_blended=0.0,
+                    strategy_mix_avg_abs_trend=0.0,
+                    strategy_mix_avg_abs_defensive=0.0,
+                    strategy_mix_avg_abs_blended=0.0,
+                )
+                for i in range(3)
+            ]
         )
         report = ASSESS.assess(
-            text,
-            ASSESS.STAGE_RULES["S5"],
-            min_runtime_status=50,
-            s5_min_fill_windows=0,
+            runtime,
+            self.SMOKE_RULES,
+            min_runtime_status=3,
+            s5_min_fill_windows=1,
         )
         self.assertEqual(report["verdict"], "PASS")
-        self.assertEqual(report["metrics"]["self_evolution_objective_update_count"], 1)
-        self.assertEqual(report["metrics"]["self_evolution_effective_update_count"], 1)
+        self.assertFalse(
+            self._has_reason(report["fail_reasons"], "未检测到执行活动")
+        )
+        self.assertFalse(
+            self._has_reason(report["fail_reasons"], "未检测到有效策略信号窗口")
+        )
 
-    def test_s5_fail_when_realized_net_per_fill_below_threshold(self):
+    def test_smoke_strategy_activity_without_execution_uses_strategy_active_mode(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1,
-                funnel_fills=1,
-                realized_net_per_fill=-0.02,
-                fee_bps_per_fill=6.0,
-                maker_fills=1,
-                taker_fills=1,
-                unknown_fills=0,
-                explicit_liquidity_fills=2,
-                fee_sign_fallback_fills=0,
-                unknown_fill_ratio=0.0,
-                explicit_liquidity_fill_ratio=1.0,
-                fee_sign_fallback_fill_ratio=0.0,
-                maker_fee_bps=-0.2,
-                taker_fee_bps=6.5,
-                maker_fill_ratio=0.5,
-            )
-            for i in range(60)
-        )
-        text = (
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
-            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=10, effective_signals=10, fills=10\n"
-            + runtime
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=0,
+                    funnel_fills=0,
+                    strategy_mix_samples=6,
+                    strategy_mix_policy_flat_samples=0,
+                    strategy_mix_latest_trend=180.0,
+                    strategy_mix_latest_defensive=-60.0,
+                    strategy_mix_latest_blended=120.0,
+                    strategy_mix_avg_abs_trend=180.0,
+                    strategy_mix_avg_abs_defensive=60.0,
+                    strategy_mix_avg_abs_blended=120.0,
+                )
+                for i in range(3)
+            ]
         )
         report = ASSESS.assess(
-            text,
-            ASSESS.STAGE_RULES["S5"],
-            min_runtime_status=50,
-            s5_min_fill_windows=0,
+            runtime,
+            self.SMOKE_RULES,
+            min_runtime_status=3,
         )
-        self.assertEqual(report["verdict"], "FAIL")
-        self.assertTrue(
-            any("执行净收益质量未达标" in x for x in report["fail_reasons"])
+        self.assertEqual(report["execution_status"], "PASS")
+        self.assertEqual(
+            report["runtime_validation_mode"], "STRATEGY_ACTIVE_NO_EXECUTION"
         )
+        self.assertEqual(report["metrics"]["execution_activity_count"], 0)
+        self.assertGreater(report["metrics"]["strategy_mix_nonzero_window_count"], 0)
 
-    def test_s5_prefers_attribution_net_quality_over_runtime_window_average(self):
-        fill_lines = []
-        for idx in range(5):
-            fill_lines.extend(
-                [
-                    f"2026-02-14 15:00:{idx * 2:02d} [INFO] FILL_APPLIED: fill_id=open-{idx}, client_order_id=open-{idx}, symbol=SOLUSDT, side=Buy, qty=1.0, price=100.0, fee=0.000000, liquidity=maker",
-                    f"2026-02-14 15:00:{idx * 2 + 1:02d} [INFO] FILL_APPLIED: fill_id=close-{idx}, client_order_id=close-{idx}, symbol=SOLUSDT, side=Sell, qty=1.0, price=100.0, fee=-0.040000, liquidity=maker",
-                ]
-            )
-        runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1,
-                funnel_fills=1,
-                realized_net_per_fill=0.01,
-                fee_bps_per_fill=1.0,
-                maker_fills=1,
-                explicit_liquidity_fills=1,
-                explicit_liquidity_fill_ratio=1.0,
-                maker_fill_ratio=1.0,
-            )
-            for i in range(60)
-        )
+    def test_smoke_fail_on_reconcile_mismatch(self):
         text = (
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
-            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=10, effective_signals=10, fills=10\n"
-            + "\n".join(fill_lines)
-            + "\n"
-            + runtime
+            _runtime_line(20, 0.0)
+            + "2026-02-14 15:00:21 [WARN] OMS_RECONCILE_MISMATCH: symbol=BTCUSDT\n"
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
-            min_runtime_status=50,
-            s5_min_fill_windows=0,
+            self.SMOKE_RULES,
+            min_runtime_status=1,
         )
-
         self.assertEqual(report["verdict"], "FAIL")
-        self.assertAlmostEqual(report["metrics"]["realized_net_per_fill"], 0.01)
-        self.assertEqual(
-            report["metrics"]["execution_attribution_quality_fill_count"], 10
-        )
-        self.assertAlmostEqual(
-            report["metrics"]["execution_attribution_realized_net_per_fill"],
-            -0.02,
-        )
         self.assertTrue(
-            any(
-                "execution_attribution" in item
-                for item in report["fail_reasons"]
-            )
+            self._has_reason(report["fail_reasons"], "SMOKE 检测到对账不一致")
         )
 
-    def test_s5_fail_when_protection_missing_event_observed(self):
-        runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1,
-                funnel_fills=1,
-                realized_net_per_fill=0.01,
-                fee_bps_per_fill=1.0,
-                maker_fills=1,
-                explicit_liquidity_fills=1,
-                explicit_liquidity_fill_ratio=1.0,
-                maker_fill_ratio=1.0,
-            )
-            for i in range(60)
-        )
+    def test_smoke_fail_on_overfill_guard(self):
         text = (
-            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
-            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=10, effective_signals=10, fills=10\n"
-            "2026-02-14 15:30:01 [INFO] EXEC_PROTECTIVE_ORDER_MISSING: reason=managed_sl_enqueue_failed, symbol=BTCUSDT\n"
-            + runtime
+            _runtime_line(20, 0.0)
+            + "2026-02-14 15:00:22 [WARN] FILL_OVERFILL_DROP: order_id=abc\n"
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
-            min_runtime_status=50,
-            s5_min_fill_windows=0,
-            s5_protection_enabled=True,
+            self.SMOKE_RULES,
+            min_runtime_status=1,
         )
         self.assertEqual(report["verdict"], "FAIL")
-        self.assertEqual(report["metrics"]["protective_order_missing_count"], 1)
+        self.assertEqual(report["metrics"]["fill_overfill_drop_count"], 1)
         self.assertTrue(
-            any("保护单缺失事件超阈值" in x for x in report["fail_reasons"])
+            self._has_reason(report["fail_reasons"], "SMOKE 检测到 fill overfill 防线触发")
         )
 
-    def test_s5_ignore_protection_missing_gate_when_protection_disabled(self):
+
+class AssessRunLogS5Test(AssessRunLogTestBase):
+    # S5 长窗口用例单独成组，ctest/xdist 可与其余用例并行调度。
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # 多个 S5 用例共用同一段 60 tick 基线运行窗口（首 tick 入队、次 tick 成交），只构造一次。
+        cls._S5_BASELINE_RUNTIME_60 = "".join(
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1 if i == 0 else 0,
+                    funnel_fills=1 if i == 1 else 0,
+                )
+                for i in range(60)
+            ]
+        )
+        # rebase 用例（首 tick 持仓 180，随后入队、成交）与其 compose 前缀版本共用。
+        cls._S5_REBASE_RUNTIME_60 = "".join(
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    180.0 if i == 0 else 0.0,
+                    funnel_enqueued=1 if i == 1 else 0,
+                    funnel_fills=1 if i == 2 else 0,
+                )
+                for i in range(60)
+            ]
+        )
+
+    def test_s5_policy_flat_window_is_warn_not_fail(self):
+        text = (
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: bucket=RANGE\n"
+            "2026-02-14 15:00:01 [INFO] SELF_EVOLUTION_ACTION: source=counterfactual\n"
+            + _runtime_line(
+                20,
+                0.0,
+                funnel_enqueued=0,
+                funnel_fills=0,
+                strategy_mix_samples=0,
+                strategy_mix_policy_flat_samples=12,
+                strategy_mix_latest_trend=0.0,
+                strategy_mix_latest_defensive=0.0,
+                strategy_mix_latest_blended=0.0,
+                strategy_mix_avg_abs_trend=0.0,
+                strategy_mix_avg_abs_defensive=0.0,
+                strategy_mix_avg_abs_blended=0.0,
+            )
+            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
+        )
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
+        self.assertNotIn("未检测到 GATE_CHECK_PASSED（S5 要求至少一个通过窗口）", report["fail_reasons"])
+        self.assertNotIn("未检测到有效策略信号窗口（strategy_mix.samples>0），S5 至少要求 1 个窗口", report["fail_reasons"])
+        self.assertNotIn("执行样本不足（S5 强门禁）", "\n".join(report["fail_reasons"]))
+        self.assertEqual(report["protection_status"], "PASS")
+        self.assertEqual(report["execution_status"], "NOT_EVALUATED")
+        self.assertEqual(report["runtime_validation_mode"], "POLICY_FLAT_PROTECTION")
+        self.assertEqual(report["market_context_status"], "RANGE_ONLY")
+        self.assertEqual(report["account_sync_status"], "OK")
+        self.assertIn("策略窗口以 policy-flat 为主", "\n".join(report["warn_reasons"]))
+        self.assertIn("等待趋势样本阶段", "\n".join(report["warn_reasons"]))
+
+    def test_s5_policy_flat_open_position_fails(self):
+        text = (
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: bucket=RANGE\n"
+            "2026-02-14 15:00:01 [INFO] SELF_EVOLUTION_ACTION: source=counterfactual\n"
+            "2026-02-14 15:00:10 [INFO] POLICY_FLAT_RESIDUAL_POSITION: symbol=BNBUSDT, current_notional=-378.000000, has_reduce_intent=false\n"
+            + _runtime_line(
+                20,
+                378.0,
+                funnel_enqueued=0,
+                funnel_fills=0,
+                strategy_mix_samples=0,
+                strategy_mix_policy_flat_samples=12,
+                strategy_mix_latest_trend=0.0,
+                strategy_mix_latest_defensive=0.0,
+                strategy_mix_latest_blended=0.0,
+                strategy_mix_avg_abs_trend=0.0,
+                strategy_mix_avg_abs_defensive=0.0,
+                strategy_mix_avg_abs_blended=0.0,
+            )
+            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
+        )
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
+        self.assertEqual(report["account_sync_status"], "POLICY_FLAT_OPEN_POSITION")
+        self.assertEqual(report["execution_status"], "FAIL")
+        self.assertEqual(report["metrics"]["policy_flat_residual_position_count"], 1)
+        self.assertIn("policy-flat 窗口结束仍有残余仓位", "\n".join(report["fail_reasons"]))
+        self.assertIn("policy-flat 窗口仍检测到残余仓位", "\n".join(report["warn_reasons"]))
+
+    def test_s5_policy_flat_window_accepts_runtime_evolution_enabled_as_init_evidence(self):
+        runtime_line = _runtime_line(
+            20,
+            0.0,
+            funnel_enqueued=0,
+            funnel_fills=0,
+            strategy_mix_samples=0,
+            strategy_mix_policy_flat_samples=12,
+            strategy_mix_latest_trend=0.0,
+            strategy_mix_latest_defensive=0.0,
+            strategy_mix_latest_blended=0.0,
+            strategy_mix_avg_abs_trend=0.0,
+            strategy_mix_avg_abs_defensive=0.0,
+            strategy_mix_avg_abs_blended=0.0,
+        )
+        runtime_line = runtime_line[:-1] + (
+            ", evolution={enabled=true, active_bucket=RANGE, active_trend_weight=0.5, "
+            "active_defensive_weight=0.5, next_eval_tick=600, cooldown=false, "
+            "cooldown_remaining_ticks=0}\n"
+        )
+        text = (
+            runtime_line
+            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
+        )
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
+        self.assertEqual(report["verdict"], "PASS_WITH_ACTIONS")
+        self.assertNotIn(
+            "未检测到 SELF_EVOLUTION_INIT/SELF_EVOLUTION_ACTION",
+            report["fail_reasons"],
+        )
+        self.assertEqual(
+            report["metrics"]["self_evolution_runtime_enabled_total_count"], 1
+        )
+
+    def test_s5_warns_when_assess_window_is_fresh_boot(self):
+        runtime_line = _runtime_line(
+            20,
+            0.0,
+            funnel_enqueued=0,
+            funnel_fills=0,
+            strategy_mix_samples=0,
+            strategy_mix_policy_flat_samples=12,
+            strategy_mix_latest_trend=0.0,
+            strategy_mix_latest_defensive=0.0,
+            strategy_mix_latest_blended=0.0,
+            strategy_mix_avg_abs_trend=0.0,
+            strategy_mix_avg_abs_defensive=0.0,
+            strategy_mix_avg_abs_blended=0.0,
+        )
+        runtime_line = runtime_line[:-1] + (
+            ", evolution={enabled=true, active_bucket=RANGE, active_trend_weight=0.5, "
+            "active_defensive_weight=0.5, next_eval_tick=600, cooldown=false, "
+            "cooldown_remaining_ticks=0}\n"
+        )
+        text = (
+            "2026-02-14 15:00:00 [INFO] PROCESS_START: "
+            "boot_id=boot-test, startup_utc=2026-02-14T15:00:00Z, "
+            "primary_symbol=BTCUSDT\n"
+            + runtime_line
+            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
+        )
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
+        self.assertEqual(report["metrics"]["runtime_boot_age_seconds"], 20.0)
+        self.assertEqual(report["metrics"]["runtime_boot_id_latest"], "boot-test")
+        self.assertIn("运行进程启动时间过短", "\n".join(report["warn_reasons"]))
+
+    def test_s5_runtime_boot_startup_fallback_when_process_start_filtered(self):
+        runtime_line = _runtime_line(
+            20,
+            0.0,
+            funnel_enqueued=0,
+            funnel_fills=0,
+            strategy_mix_samples=0,
+            strategy_mix_policy_flat_samples=12,
+            strategy_mix_latest_trend=0.0,
+            strategy_mix_latest_defensive=0.0,
+            strategy_mix_latest_blended=0.0,
+            strategy_mix_avg_abs_trend=0.0,
+            strategy_mix_avg_abs_defensive=0.0,
+            strategy_mix_avg_abs_blended=0.0,
+        )
+        runtime_line = runtime_line.replace(
+            "RUNTIME_STATUS: ticks=20, ",
+            "RUNTIME_STATUS: ticks=20, "
+            "boot={id=boot-fallback, startup_utc=2026-02-14T15:00:00Z}, ",
+        )
+        runtime_line = runtime_line[:-1] + (
+            ", evolution={enabled=true, active_bucket=RANGE, active_trend_weight=0.5, "
+            "active_defensive_weight=0.5, next_eval_tick=600, cooldown=false, "
+            "cooldown_remaining_ticks=0}\n"
+        )
+        text = (
+            runtime_line
+            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
+        )
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
+        self.assertEqual(
+            report["metrics"]["process_start_utc"], "2026-02-14T15:00:00Z"
+        )
+        self.assertEqual(report["metrics"]["runtime_boot_age_seconds"], 20.0)
+        self.assertEqual(
+            report["metrics"]["runtime_boot_id_latest"], "boot-fallback"
+        )
+        self.assertIn("运行进程启动时间过短", "\n".join(report["warn_reasons"]))
+
+    def test_s5_policy_flat_window_without_evolution_evidence_still_fails(self):
+        text = (
+            _runtime_line(
+                20,
+                0.0,
+                funnel_enqueued=0,
+                funnel_fills=0,
+                strategy_mix_samples=0,
+                strategy_mix_policy_flat_samples=12,
+                strategy_mix_latest_trend=0.0,
+                strategy_mix_latest_defensive=0.0,
+                strategy_mix_latest_blended=0.0,
+                strategy_mix_avg_abs_trend=0.0,
+                strategy_mix_avg_abs_defensive=0.0,
+                strategy_mix_avg_abs_blended=0.0,
+            )
+            + "2026-02-14 15:00:20 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=12, policy_flat=true\n"
+        )
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
+        self.assertEqual(report["verdict"], "FAIL")
+        self.assertIn(
+            "未检测到 SELF_EVOLUTION_INIT/SELF_EVOLUTION_ACTION",
+            report["fail_reasons"],
+        )
+
+    def test_s5_warns_when_all_active_symbols_have_negative_net_quality(self):
+        lines = [
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600",
+            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=10, effective_signals=10, fills=12",
+            "2026-02-14 15:00:01 [INFO] FILL_APPLIED: fill_id=btc-open, client_order_id=btc-open, symbol=BTCUSDT, side=Buy, qty=1.0, price=100.0, fee=0.000000, liquidity=maker",
+            "2026-02-14 15:00:02 [INFO] FILL_APPLIED: fill_id=btc-close, client_order_id=btc-close, symbol=BTCUSDT, side=Sell, qty=1.0, price=100.0, fee=-0.100000, liquidity=taker",
+        ]
+        for idx in range(5):
+            lines.extend(
+                [
+                    f"2026-02-14 15:01:{idx * 2:02d} [INFO] FILL_APPLIED: fill_id=sol-open-{idx}, client_order_id=sol-open-{idx}, symbol=SOLUSDT, side=Buy, qty=1.0, price=20.0, fee=0.000000, liquidity=maker",
+                    f"2026-02-14 15:01:{idx * 2 + 1:02d} [INFO] FILL_APPLIED: fill_id=sol-close-{idx}, client_order_id=sol-close-{idx}, symbol=SOLUSDT, side=Sell, qty=1.0, price=20.0, fee=-0.040000, liquidity=maker",
+                ]
+            )
+        runtime = "".join(
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1,
+                    funnel_fills=1,
+                    realized_net_per_fill=0.01,
+                    fee_bps_per_fill=1.0,
+                    maker_fills=1,
+                    explicit_liquidity_fills=1,
+                    explicit_liquidity_fill_ratio=1.0,
+                    maker_fill_ratio=1.0,
+                    regime_bucket="TREND",
+                )
+                for i in range(50)
+            ]
+        )
+        text = "\n".join(lines) + "\n" + runtime
+
+        report = ASSESS.assess(
+            text,
+            self.S5_RULES,
+            min_runtime_status=50,
+            s5_min_fill_windows=0,
+        )
+        self.assertTrue(
+            self._has_reason(
+                report["warn_reasons"],
+                "所有成交币对按 realized_net_per_fill 统计均为负",
+            )
+        )
+
+    def test_s5_execution_active_window_sets_execution_pass(self):
+        runtime = "".join(
+            [
+                _runtime_line(
+                    tick,
+                    0.0,
+                    funnel_enqueued=1,
+                    funnel_fills=1,
+                    strategy_mix_samples=10,
+                    strategy_mix_policy_flat_samples=0,
+                    realized_net_per_fill=0.001,
+                    fee_bps_per_fill=0.1,
+                    maker_fills=1,
+                    regime_bucket="TREND",
+                )
+                for tick in range(20, 240, 20)
+            ]
+        )
+        text = (
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: bucket=TREND\n"
+            "2026-02-14 15:00:01 [INFO] SELF_EVOLUTION_ACTION: source=counterfactual\n"
+            "2026-02-14 15:00:10 [INFO] GATE_CHECK_PASSED: raw_signals=2, order_intents=1, effective_signals=2, fills=1\n"
+            + runtime
+        )
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=1)
+        self.assertEqual(report["protection_status"], "PASS")
+        self.assertEqual(report["execution_status"], "PASS")
+        self.assertEqual(report["runtime_validation_mode"], "EXECUTION_ACTIVE")
+
+    def test_s5_trend_runtime_without_participation_fails_execution(self):
+        text = "".join(
+            [
+                _runtime_line(
+                    tick,
+                    0.0,
+                    funnel_enqueued=0,
+                    funnel_fills=0,
+                    strategy_mix_samples=0,
+                    strategy_mix_policy_flat_samples=0,
+                    strategy_mix_latest_trend=0.0,
+                    strategy_mix_latest_defensive=0.0,
+                    strategy_mix_latest_blended=0.0,
+                    strategy_mix_avg_abs_trend=0.0,
+                    strategy_mix_avg_abs_defensive=0.0,
+                    strategy_mix_avg_abs_blended=0.0,
+                    regime_bucket="TREND",
+                )
+                for tick in range(20, 220, 20)
+            ]
+        )
+        text = (
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: bucket=TREND\n"
+            "2026-02-14 15:00:01 [INFO] SELF_EVOLUTION_ACTION: source=counterfactual\n"
+            "2026-02-14 15:00:10 [INFO] GATE_CHECK_PASSED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, policy_flat_signals=0, policy_flat=false\n"
+            + text
+        )
+        report = ASSESS.assess(
+            text,
+            self.S5_RULES,
+            min_runtime_status=1,
+            s5_min_fill_windows=0,
+            s5_min_trend_runtime_windows=5,
+        )
+        self.assertEqual(report["protection_status"], "PASS")
+        self.assertEqual(report["execution_status"], "FAIL")
+        self.assertIn("TREND 桶出现但未形成策略参与或执行样本", "\n".join(report["execution_fail_reasons"]))
+
+    def test_s5_warn_when_evolution_actions_without_effective_updates(self):
+        runtime = self._S5_BASELINE_RUNTIME_60
+        actions = _SKIPPED_EVOLUTION_ACTION * 35
+        text = (
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
+            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=1, effective_signals=10, fills=1\n"
+            "2026-02-14 15:30:01 [INFO] BYBIT_SUBMIT: order_type=Limit, symbol=BTCUSDT\n"
+            + actions
+            + runtime
+        )
+        report = ASSESS.assess(
+            text,
+            self.S5_RULES,
+            min_runtime_status=50,
+            s5_min_fill_windows=0,
+        )
+        self.assertEqual(report["verdict"], "FAIL")
+        self.assertTrue(
+            self._has_reason(report["fail_reasons"], "SELF_EVOLUTION 有评估无有效更新")
+        )
+        self.assertTrue(
+            self._has_reason(report["warn_reasons"], "SELF_EVOLUTION 长时间仅评估未更新")
+        )
+
+    def test_s5_no_warn_when_evolution_has_effective_updates(self):
+        runtime = self._S5_BASELINE_RUNTIME_60
+        update_action = (
+            "2026-02-14 15:00:10 [INFO] SELF_EVOLUTION_ACTION: type=updated, bucket=RANGE, "
+            "reason=EVOLUTION_COUNTERFACTUAL_INCREASE_TREND, counterfactual_search=true, "
+            "learnability={enabled=true, passed=true, t_stat=1.200000, samples=140}\n"
+        )
+        non_update_actions = _SKIPPED_EVOLUTION_ACTION * 34
+        text = (
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
+            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=1, effective_signals=10, fills=1\n"
+            "2026-02-14 15:30:01 [INFO] BYBIT_SUBMIT: order_type=Limit, symbol=BTCUSDT\n"
+            + update_action
+            + non_update_actions
+            + runtime
+        )
+        report = ASSESS.assess(
+            text,
+            self.S5_RULES,
+            min_runtime_status=50,
+            s5_min_fill_windows=0,
+        )
+        self.assertEqual(report["verdict"], "PASS")
+        self.assertFalse(
+            self._has_reason(report["warn_reasons"], "SELF_EVOLUTION 长时间仅评估未更新")
+        )
+
+    def test_s5_objective_update_counts_as_effective_update(self):
+        runtime = self._S5_BASELINE_RUNTIME_60
+        update_action = (
+            "2026-02-14 15:00:10 [INFO] SELF_EVOLUTION_ACTION: type=updated, bucket=RANGE, "
+            "reason=EVOLUTION_WEIGHT_INCREASE_TREND, counterfactual_search=true, "
+            "learnability={enabled=true, passed=true, t_stat=1.200000, samples=140}\n"
+        )
+        non_update_actions = _SKIPPED_EVOLUTION_ACTION * 34
+        text = (
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
+            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=1, effective_signals=10, fills=1\n"
+            "2026-02-14 15:30:01 [INFO] BYBIT_SUBMIT: order_type=Limit, symbol=BTCUSDT\n"
+            + update_action
+            + non_update_actions
+            + runtime
+        )
+        report = ASSESS.assess(
+            text,
+            self.S5_RULES,
+            min_runtime_status=50,
+            s5_min_fill_windows=0,
+        )
+        self.assertEqual(report["verdict"], "PASS")
+        self.assertEqual(report["metrics"]["self_evolution_objective_update_count"], 1)
+        self.assertEqual(report["metrics"]["self_evolution_effective_update_count"], 1)
+
+    def test_s5_fail_when_realized_net_per_fill_below_threshold(self):
+        runtime = "".join(
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1,
+                    funnel_fills=1,
+                    realized_net_per_fill=-0.02,
+                    fee_bps_per_fill=6.0,
+                    maker_fills=1,
+                    taker_fills=1,
+                    unknown_fills=0,
+                    explicit_liquidity_fills=2,
+                    fee_sign_fallback_fills=0,
+                    unknown_fill_ratio=0.0,
+                    explicit_liquidity_fill_ratio=1.0,
+                    fee_sign_fallback_fill_ratio=0.0,
+                    maker_fee_bps=-0.2,
+                    taker_fee_bps=6.5,
+                    maker_fill_ratio=0.5,
+                )
+                for i in range(60)
+            ]
+        )
+        text = (
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
+            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=10, effective_signals=10, fills=10\n"
+            + runtime
+        )
+        report = ASSESS.assess(
+            text,
+            self.S5_RULES,
+            min_runtime_status=50,
+            s5_min_fill_windows=0,
+        )
+        self.assertEqual(report["verdict"], "FAIL")
+        self.assertTrue(
+            self._has_reason(report["fail_reasons"], "执行净收益质量未达标")
+        )
+
+    def test_s5_prefers_attribution_net_quality_over_runtime_window_average(self):
+        fill_lines = []
+        for idx in range(5):
+            fill_lines.extend(
+                [
+                    f"2026-02-14 15:00:{idx * 2:02d} [INFO] FILL_APPLIED: fill_id=open-{idx}, client_order_id=open-{idx}, symbol=SOLUSDT, side=Buy, qty=1.0, price=100.0, fee=0.000000, liquidity=maker",
+                    f"2026-02-14 15:00:{idx * 2 + 1:02d} [INFO] FILL_APPLIED: fill_id=close-{idx}, client_order_id=close-{idx}, symbol=SOLUSDT, side=Sell, qty=1.0, price=100.0, fee=-0.040000, liquidity=maker",
+                ]
+            )
+        runtime = "".join(
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1,
+                    funnel_fills=1,
+                    realized_net_per_fill=0.01,
+                    fee_bps_per_fill=1.0,
+                    maker_fills=1,
+                    explicit_liquidity_fills=1,
+                    explicit_liquidity_fill_ratio=1.0,
+                    maker_fill_ratio=1.0,
+                )
+                for i in range(60)
+            ]
+        )
+        text = (
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
+            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=10, effective_signals=10, fills=10\n"
+            + "\n".join(fill_lines)
+            + "\n"
+            + runtime
+        )
+        report = ASSESS.assess(
+            text,
+            self.S5_RULES,
+            min_runtime_status=50,
+            s5_min_fill_windows=0,
+        )
+
+        self.assertEqual(report["verdict"], "FAIL")
+        self.assertAlmostEqual(report["metrics"]["realized_net_per_fill"], 0.01)
+        self.assertEqual(
+            report["metrics"]["execution_attribution_quality_fill_count"], 10
+        )
+        self.assertAlmostEqual(
+            report["metrics"]["execution_attribution_realized_net_per_fill"],
+            -0.02,
+        )
+        self.assertTrue(
+            self._has_reason(report["fail_reasons"], "execution_attribution")
+        )
+
+    def test_s5_fail_when_protection_missing_event_observed(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1,
-                funnel_fills=1,
-                realized_net_per_fill=0.01,
-                fee_bps_per_fill=1.0,
-                maker_fills=1,
-                explicit_liquidity_fills=1,
-                explicit_liquidity_fill_ratio=1.0,
-                maker_fill_ratio=1.0,
-            )
-            for i in range(60)
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1,
+                    funnel_fills=1,
+                    realized_net_per_fill=0.01,
+                    fee_bps_per_fill=1.0,
+                    maker_fills=1,
+                    explicit_liquidity_fills=1,
+                    explicit_liquidity_fill_ratio=1.0,
+                    maker_fill_ratio=1.0,
+                )
+                for i in range(60)
+            ]
+        )
+        text = (
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
+            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=10, effective_signals=10, fills=10\n"
+            "2026-02-14 15:30:01 [INFO] EXEC_PROTECTIVE_ORDER_MISSING: reason=managed_sl_enqueue_failed, symbol=BTCUSDT\n"
+            + runtime
+        )
+        report = ASSESS.assess(
+            text,
+            self.S5_RULES,
+            min_runtime_status=50,
+            s5_min_fill_windows=0,
+            s5_protection_enabled=True,
+        )
+        self.assertEqual(report["verdict"], "FAIL")
+        self.assertEqual(report["metrics"]["protective_order_missing_count"], 1)
+        self.assertTrue(
+            self._has_reason(report["fail_reasons"], "保护单缺失事件超阈值")
+        )
+
+    def test_s5_ignore_protection_missing_gate_when_protection_disabled(self):
+        runtime = "".join(
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1,
+                    funnel_fills=1,
+                    realized_net_per_fill=0.01,
+                    fee_bps_per_fill=1.0,
+                    maker_fills=1,
+                    explicit_liquidity_fills=1,
+                    explicit_liquidity_fill_ratio=1.0,
+                    maker_fill_ratio=1.0,
+                )
+                for i in range(60)
+            ]
         )
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
@@ -2207,7 +2660,7 @@ class AssessRunLogTest(unittest.TestCase):
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
+            self.S5_RULES,
             min_runtime_status=50,
             s5_min_fill_windows=0,
             s5_protection_enabled=False,
@@ -2215,24 +2668,26 @@ class AssessRunLogTest(unittest.TestCase):
         self.assertNotEqual(report["verdict"], "FAIL")
         self.assertEqual(report["metrics"]["protective_order_missing_count"], 1)
         self.assertFalse(
-            any("保护单缺失事件超阈值" in x for x in report["fail_reasons"])
+            self._has_reason(report["fail_reasons"], "保护单缺失事件超阈值")
         )
 
     def test_s5_warn_when_tp_attach_failed_with_protection_enabled(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1,
-                funnel_fills=1,
-                realized_net_per_fill=0.01,
-                fee_bps_per_fill=1.0,
-                maker_fills=1,
-                explicit_liquidity_fills=1,
-                explicit_liquidity_fill_ratio=1.0,
-                maker_fill_ratio=1.0,
-            )
-            for i in range(60)
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1,
+                    funnel_fills=1,
+                    realized_net_per_fill=0.01,
+                    fee_bps_per_fill=1.0,
+                    maker_fills=1,
+                    explicit_liquidity_fills=1,
+                    explicit_liquidity_fill_ratio=1.0,
+                    maker_fill_ratio=1.0,
+                )
+                for i in range(60)
+            ]
         )
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
@@ -2245,7 +2700,7 @@ class AssessRunLogTest(unittest.TestCase):
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
+            self.S5_RULES,
             min_runtime_status=50,
             s5_min_fill_windows=0,
             s5_protection_enabled=True,
@@ -2257,55 +2712,59 @@ class AssessRunLogTest(unittest.TestCase):
         self.assertEqual(report["metrics"]["profit_protection_update_count"], 1)
         self.assertEqual(report["metrics"]["profit_protection_crossed_count"], 1)
         self.assertTrue(
-            any("TP 挂单失败事件已观测到" in x for x in report["warn_reasons"])
+            self._has_reason(report["warn_reasons"], "TP 挂单失败事件已观测到")
         )
         self.assertTrue(
-            any("盈利保护候选 SL 已被当前价格穿越" in x for x in report["warn_reasons"])
+            self._has_reason(report["warn_reasons"], "盈利保护候选 SL 已被当前价格穿越")
         )
 
     def test_s5_fail_when_fill_windows_below_minimum(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1,
-                funnel_fills=1,
-                realized_net_per_fill=0.02,
-                fee_bps_per_fill=1.5,
-                maker_fills=1,
-                taker_fills=0,
-                unknown_fills=0,
-                explicit_liquidity_fills=1,
-                fee_sign_fallback_fills=0,
-                unknown_fill_ratio=0.0,
-                explicit_liquidity_fill_ratio=1.0,
-                fee_sign_fallback_fill_ratio=0.0,
-                maker_fee_bps=-0.2,
-                taker_fee_bps=6.5,
-                maker_fill_ratio=1.0,
-            )
-            for i in range(8)
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1,
+                    funnel_fills=1,
+                    realized_net_per_fill=0.02,
+                    fee_bps_per_fill=1.5,
+                    maker_fills=1,
+                    taker_fills=0,
+                    unknown_fills=0,
+                    explicit_liquidity_fills=1,
+                    fee_sign_fallback_fills=0,
+                    unknown_fill_ratio=0.0,
+                    explicit_liquidity_fill_ratio=1.0,
+                    fee_sign_fallback_fill_ratio=0.0,
+                    maker_fee_bps=-0.2,
+                    taker_fee_bps=6.5,
+                    maker_fill_ratio=1.0,
+                )
+                for i in range(8)
+            ]
         )
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
             "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=10, order_intents=10, effective_signals=10, fills=8\n"
             + runtime
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=5)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=5)
         self.assertEqual(report["verdict"], "FAIL")
-        self.assertTrue(any("执行样本不足" in x for x in report["fail_reasons"]))
+        self.assertTrue(self._has_reason(report["fail_reasons"], "执行样本不足"))
 
     def test_s5_sample_starvation_failure_reports_probe_and_throttle_causes(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1 if i == 0 else 0,
-                funnel_fills=1 if i == 0 else 0,
-                realized_net_per_fill=0.02,
-                fee_bps_per_fill=1.5,
-            )
-            for i in range(5)
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1 if i == 0 else 0,
+                    funnel_fills=1 if i == 0 else 0,
+                    realized_net_per_fill=0.02,
+                    fee_bps_per_fill=1.5,
+                )
+                for i in range(5)
+            ]
         )
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
@@ -2316,7 +2775,7 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:00:05 [INFO] ORDER_THROTTLED: symbol=SOLUSDT, client_order_id=reduce-1, reason=strategy_reduce_cost_guard\n"
             + runtime
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=5)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=5)
         self.assertEqual(report["verdict"], "FAIL")
         failure_text = "\n".join(report["fail_reasons"])
         self.assertIn("sample_starvation", failure_text)
@@ -2329,19 +2788,20 @@ class AssessRunLogTest(unittest.TestCase):
 
     def test_s5_fail_when_fill_windows_exist_but_execution_window_missing(self):
         runtime = "".join(
-            re.sub(
-                r", execution_window=\{[^}]*\},",
-                ",",
-                self._runtime_line(
-                    20 + i * 20,
-                    0.0,
-                    funnel_enqueued=1,
-                    funnel_fills=1,
-                    realized_net_per_fill=-0.02,
-                    fee_bps_per_fill=6.0,
-                ),
-            )
-            for i in range(60)
+            [
+                _EXECUTION_WINDOW_FIELD_RE.sub(
+                    ",",
+                    _runtime_line(
+                        20 + i * 20,
+                        0.0,
+                        funnel_enqueued=1,
+                        funnel_fills=1,
+                        realized_net_per_fill=-0.02,
+                        fee_bps_per_fill=6.0,
+                    ),
+                )
+                for i in range(60)
+            ]
         )
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
@@ -2350,27 +2810,29 @@ class AssessRunLogTest(unittest.TestCase):
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
+            self.S5_RULES,
             min_runtime_status=50,
             s5_min_fill_windows=0,
         )
         self.assertEqual(report["verdict"], "FAIL")
         self.assertTrue(
-            any("执行净收益质量门禁无法评估" in x for x in report["fail_reasons"])
+            self._has_reason(report["fail_reasons"], "执行净收益质量门禁无法评估")
         )
 
     def test_s5_fail_when_equity_change_below_threshold(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1,
-                funnel_fills=1,
-                realized_net_per_fill=0.01,
-                equity=100000.0 - float(i) * 2.0,
-                realized_net=0.0,
-            )
-            for i in range(60)
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1,
+                    funnel_fills=1,
+                    realized_net_per_fill=0.01,
+                    equity=100000.0 - float(i) * 2.0,
+                    realized_net=0.0,
+                )
+                for i in range(60)
+            ]
         )
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
@@ -2379,28 +2841,30 @@ class AssessRunLogTest(unittest.TestCase):
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
+            self.S5_RULES,
             min_runtime_status=50,
             s5_min_equity_change_usd=-50.0,
             s5_min_equity_change_samples=10,
         )
         self.assertEqual(report["verdict"], "FAIL")
         self.assertTrue(
-            any("权益变化未达标" in x for x in report["fail_reasons"])
+            self._has_reason(report["fail_reasons"], "权益变化未达标")
         )
 
     def test_s5_fail_when_equity_realized_gap_above_threshold(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1,
-                funnel_fills=1,
-                realized_net_per_fill=0.01,
-                equity=100000.0 + float(i) * 3.0,
-                realized_net=0.0,
-            )
-            for i in range(60)
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1,
+                    funnel_fills=1,
+                    realized_net_per_fill=0.01,
+                    equity=100000.0 + float(i) * 3.0,
+                    realized_net=0.0,
+                )
+                for i in range(60)
+            ]
         )
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
@@ -2409,20 +2873,22 @@ class AssessRunLogTest(unittest.TestCase):
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
+            self.S5_RULES,
             min_runtime_status=50,
             s5_max_equity_vs_realized_gap_usd=120.0,
             s5_min_equity_change_samples=10,
         )
         self.assertEqual(report["verdict"], "FAIL")
         self.assertTrue(
-            any("权益与已实现净盈亏偏差过大" in x for x in report["fail_reasons"])
+            self._has_reason(report["fail_reasons"], "权益与已实现净盈亏偏差过大")
         )
 
     def test_s5_fail_when_no_gate_pass(self):
         runtime = "".join(
-            self._runtime_line(20 + i * 20, 0.0, reduce_only=(i % 2 == 0))
-            for i in range(60)
+            [
+                _runtime_line(20 + i * 20, 0.0, reduce_only=(i % 2 == 0))
+                for i in range(60)
+            ]
         )
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
@@ -2431,25 +2897,17 @@ class AssessRunLogTest(unittest.TestCase):
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
+            self.S5_RULES,
             min_runtime_status=50,
             s5_min_fill_windows=0,
         )
         self.assertEqual(report["verdict"], "FAIL")
         self.assertTrue(
-            any("未检测到 GATE_CHECK_PASSED" in x for x in report["fail_reasons"])
+            self._has_reason(report["fail_reasons"], "未检测到 GATE_CHECK_PASSED")
         )
 
     def test_s5_rebase_when_start_not_flat(self):
-        runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                180.0 if i == 0 else 0.0,
-                funnel_enqueued=1 if i == 1 else 0,
-                funnel_fills=1 if i == 2 else 0,
-            )
-            for i in range(60)
-        )
+        runtime = self._S5_REBASE_RUNTIME_60
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
             "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=4, order_intents=4, effective_signals=4, fills=1\n"
@@ -2457,65 +2915,48 @@ class AssessRunLogTest(unittest.TestCase):
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
+            self.S5_RULES,
             min_runtime_status=50,
             s5_min_fill_windows=0,
         )
         self.assertEqual(report["verdict"], "PASS")
         self.assertEqual(report["fail_reasons"], [])
         self.assertEqual(report["metrics"]["flat_start_rebase_applied_count"], 1)
-        self.assertTrue(bool(report.get("flat_start_rebased")))
+        self.assertIs(report["flat_start_rebased"], True)
 
     def test_s5_rebase_when_start_not_flat_with_compose_prefix(self):
-        runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                180.0 if i == 0 else 0.0,
-                funnel_enqueued=1 if i == 1 else 0,
-                funnel_fills=1 if i == 2 else 0,
-                prefix="ai-trade  | ",
-            )
-            for i in range(60)
-        )
-        text = (
-            "ai-trade  | 2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
-            "ai-trade  | 2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=4, order_intents=4, effective_signals=4, fills=1\n"
+        runtime = self._S5_REBASE_RUNTIME_60
+        text = _with_compose_prefix(
+            "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
+            "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=4, order_intents=4, effective_signals=4, fills=1\n"
             + runtime
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
+            self.S5_RULES,
             min_runtime_status=50,
             s5_min_fill_windows=0,
         )
         self.assertEqual(report["verdict"], "PASS")
         self.assertEqual(report["fail_reasons"], [])
         self.assertEqual(report["metrics"]["flat_start_rebase_applied_count"], 1)
-        self.assertTrue(bool(report.get("flat_start_rebased")))
+        self.assertIs(report["flat_start_rebased"], True)
 
     def test_s5_fail_when_no_flat_sample(self):
-        runtime = "".join(self._runtime_line(20 + i * 20, 180.0) for i in range(60))
+        runtime = "".join([_runtime_line(20 + i * 20, 180.0) for i in range(60)])
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
             "2026-02-14 15:30:00 [INFO] GATE_CHECK_PASSED: raw_signals=4, order_intents=4, effective_signals=4, fills=1\n"
             + runtime
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=50)
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=50)
         self.assertEqual(report["verdict"], "FAIL")
         self.assertTrue(
-            any("运行窗口起点非平仓状态" in x for x in report["fail_reasons"])
+            self._has_reason(report["fail_reasons"], "运行窗口起点非平仓状态")
         )
 
     def test_s5_pass_with_execution_activity(self):
-        runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1 if i == 0 else 0,
-                funnel_fills=1 if i == 1 else 0,
-            )
-            for i in range(60)
-        )
+        runtime = self._S5_BASELINE_RUNTIME_60
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
             "2026-02-14 15:00:10 [INFO] SELF_EVOLUTION_ACTION: type=skipped, bucket=RANGE, reason=EVOLUTION_WINDOW_PNL_TOO_SMALL\n"
@@ -2525,7 +2966,7 @@ class AssessRunLogTest(unittest.TestCase):
         )
         report = ASSESS.assess(
             text,
-            ASSESS.STAGE_RULES["S5"],
+            self.S5_RULES,
             min_runtime_status=50,
             s5_min_fill_windows=0,
         )
@@ -2534,20 +2975,22 @@ class AssessRunLogTest(unittest.TestCase):
 
     def test_s5_fail_when_no_strategy_mix_window(self):
         runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=1 if i == 0 else 0,
-                funnel_fills=1 if i == 1 else 0,
-                strategy_mix_samples=0,
-                strategy_mix_latest_trend=0.0,
-                strategy_mix_latest_defensive=0.0,
-                strategy_mix_latest_blended=0.0,
-                strategy_mix_avg_abs_trend=0.0,
-                strategy_mix_avg_abs_defensive=0.0,
-                strategy_mix_avg_abs_blended=0.0,
-            )
-            for i in range(60)
+            [
+                _runtime_line(
+                    20 + i * 20,
+                    0.0,
+                    funnel_enqueued=1 if i == 0 else 0,
+                    funnel_fills=1 if i == 1 else 0,
+                    strategy_mix_samples=0,
+                    strategy_mix_latest_trend=0.0,
+                    strategy_mix_latest_defensive=0.0,
+                    strategy_mix_latest_blended=0.0,
+                    strategy_mix_avg_abs_trend=0.0,
+                    strategy_mix_avg_abs_defensive=0.0,
+                    strategy_mix_avg_abs_blended=0.0,
+                )
+                for i in range(60)
+            ]
         )
         text = (
             "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
@@ -2556,157 +2999,10 @@ class AssessRunLogTest(unittest.TestCase):
             "2026-02-14 15:30:01 [INFO] BYBIT_SUBMIT: order_type=Limit, symbol=BTCUSDT\n"
             + runtime
         )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["S5"], min_runtime_status=50)
-        self.assertEqual(report["verdict"], "FAIL")
-        self.assertTrue(
-            any("未检测到有效策略信号窗口" in x for x in report["fail_reasons"])
-        )
-
-    def test_deploy_ignores_soft_warns(self):
-        runtime = "".join(
-            self._runtime_line(20 + i * 20, 0.0, reduce_only=True)
-            for i in range(12)
-        )
-        text = (
-            "2026-02-14 15:30:00 [INFO] GATE_CHECK_FAILED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, fail_reasons=[FAIL_LOW_ACTIVITY_SIGNALS,FAIL_LOW_ACTIVITY_FILLS]\n"
-            "2026-02-14 15:30:01 [INFO] GATE_CHECK_FAILED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, fail_reasons=[FAIL_LOW_ACTIVITY_SIGNALS,FAIL_LOW_ACTIVITY_FILLS]\n"
-            + runtime
-        )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["DEPLOY"], min_runtime_status=2)
-        self.assertEqual(report["verdict"], "PASS")
-        self.assertEqual(report["warn_reasons"], [])
-
-    def test_deploy_ignores_strategy_fail_like_signals(self):
-        runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                180.0 if i == 0 else 0.0,
-                reduce_only=True,
-                trading_halted=True,
-            )
-            for i in range(12)
-        )
-        text = (
-            "2026-02-14 15:30:00 [INFO] GATE_CHECK_FAILED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, fail_reasons=[FAIL_LOW_ACTIVITY_SIGNALS,FAIL_LOW_ACTIVITY_FILLS]\n"
-            "2026-02-14 15:30:01 [INFO] GATE_CHECK_FAILED: raw_signals=0, order_intents=0, effective_signals=0, fills=0, fail_reasons=[FAIL_LOW_ACTIVITY_SIGNALS,FAIL_LOW_ACTIVITY_FILLS]\n"
-            + runtime
-        )
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["DEPLOY"], min_runtime_status=2)
-        self.assertEqual(report["verdict"], "PASS")
-        self.assertEqual(report["fail_reasons"], [])
-        self.assertEqual(report["warn_reasons"], [])
-
-    def test_deploy_fail_on_ws_unhealthy(self):
-        text = self._runtime_line(20, 0.0, public_ws_healthy=False)
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["DEPLOY"], min_runtime_status=1)
-        self.assertEqual(report["verdict"], "FAIL")
-        self.assertTrue(any("WS 健康检查失败次数" in x for x in report["fail_reasons"]))
-
-    def test_deploy_fail_on_critical(self):
-        text = "2026-02-14 15:30:01 [CRITICAL] fatal error\n" + self._runtime_line(20, 0.0)
-        report = ASSESS.assess(text, ASSESS.STAGE_RULES["DEPLOY"], min_runtime_status=1)
-        self.assertEqual(report["verdict"], "FAIL")
-        self.assertTrue(any("出现 CRITICAL" in x for x in report["fail_reasons"]))
-
-    def test_deploy_allows_zero_runtime_status(self):
-        text = "2026-02-14 15:00:00 [INFO] SELF_EVOLUTION_INIT: trend_weight=0.5, defensive_weight=0.5, update_interval_ticks=600\n"
-        report = ASSESS.assess(
-            text,
-            ASSESS.STAGE_RULES["DEPLOY"],
-            min_runtime_status=ASSESS.STAGE_RULES["DEPLOY"].min_runtime_status,
-        )
-        self.assertEqual(report["verdict"], "PASS")
-
-    def test_smoke_allows_short_health_window_without_strategy_activity(self):
-        runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=0,
-                funnel_fills=0,
-                strategy_mix_samples=0,
-                strategy_mix_latest_trend=0.0,
-                strategy_mix_latest_defensive=0.0,
-                strategy_mix_latest_blended=0.0,
-                strategy_mix_avg_abs_trend=0.0,
-                strategy_mix_avg_abs_defensive=0.0,
-                strategy_mix_avg_abs_blended=0.0,
-            )
-            for i in range(3)
-        )
-        report = ASSESS.assess(
-            runtime,
-            ASSESS.STAGE_RULES["SMOKE"],
-            min_runtime_status=3,
-            s5_min_fill_windows=1,
-        )
-        self.assertEqual(report["verdict"], "PASS")
-        self.assertFalse(
-            any("未检测到执行活动" in x for x in report["fail_reasons"])
-        )
-        self.assertFalse(
-            any("未检测到有效策略信号窗口" in x for x in report["fail_reasons"])
-        )
-
-    def test_smoke_strategy_activity_without_execution_uses_strategy_active_mode(self):
-        runtime = "".join(
-            self._runtime_line(
-                20 + i * 20,
-                0.0,
-                funnel_enqueued=0,
-                funnel_fills=0,
-                strategy_mix_samples=6,
-                strategy_mix_policy_flat_samples=0,
-                strategy_mix_latest_trend=180.0,
-                strategy_mix_latest_defensive=-60.0,
-                strategy_mix_latest_blended=120.0,
-                strategy_mix_avg_abs_trend=180.0,
-                strategy_mix_avg_abs_defensive=60.0,
-                strategy_mix_avg_abs_blended=120.0,
-            )
-            for i in range(3)
-        )
-        report = ASSESS.assess(
-            runtime,
-            ASSESS.STAGE_RULES["SMOKE"],
-            min_runtime_status=3,
-        )
-        self.assertEqual(report["execution_status"], "PASS")
-        self.assertEqual(
-            report["runtime_validation_mode"], "STRATEGY_ACTIVE_NO_EXECUTION"
-        )
-        self.assertEqual(report["metrics"]["execution_activity_count"], 0)
-        self.assertGreater(report["metrics"]["strategy_mix_nonzero_window_count"], 0)
-
-    def test_smoke_fail_on_reconcile_mismatch(self):
-        text = (
-            self._runtime_line(20, 0.0)
-            + "2026-02-14 15:00:21 [WARN] OMS_RECONCILE_MISMATCH: symbol=BTCUSDT\n"
-        )
-        report = ASSESS.assess(
-            text,
-            ASSESS.STAGE_RULES["SMOKE"],
-            min_runtime_status=1,
-        )
-        self.assertEqual(report["verdict"], "FAIL")
-        self.assertTrue(
-            any("SMOKE 检测到对账不一致" in x for x in report["fail_reasons"])
-        )
-
-    def test_smoke_fail_on_overfill_guard(self):
-        text = (
-            self._runtime_line(20, 0.0)
-            + "2026-02-14 15:00:22 [WARN] FILL_OVERFILL_DROP: order_id=abc\n"
-        )
-        report = ASSESS.assess(
-            text,
-            ASSESS.STAGE_RULES["SMOKE"],
-            min_runtime_status=1,
-        )
+        report = ASSESS.assess(text, self.S5_RULES, min_runtime_status=50)
         self.assertEqual(report["verdict"], "FAIL")
-        self.assertEqual(report["metrics"]["fill_overfill_drop_count"], 1)
         self.assertTrue(
-            any("SMOKE 检测到 fill overfill 防线触发" in x for x in report["fail_reasons"])
+            self._has_reason(report["fail_reasons"], "未检测到有效策略信号窗口")
         )
 
 
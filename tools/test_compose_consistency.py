@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import functools
 import os
 import pathlib
 import re
@@ -7,6 +8,7 @@ import shutil
 import subprocess
 import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
@@ -26,48 +28,54 @@ S5_CONFIG = ROOT / "config" / "bybit.demo.s5.yaml"
 REPLAY_MAKER_FIRST_CONFIG = ROOT / "config" / "bybit.replay.assess.maker_first.yaml"
 DEMO_INCUBATION_POLICY = ROOT / "config" / "demo_incubation_policy.json"
 DEMO_INCUBATION_EVALUATOR = ROOT / "tools" / "evaluate_demo_incubation.py"
+DOCKER_BIN = shutil.which("docker")
+
+COMPOSE_SERVICES_HEADER_RE = re.compile(r"^services:\s*$")
+COMPOSE_TOPLEVEL_KEY_RE = re.compile(r"^[A-Za-z0-9_.-]+:\s*$")
+COMPOSE_SERVICE_NAME_RE = re.compile(r"^  ([A-Za-z0-9_.-]+):\s*$")
+COMPOSE_CONTAINER_NAME_RE = re.compile(r"^\s*container_name:\s*([^\s#]+)\s*$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def read_repo_text(path: pathlib.Path) -> str:
+    # 仓库内的 compose/脚本/workflow 在一次测试运行中不会变化，每个文件只读一次。
+    return path.read_text(encoding="utf-8")
 
 
 def parse_services(compose_path: pathlib.Path):
-    text = compose_path.read_text(encoding="utf-8")
+    text = read_repo_text(compose_path)
     lines = text.splitlines()
     services = {}
     in_services = False
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+    name = None
+    start = 0
+    end = len(lines)
+    # 单遍扫描：遇到下一个服务头时收尾上一个服务，不再为每个服务向前重扫。
+    for idx, line in enumerate(lines):
         if not in_services:
-            if re.match(r"^services:\s*$", line):
+            if COMPOSE_SERVICES_HEADER_RE.match(line):
                 in_services = True
-            i += 1
             continue
 
         # services 段结束：遇到下一个顶层 key
-        if re.match(r"^[A-Za-z0-9_.-]+:\s*$", line):
+        if COMPOSE_TOPLEVEL_KEY_RE.match(line):
+            end = idx
             break
 
-        service_match = re.match(r"^  ([A-Za-z0-9_.-]+):\s*$", line)
+        service_match = COMPOSE_SERVICE_NAME_RE.match(line)
         if not service_match:
-            i += 1
             continue
-
+        if name is not None:
+            services[name] = "\n".join(lines[start:idx])
         name = service_match.group(1)
-        start = i + 1
-        j = start
-        while j < len(lines):
-            current = lines[j]
-            if re.match(r"^  [A-Za-z0-9_.-]+:\s*$", current):
-                break
-            if re.match(r"^[A-Za-z0-9_.-]+:\s*$", current):
-                break
-            j += 1
-        services[name] = "\n".join(lines[start:j])
-        i = j
+        start = idx + 1
+    if name is not None:
+        services[name] = "\n".join(lines[start:end])
     return services
 
 
 def extract_container_name(service_block: str):
-    match = re.search(r"^\s*container_name:\s*([^\s#]+)\s*$", service_block, re.MULTILINE)
+    match = COMPOSE_CONTAINER_NAME_RE.search(service_block)
     return match.group(1) if match else None
 
 
@@ -87,7 +95,7 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertIn("ai-trade-web", self.prod_services)
 
     def test_prod_uses_stable_compose_project_identity(self):
-        compose = PROD_COMPOSE.read_text(encoding="utf-8")
+        compose = read_repo_text(PROD_COMPOSE)
         self.assertIn(
             "name: ${AI_TRADE_COMPOSE_PROJECT_NAME:-ai-trade}",
             compose,
@@ -99,7 +107,7 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertIn("target: research", dev_research)
         self.assertNotIn("dockerfile: Dockerfile.research", dev_research)
 
-        dockerfile = (ROOT / "Dockerfile").read_text(encoding="utf-8")
+        dockerfile = read_repo_text(ROOT / "Dockerfile")
         build_stage, research_stage = dockerfile.split(
             "FROM runtime AS research", maxsplit=1
         )
@@ -117,7 +125,7 @@ class ComposeConsistencyTest(unittest.TestCase):
             research_stage,
         )
 
-        cd_workflow = (ROOT / ".github" / "workflows" / "cd.yml").read_text(encoding="utf-8")
+        cd_workflow = read_repo_text(ROOT / ".github" / "workflows" / "cd.yml")
         self.assertIn("Build and Push Research Image", cd_workflow)
         self.assertIn("file: Dockerfile", cd_workflow)
         self.assertIn("target: research", cd_workflow)
@@ -129,7 +137,7 @@ class ComposeConsistencyTest(unittest.TestCase):
     def test_all_ctest_workflows_install_pinned_research_dependencies(self):
         ctest_workflows = {}
         for workflow_path in WORKFLOWS_DIR.glob("*.yml"):
-            workflow = workflow_path.read_text(encoding="utf-8")
+            workflow = read_repo_text(workflow_path)
             if "ctest --test-dir build --output-on-failure" in workflow:
                 ctest_workflows[workflow_path.name] = workflow
 
@@ -172,7 +180,7 @@ class ComposeConsistencyTest(unittest.TestCase):
                 )
 
     def test_smoke_uses_immutable_release_and_run_specific_evidence(self):
-        workflow = SMOKE_WORKFLOW.read_text(encoding="utf-8")
+        workflow = read_repo_text(SMOKE_WORKFLOW)
         self.assertIn(
             "SMOKE_OUTPUT_ROOT: /opt/ai-trade/data/reports/closed_loop_smoke",
             workflow,
@@ -223,7 +231,7 @@ class ComposeConsistencyTest(unittest.TestCase):
             "--config=${AI_TRADE_CONFIG_PATH:-config/bybit.demo.s5.yaml}",
             prod_runtime,
         )
-        script = RUNNER_SCRIPT.read_text(encoding="utf-8")
+        script = read_repo_text(RUNNER_SCRIPT)
         self.assertIn(
             'DEFAULT_S5_RUNTIME_CONFIG_PATH="config/bybit.demo.s5.yaml"',
             script,
@@ -241,23 +249,21 @@ class ComposeConsistencyTest(unittest.TestCase):
             self.assertNotIn("AI_TRADE_BYBIT_MAINNET_API_SECRET", runtime)
         self.assertTrue(DEMO_INCUBATION_POLICY.is_file())
         self.assertTrue(DEMO_INCUBATION_EVALUATOR.is_file())
-        runner = RUNNER_SCRIPT.read_text(encoding="utf-8")
+        runner = read_repo_text(RUNNER_SCRIPT)
         self.assertIn("evaluate_demo_incubation.py", runner)
         self.assertIn("latest_demo_incubation_report.json", runner)
-        adapter = (ROOT / "src" / "exchange" / "bybit_exchange_adapter.cpp").read_text(
-            encoding="utf-8"
-        )
+        adapter = read_repo_text(ROOT / "src" / "exchange" / "bybit_exchange_adapter.cpp")
         self.assertIn("Bybit 主网实盘连接已硬性禁用", adapter)
 
     def test_s5_live_canary_uses_replay_tradable_symbol(self):
-        config = S5_CONFIG.read_text(encoding="utf-8")
+        config = read_repo_text(S5_CONFIG)
         self.assertIn('fallback_symbols: ["SOLUSDT"]', config)
         self.assertIn('candidate_symbols: ["SOLUSDT"]', config)
         self.assertIn("SOLUSDT 是唯一通过 tradeability 的可交易符号", config)
 
     def test_s5_and_replay_diagnostic_canary_thresholds_stay_aligned(self):
-        s5 = S5_CONFIG.read_text(encoding="utf-8")
-        replay = REPLAY_MAKER_FIRST_CONFIG.read_text(encoding="utf-8")
+        s5 = read_repo_text(S5_CONFIG)
+        replay = read_repo_text(REPLAY_MAKER_FIRST_CONFIG)
         for key, value in (
             ("candidate_probe_diagnostic_min_trend_ratio", "0.64"),
             ("candidate_probe_diagnostic_max_edge_gap_bps", "10.0"),
@@ -467,7 +473,7 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertTrue(DOCKER_GC_SCRIPT.is_file())
 
     def test_closed_loop_runner_exposes_integrator_governance_flags(self):
-        script = RUNNER_SCRIPT.read_text(encoding="utf-8")
+        script = read_repo_text(RUNNER_SCRIPT)
         self.assertIn("--run_id", script)
         self.assertIn("--trend_validation_min_sharpe", script)
         self.assertIn("--trend_validation_min_bars", script)
@@ -688,8 +694,8 @@ class ComposeConsistencyTest(unittest.TestCase):
         )
 
     def test_closed_loop_workflow_enforces_versioned_artifact_contract(self):
-        workflow = CLOSED_LOOP_WORKFLOW.read_text(encoding="utf-8")
-        downloader = REPORT_DOWNLOADER_SCRIPT.read_text(encoding="utf-8")
+        workflow = read_repo_text(CLOSED_LOOP_WORKFLOW)
+        downloader = read_repo_text(REPORT_DOWNLOADER_SCRIPT)
         self.assertIn("config/closed_loop_contract.json", downloader)
         self.assertIn(
             'failures.append(f"{name}:required_not_manifested")',
@@ -745,9 +751,9 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertTrue(all(len(block) < 21_000 for block in run_blocks))
 
     def test_closed_loop_workflow_default_replay_symbols_focus_mechanism_proof(self):
-        workflow = CLOSED_LOOP_WORKFLOW.read_text(encoding="utf-8")
-        smoke_workflow = SMOKE_WORKFLOW.read_text(encoding="utf-8")
-        downloader = REPORT_DOWNLOADER_SCRIPT.read_text(encoding="utf-8")
+        workflow = read_repo_text(CLOSED_LOOP_WORKFLOW)
+        smoke_workflow = read_repo_text(SMOKE_WORKFLOW)
+        downloader = read_repo_text(REPORT_DOWNLOADER_SCRIPT)
         self.assertIn(
             'default: "SOLUSDT"',
             workflow,
@@ -847,9 +853,9 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertIn("command_timeout: 90m", workflow)
 
     def test_smoke_workflow_is_short_health_gate_not_long_s5_gate(self):
-        workflow = SMOKE_WORKFLOW.read_text(encoding="utf-8")
-        runner = RUNNER_SCRIPT.read_text(encoding="utf-8")
-        assess = (ROOT / "tools" / "assess_run_log.py").read_text(encoding="utf-8")
+        workflow = read_repo_text(SMOKE_WORKFLOW)
+        runner = read_repo_text(RUNNER_SCRIPT)
+        assess = read_repo_text(ROOT / "tools" / "assess_run_log.py")
 
         self.assertIn('default: "4"', workflow)
         self.assertIn("inputs.min_runtime_status || '4'", workflow)
@@ -871,9 +877,9 @@ class ComposeConsistencyTest(unittest.TestCase):
         )
 
     def test_cd_deploy_gate_uses_run_specific_artifacts(self):
-        workflow = CD_WORKFLOW.read_text(encoding="utf-8")
-        script = DEPLOY_SCRIPT.read_text(encoding="utf-8")
-        runner = RUNNER_SCRIPT.read_text(encoding="utf-8")
+        workflow = read_repo_text(CD_WORKFLOW)
+        script = read_repo_text(DEPLOY_SCRIPT)
+        runner = read_repo_text(RUNNER_SCRIPT)
 
         self.assertIn("CLOSED_LOOP_RUN_ID: deploy-${{ github.run_id }}-${{ github.run_attempt }}", workflow)
         self.assertIn("CLOSED_LOOP_RUN_ID", workflow)
@@ -892,8 +898,8 @@ class ComposeConsistencyTest(unittest.TestCase):
     def test_web_service_paths_are_consistent(self):
         dev_web = self.dev_services["ai-trade-web"]
         prod_web = self.prod_services["ai-trade-web"]
-        self.assertIn("profiles: [\"web\"]", DEV_COMPOSE.read_text(encoding="utf-8"))
-        self.assertIn("profiles: [\"web\"]", PROD_COMPOSE.read_text(encoding="utf-8"))
+        self.assertIn("profiles: [\"web\"]", read_repo_text(DEV_COMPOSE))
+        self.assertIn("profiles: [\"web\"]", read_repo_text(PROD_COMPOSE))
         self.assertIn("AI_TRADE_REPORTS_ROOT", dev_web)
         self.assertIn("AI_TRADE_MODELS_ROOT", dev_web)
         self.assertIn("AI_TRADE_CONFIG_ROOT", dev_web)
@@ -926,7 +932,7 @@ class ComposeConsistencyTest(unittest.TestCase):
             self.assertIn('max-file: "${DOCKER_LOG_MAX_FILE:-5}"', block)
 
     def test_deploy_defaults_match_prod_container_names(self):
-        script = DEPLOY_SCRIPT.read_text(encoding="utf-8")
+        script = read_repo_text(DEPLOY_SCRIPT)
         self.assertIn(
             'DEPLOY_SERVICES_RAW="ai-trade market-alpha-collector microstructure-demo-policy watchdog scheduler ai-trade-web"',
             script,
@@ -951,7 +957,7 @@ class ComposeConsistencyTest(unittest.TestCase):
         )
 
     def test_cd_uses_immutable_run_bound_release_bundle(self):
-        workflow = CD_WORKFLOW.read_text(encoding="utf-8")
+        workflow = read_repo_text(CD_WORKFLOW)
         self.assertIn("group: production-ecs-cd", workflow)
         self.assertIn("cancel-in-progress: false", workflow)
         self.assertIn(
@@ -1044,7 +1050,7 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertIn("timeout-minutes: 60", workflow)
 
     def test_deploy_rollback_restores_complete_release_or_stops_services(self):
-        script = DEPLOY_SCRIPT.read_text(encoding="utf-8")
+        script = read_repo_text(DEPLOY_SCRIPT)
         self.assertIn("prepare_previous_release()", script)
         self.assertIn("validate_previous_release()", script)
         self.assertIn(
@@ -1174,11 +1180,11 @@ class ComposeConsistencyTest(unittest.TestCase):
         )
 
     def test_release_runtime_paths_preserve_immutable_release(self):
-        deploy = DEPLOY_SCRIPT.read_text(encoding="utf-8")
-        runner = RUNNER_SCRIPT.read_text(encoding="utf-8")
-        closed_loop = CLOSED_LOOP_WORKFLOW.read_text(encoding="utf-8")
-        smoke = SMOKE_WORKFLOW.read_text(encoding="utf-8")
-        prod = PROD_COMPOSE.read_text(encoding="utf-8")
+        deploy = read_repo_text(DEPLOY_SCRIPT)
+        runner = read_repo_text(RUNNER_SCRIPT)
+        closed_loop = read_repo_text(CLOSED_LOOP_WORKFLOW)
+        smoke = read_repo_text(SMOKE_WORKFLOW)
+        prod = read_repo_text(PROD_COMPOSE)
 
         for name, content in {
             "deploy": deploy,
@@ -1203,7 +1209,7 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertIn('/bin/bash "${gc_script}"', runner)
 
     def test_deploy_mutations_are_guarded_until_atomic_commit(self):
-        script = DEPLOY_SCRIPT.read_text(encoding="utf-8")
+        script = read_repo_text(DEPLOY_SCRIPT)
         self.assertNotIn(
             '"${compose_cmd[@]}" stop "${deferred_deploy_services[@]}" || true',
             script,
@@ -1232,7 +1238,7 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertIn("trap 'exit 143' TERM", script)
 
     def test_deploy_gate_allows_only_validated_audit_failure_before_verdict(self):
-        script = DEPLOY_SCRIPT.read_text(encoding="utf-8")
+        script = read_repo_text(DEPLOY_SCRIPT)
         self.assertIn('local stage_name="${CLOSED_LOOP_STAGE^^}"', script)
         self.assertIn('if [[ "${stage_name}" == "DEPLOY" ]]; then', script)
         self.assertIn(
@@ -1261,7 +1267,7 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertGreater(gate_failure_index, deploy_block_index)
 
     def test_deploy_gate_uses_host_python_without_research_image_pull(self):
-        runner = RUNNER_SCRIPT.read_text(encoding="utf-8")
+        runner = read_repo_text(RUNNER_SCRIPT)
         self.assertIn("run_analysis_python()", runner)
         helper_start = runner.index("run_analysis_python() {")
         helper_end = runner.index("\n}", helper_start)
@@ -1277,7 +1283,7 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertIn("run_analysis_python \\\n    tools/build_trade_ledger.py", runner)
 
     def test_closed_loop_assess_summary_failure_is_a_hard_gate(self):
-        runner = RUNNER_SCRIPT.read_text(encoding="utf-8")
+        runner = read_repo_text(RUNNER_SCRIPT)
         self.assertIn("build_summary_for_assess()", runner)
         self.assertIn(
             "assess summary returned non-zero",
@@ -1302,7 +1308,7 @@ class ComposeConsistencyTest(unittest.TestCase):
         self.assertIn("ASSESS_ARGS+=(--report-only)", run_assess_block)
 
     def test_deploy_runs_startup_preflight_before_service_stop(self):
-        script = DEPLOY_SCRIPT.read_text(encoding="utf-8")
+        script = read_repo_text(DEPLOY_SCRIPT)
         self.assertIn('DEPLOY_STARTUP_PREFLIGHT="${DEPLOY_STARTUP_PREFLIGHT:-true}"', script)
         self.assertIn('run_startup_preflight()', script)
         self.assertIn('--check-startup', script)
@@ -1312,8 +1318,8 @@ class ComposeConsistencyTest(unittest.TestCase):
         )
 
     def test_deploy_disk_preflight_cleans_pressure_before_service_mutation(self):
-        script = DEPLOY_SCRIPT.read_text(encoding="utf-8")
-        workflow = CD_WORKFLOW.read_text(encoding="utf-8")
+        script = read_repo_text(DEPLOY_SCRIPT)
+        workflow = read_repo_text(CD_WORKFLOW)
         self.assertIn(
             'DEPLOY_DISK_PREFLIGHT_ENABLED="${DEPLOY_DISK_PREFLIGHT_ENABLED:-true}"',
             script,
@@ -1558,7 +1564,7 @@ set -euo pipefail
             )
 
     def test_deploy_compose_project_migration_behavior(self):
-        deploy_script = DEPLOY_SCRIPT.read_text(encoding="utf-8")
+        deploy_script = read_repo_text(DEPLOY_SCRIPT)
         function_start = deploy_script.index("service_to_container_name() {")
         function_end = deploy_script.index("extract_json_string_field() {")
         function_block = deploy_script[function_start:function_end]
@@ -1627,13 +1633,10 @@ reconcile_compose_project_identity
                             "ai-trade-project-migration-test",
                         )
 
+    @unittest.skipUnless(DOCKER_BIN, "docker not installed")
     def test_optional_compose_config_validation(self):
-        docker_bin = shutil.which("docker")
-        if docker_bin is None:
-            self.skipTest("docker not installed")
-
         version = subprocess.run(
-            [docker_bin, "compose", "version"],
+            [DOCKER_BIN, "compose", "version"],
             cwd=ROOT,
             capture_output=True,
             text=True,
@@ -1641,13 +1644,20 @@ reconcile_compose_project_identity
         if version.returncode != 0:
             self.skipTest("docker compose not available")
 
-        for compose_file in (DEV_COMPOSE, PROD_COMPOSE):
-            result = subprocess.run(
-                [docker_bin, "compose", "-f", str(compose_file), "config"],
-                cwd=ROOT,
-                capture_output=True,
-                text=True,
-            )
+        # 两份 compose 互不依赖，并发校验以重叠 docker CLI 的启动与解析耗时。
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = {
+                compose_file: executor.submit(
+                    subprocess.run,
+                    [DOCKER_BIN, "compose", "-f", str(compose_file), "config"],
+                    cwd=ROOT,
+                    capture_output=True,
+                    text=True,
+                )
+                for compose_file in (DEV_COMPOSE, PROD_COMPOSE)
+            }
+        for compose_file, future in futures.items():
+            result = future.result()
             self.assertEqual(
                 result.returncode,
                 0,
@@ -8,6 +8,7 @@ import sys
 import tempfile
 import unittest
 import zipfile
+from unittest import mock
 
 try:
     import numpy as np
@@ -23,6 +24,10 @@ TOOLS_DIR = pathlib.Path(__file__).resolve().parent
 
 def load_module(name: str):
     path = TOOLS_DIR / f"{name}.py"
+    # 其他测试文件可能已按同一路径加载过该工具模块，直接复用，避免重复 exec 整个脚本。
+    existing = sys.modules.get(name)
+    if existing is not None and getattr(existing, "__file__", None) == str(path):
+        return existing
     spec = importlib.util.spec_from_file_location(name, path)
     if spec is None or spec.loader is None:
         raise RuntimeError(f"failed to load module: {path}")
@@ -91,6 +96,237 @@ class StreamAndGapToolsTest(unittest.TestCase):
         )
         self.assertEqual(dropped, 1)
 
+    def test_latest_klines_reuse_one_connection_across_polls(self):
+        class FakeResponse:
+            status = 200
+
+            def read(self):
+                return json.dumps(
+                    {
+                        "retCode": 0,
+                        "time": 1_700_000_600_000,
+                        "result": {
+                            "list": [
+                                ["1700000600000", "3", "3", "3", "3", "3"],
+                                ["1700000300000", "2", "2", "2", "2", "2"],
+                            ]
+                        },
+                    }
+                ).encode("utf-8")
+
+        class FakeConnection:
+            def __init__(self):
+                self.paths = []
+
+            def request(self, method, path, headers=None):
+                self.paths.append((method, path))
+
+            def getresponse(self):
+                return FakeResponse()
+
+            def close(self):
+                raise AssertionError("healthy connection must stay open")
+
+        connection = FakeConnection()
+        for _ in range(2):
+            candles, dropped, server_time_ms = STREAM.request_bybit_latest_klines(
+                connection=connection,
+                base_url="https://api.bybit.com/",
+                category="linear",
+                symbol="btcusdt",
+                interval="5",
+                bars=2,
+            )
+            self.assertEqual([c.timestamp_ms for c in candles], [1_700_000_300_000])
+            self.assertEqual(dropped, 1)
+            self.assertEqual(server_time_ms, 1_700_000_600_000)
+        self.assertEqual(len(connection.paths), 2)
+        self.assertTrue(connection.paths[0][1].startswith("/v5/market/kline?"))
+        self.assertIn("symbol=BTCUSDT", connection.paths[0][1])
+
+    def test_latest_klines_reconnects_once_after_stale_keepalive(self):
+        response = mock.Mock(status=200)
+        response.read.return_value = json.dumps(
+            {
+                "retCode": 0,
+                "time": 1_700_000_600_000,
+                "result": {"list": [["1700000000000", "1", "1", "1", "1", "1"]]},
+            }
+        ).encode("utf-8")
+        connection = mock.Mock()
+        connection.getresponse.side_effect = [
+            STREAM.http.client.RemoteDisconnected("idle timeout"),
+            response,
+        ]
+        candles, _, _ = STREAM.request_bybit_latest_klines(
+            connection=connection,
+            base_url="https://api.bybit.com",
+            category="linear",
+            symbol="BTCUSDT",
+            interval="5",
+            bars=1,
+        )
+        self.assertEqual(len(candles), 1)
+        self.assertEqual(connection.request.call_count, 2)
+        connection.close.assert_called_once()
+
+        connection.getresponse.side_effect = TimeoutError("read timeout")
+        with self.assertRaises(RuntimeError):
+            STREAM.request_bybit_latest_klines(
+                connection=connection,
+                base_url="https://api.bybit.com",
+                category="linear",
+                symbol="BTCUSDT",
+                interval="5",
+                bars=1,
+            )
+
+    def test_decode_json_bytes_without_orjson(self):
+        raw = json.dumps({"retCode": 0, "retMsg": "OK"}).encode("utf-8")
+        with mock.patch.object(STREAM, "orjson", None):
+            self.assertEqual(STREAM.decode_json_bytes(raw), {"retCode": 0, "retMsg": "OK"})
+        self.assertEqual(STREAM.decode_json_bytes(raw)["retMsg"], "OK")
+
+    def test_stream_csv_roundtrip_skips_malformed_rows(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = pathlib.Path(td) / "ohlcv.csv"
+            STREAM.write_csv(
+                path,
+                [
+                    STREAM.Candle(1000, 1.5, 2.0, 1.0, 1.25, 10.0),
+                    STREAM.Candle(2000, 1.25, 1.5, 1.0, 1.5, 12.0),
+                ],
+            )
+            with path.open("a", encoding="utf-8") as fp:
+                fp.write("bad,row\n3000,1,1\n")
+            loaded = STREAM.read_csv_checked(path)[0]
+        self.assertEqual(list(loaded.keys()), [1000, 2000])
+        self.assertEqual(loaded[1000], STREAM.Candle(1000, 1.5, 2.0, 1.0, 1.25, 10.0))
+
+    def test_stream_main_appends_new_tail_without_rewriting_history(self):
+        polls = [
+            ([STREAM.Candle(1000, 1, 1, 1, 1, 1), STREAM.Candle(2000, 2, 2, 2, 2, 2)], 0, 9000),
+            ([STREAM.Candle(2000, 2, 2, 2, 2, 2), STREAM.Candle(3000, 3, 3, 3, 3, 3)], 0, 9000),
+        ]
+        with tempfile.TemporaryDirectory() as td:
+            output = pathlib.Path(td) / "ohlcv.csv"
+            argv = [
+                "stream_market_ws.py",
+                "--output",
+                str(output),
+                "--iterations",
+                "2",
+                "--sleep-sec",
+                "0",
+            ]
+            with mock.patch.object(sys, "argv", argv), mock.patch.object(
+                STREAM, "open_http_connection", return_value=mock.Mock()
+            ), mock.patch.object(
+                STREAM, "request_bybit_latest_klines", side_effect=polls
+            ), mock.patch.object(
+                STREAM, "write_csv", wraps=STREAM.write_csv
+            ) as write_csv, mock.patch.object(
+                STREAM.time, "sleep"
+            ), mock.patch("builtins.print"):
+                self.assertEqual(STREAM.main(), 0)
+            self.assertEqual(write_csv.call_count, 1)
+            self.assertEqual(list(STREAM.read_csv_checked(output)[0].keys()), [1000, 2000, 3000])
+
+    def _run_stream_main(self, output: pathlib.Path, polls) -> None:
+        argv = [
+            "stream_market_ws.py",
+            "--output",
+            str(output),
+            "--iterations",
+            str(len(polls)),
+            "--sleep-sec",
+            "0",
+        ]
+        with mock.patch.object(sys, "argv", argv), mock.patch.object(
+            STREAM, "open_http_connection", return_value=mock.Mock()
+        ), mock.patch.object(
+            STREAM, "request_bybit_latest_klines", side_effect=polls
+        ), mock.patch.object(
+            STREAM.time, "sleep"
+        ), mock.patch("builtins.print"):
+            self.assertEqual(STREAM.main(), 0)
+
+    def test_stream_main_rewrites_torn_tail_instead_of_appending(self):
+        with tempfile.TemporaryDirectory() as td:
+            output = pathlib.Path(td) / "ohlcv.csv"
+            STREAM.write_csv(
+                output,
+                [STREAM.Candle(1000, 1, 1, 1, 1, 1), STREAM.Candle(2000, 2, 2, 2, 2, 2)],
+            )
+            # 模拟上次运行在写尾行时被杀：只留下半行且没有换行。
+            with output.open("a", encoding="utf-8", newline="") as fp:
+                fp.write("3000,3.0")
+            polls = [([STREAM.Candle(3000, 3, 3, 3, 3, 3)], 0, 9000)]
+            self._run_stream_main(output, polls)
+
+            loaded, appendable = STREAM.read_csv_checked(output)
+            self.assertTrue(appendable)
+            self.assertEqual(list(loaded.keys()), [1000, 2000, 3000])
+            self.assertEqual(loaded[3000], STREAM.Candle(3000, 3, 3, 3, 3, 3))
+            self.assertTrue(output.read_bytes().endswith(b"\r\n"))
+            # sidecar 必须与修复后的 CSV 一致，而不是挂在损坏文件的 (mtime, size) 上。
+            with mock.patch.object(
+                STREAM, "read_csv_checked", side_effect=AssertionError("re-parsed")
+            ):
+                cached, cached_appendable = STREAM.load_candles_checked(output)
+            self.assertEqual(cached, loaded)
+            self.assertTrue(cached_appendable)
+
+    def test_load_candles_sidecar_hit_rechecks_torn_tail(self):
+        with tempfile.TemporaryDirectory() as td:
+            output = pathlib.Path(td) / "ohlcv.csv"
+            candles = {1000: STREAM.Candle(1000, 1, 1, 1, 1, 1)}
+            output.write_bytes(b"timestamp,open,high,low,close,volume\r\n1000,1,1,1,1,1")
+            STREAM.save_candle_cache(output, candles)
+            loaded, appendable = STREAM.load_candles_checked(output)
+            self.assertEqual(loaded, candles)
+            self.assertFalse(appendable)
+
+    def test_stream_main_rewrites_csv_with_foreign_column_order(self):
+        with tempfile.TemporaryDirectory() as td:
+            output = pathlib.Path(td) / "ohlcv.csv"
+            output.write_text(
+                "timestamp,close,open,high,low,volume\r\n1000,1.5,1,2,0.5,10\r\n",
+                encoding="utf-8",
+            )
+            polls = [([STREAM.Candle(2000, 2, 2, 2, 2, 2)], 0, 9000)]
+            self._run_stream_main(output, polls)
+
+            self.assertTrue(output.read_bytes().startswith(STREAM.CSV_HEADER.encode("utf-8")))
+            loaded = STREAM.read_csv_checked(output)[0]
+            self.assertEqual(loaded[1000], STREAM.Candle(1000, 1, 2, 0.5, 1.5, 10))
+            self.assertEqual(loaded[2000], STREAM.Candle(2000, 2, 2, 2, 2, 2))
+
+    def test_load_candles_uses_sidecar_until_csv_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            output = pathlib.Path(td) / "ohlcv.csv"
+            candles = {1000: STREAM.Candle(1000, 1.5, 2.0, 1.0, 1.25, 10.0)}
+            STREAM.write_csv(output, list(candles.values()))
+            STREAM.save_candle_cache(output, candles)
+            # 临时文件已被 os.replace 换成正式 sidecar，目录里不留残余。
+            self.assertEqual(
+                sorted(p.name for p in pathlib.Path(td).iterdir()),
+                ["ohlcv.csv", "ohlcv.csv.cache.pkl"],
+            )
+            with mock.patch.object(
+                STREAM, "read_csv_checked", side_effect=AssertionError("re-parsed")
+            ):
+                self.assertEqual(STREAM.load_candles_checked(output), (candles, True))
+
+            STREAM.append_csv(output, [STREAM.Candle(2000, 1, 1, 1, 1, 1)])
+            with mock.patch.object(
+                STREAM, "read_csv_checked", wraps=STREAM.read_csv_checked
+            ) as read_csv_checked:
+                loaded, appendable = STREAM.load_candles_checked(output)
+            read_csv_checked.assert_called_once_with(output)
+            self.assertEqual(list(loaded.keys()), [1000, 2000])
+            self.assertTrue(appendable)
+
     def test_merge_and_gap_detection(self):
         existing = {
             1000: STREAM.Candle(1000, 1, 1, 1, 1, 1),
@@ -104,6 +340,15 @@ class StreamAndGapToolsTest(unittest.TestCase):
         self.assertEqual(added, 1)
         self.assertEqual(len(existing), 3)
 
+        self.assertEqual(list(existing.keys()), [1000, 2000, 3000])
+
+        backfilled = STREAM.merge_candles(
+            existing,
+            [STREAM.Candle(1500, 1, 1, 1, 1, 1), STREAM.Candle(4000, 1, 1, 1, 1, 1)],
+        )
+        self.assertEqual(backfilled, 2)
+        self.assertEqual(list(existing.keys()), [1000, 1500, 2000, 3000, 4000])
+
         missing = GAP.detect_missing_timestamps([1000, 3000, 4000, 7000], 1000)
         self.assertEqual(missing, [2000, 5000, 6000])
         grouped = GAP.group_missing_ranges(missing, 1000)
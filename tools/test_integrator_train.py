@@ -478,6 +478,47 @@ class IntegratorTrainTest(unittest.TestCase):
         )
         self.assertEqual(len(aucs), 3)
 
+    def test_build_catboost_classifier_defaults_to_plain_bernoulli(self):
+        if TRAIN.CatBoostClassifier is None:
+            self.skipTest("catboost is required")
+        model = TRAIN.build_catboost_classifier(
+            random_seed=42,
+            iterations=4,
+            depth=2,
+            learning_rate=0.03,
+            l2_leaf_reg=3.0,
+            random_strength=1.0,
+            subsample=0.8,
+            rsm=0.8,
+        )
+        params = model.get_params()
+        self.assertEqual(params["boosting_type"], "Plain")
+        self.assertEqual(params["bootstrap_type"], "Bernoulli")
+        self.assertAlmostEqual(params["subsample"], 0.8)
+
+    def test_quantized_pool_cache_reuses_saved_pool(self):
+        if TRAIN.CatBoostClassifier is None:
+            self.skipTest("catboost is required")
+        x = TRAIN.np.arange(40, dtype=TRAIN.np.float64).reshape(-1, 2)
+        y = TRAIN.np.asarray([0, 1] * 10, dtype=TRAIN.np.float64)
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = pathlib.Path(tmp) / "pool_cache"
+            first_pool, first_state = TRAIN.load_or_build_quantized_pool(
+                x, y, cache_dir=cache_dir, schema_hash="abc123"
+            )
+            second_pool, second_state = TRAIN.load_or_build_quantized_pool(
+                x, y, cache_dir=cache_dir, schema_hash="abc123"
+            )
+            _, changed_state = TRAIN.load_or_build_quantized_pool(
+                x, 1.0 - y, cache_dir=cache_dir, schema_hash="abc123"
+            )
+            self.assertEqual(first_state, "miss")
+            self.assertEqual(second_state, "hit")
+            self.assertEqual(changed_state, "miss")
+            self.assertEqual(second_pool.num_row(), first_pool.num_row())
+            self.assertEqual(len(list(cache_dir.glob("integrator_pool_abc123_*.bin"))), 2)
+            self.assertEqual(list(cache_dir.glob(".*.tmp-*")), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -223,9 +223,9 @@ class RecycleArtifactsTest(unittest.TestCase):
             reports_root.mkdir(parents=True, exist_ok=True)
             log_file = reports_root / "cron.log"
 
-            content = "".join(f"line-{i:03d}\n" for i in range(80))
-            log_file.write_text(content, encoding="utf-8")
-            expected_tail = content.encode("utf-8")[-120:]
+            content = b"".join(b"line-%03d\n" % i for i in range(80))
+            log_file.write_bytes(content)
+            expected_tail = content[-120:]
 
             result = run_gc(
                 "--reports-root",
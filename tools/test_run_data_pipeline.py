@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
+import contextlib
 import importlib.util
+import io
 import json
 import pathlib
 import sys
@@ -38,6 +40,23 @@ class RunDataPipelineTest(unittest.TestCase):
             self.assertEqual(payload["common"]["symbol"], "BTCUSDT")
             self.assertEqual(payload["archive"]["enabled"], False)
 
+    def test_load_yaml_falls_back_without_pyyaml(self):
+        with tempfile.TemporaryDirectory() as td:
+            config = pathlib.Path(td) / "data_pipeline.yaml"
+            config.write_text(
+                "common:\n"
+                "  symbol: BTCUSDT  # inline comment\n"
+                "  interval_minutes: 5\n"
+                "walkforward:\n"
+                "  fee_bps: 6.0\n",
+                encoding="utf-8",
+            )
+            with mock.patch.object(PIPELINE, "YAML_LOADER", None):
+                payload = PIPELINE.load_yaml(config)
+            self.assertEqual(payload["common"]["symbol"], "BTCUSDT")
+            self.assertEqual(payload["common"]["interval_minutes"], 5)
+            self.assertEqual(payload["walkforward"]["fee_bps"], 6.0)
+
     def test_main_dry_run(self):
         with tempfile.TemporaryDirectory() as td:
             root = pathlib.Path(td)
@@ -119,6 +138,171 @@ class RunDataPipelineTest(unittest.TestCase):
             )
             self.assertIn("--base-url", gap_step["command"])
 
+    def test_flatten_config_keeps_branches_and_leaves(self):
+        flat = PIPELINE.flatten_config(
+            {"archive": {"enabled": True, "days": 30}, "version": 1}
+        )
+        self.assertEqual(flat[("archive", "days")], 30)
+        self.assertEqual(flat[("archive",)], {"enabled": True, "days": 30})
+        self.assertEqual(flat[("version",)], 1)
+        self.assertNotIn(("walkforward", "enabled"), flat)
+
+    def test_load_yaml_cached_reuses_sidecar_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            config = pathlib.Path(td) / "data_pipeline.yaml"
+            config.write_text("common:\n  symbol: BTCUSDT\n", encoding="utf-8")
+            first = PIPELINE.load_yaml_cached(config)
+            cache_path = pathlib.Path(td) / "data_pipeline.yaml.cache.json"
+            self.assertTrue(cache_path.exists())
+            with mock.patch.object(
+                PIPELINE, "load_yaml", side_effect=AssertionError("re-parsed")
+            ):
+                second = PIPELINE.load_yaml_cached(config)
+            self.assertEqual(first, second)
+
+            config.write_text(
+                "common:\n  symbol: SOLUSDT\n  category: linear\n",
+                encoding="utf-8",
+            )
+            third = PIPELINE.load_yaml_cached(config)
+            self.assertEqual(third["common"]["symbol"], "SOLUSDT")
+
+    def test_load_yaml_cached_reparses_when_parser_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            config = pathlib.Path(td) / "data_pipeline.yaml"
+            config.write_text("common:\n  symbol: BTCUSDT\n", encoding="utf-8")
+            with mock.patch.object(PIPELINE, "YAML_LOADER", None):
+                PIPELINE.load_yaml_cached(config)
+            cache_path = pathlib.Path(td) / "data_pipeline.yaml.cache.json"
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            self.assertEqual(cached["parser"], "minimal")
+            self.assertEqual(
+                sorted(p.name for p in pathlib.Path(td).iterdir()),
+                ["data_pipeline.yaml", "data_pipeline.yaml.cache.json"],
+            )
+
+            loader = type("FakeLoader", (), {})
+            with mock.patch.object(PIPELINE, "YAML_LOADER", loader), mock.patch.object(
+                PIPELINE, "load_yaml", return_value={"common": {"symbol": "SOLUSDT"}}
+            ) as reparse:
+                payload = PIPELINE.load_yaml_cached(config)
+            reparse.assert_called_once_with(config)
+            self.assertEqual(payload["common"]["symbol"], "SOLUSDT")
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            self.assertEqual(cached["parser"], "FakeLoader")
+
+    def test_main_dry_run_keeps_unquoted_archive_dates(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            config = root / "data_pipeline.yaml"
+            run_dir = root / "run"
+            config.write_text(
+                "archive:\n"
+                "  enabled: true\n"
+                "  start_date: 2025-01-01\n"
+                "  end_date: 2026-01-01\n",
+                encoding="utf-8",
+            )
+            with mock.patch.object(
+                sys,
+                "argv",
+                [
+                    "run_data_pipeline.py",
+                    "--config",
+                    str(config),
+                    "--run-dir",
+                    str(run_dir),
+                    "--dry-run",
+                ],
+            ):
+                code = PIPELINE.main()
+
+            self.assertEqual(code, 0)
+            report = json.loads(
+                (run_dir / "data_pipeline_report.json").read_text(encoding="utf-8")
+            )
+            archive_cmd = next(
+                item["command"]
+                for item in report["steps"]
+                if item["name"] == "archive_download"
+            )
+            self.assertEqual(
+                archive_cmd[archive_cmd.index("--start-date") + 1], "2025-01-01"
+            )
+            self.assertEqual(
+                archive_cmd[archive_cmd.index("--end-date") + 1], "2026-01-01"
+            )
+
+    def test_run_command_streams_output_and_tees_step_log(self):
+        with tempfile.TemporaryDirectory() as td:
+            step = PIPELINE.StepResult(
+                name="probe",
+                enabled=True,
+                command=[
+                    sys.executable,
+                    "-c",
+                    "import sys; print('out-line'); "
+                    "print('err-line', file=sys.stderr); sys.exit(3)",
+                ],
+            )
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                result = PIPELINE.run_command(
+                    step, dry_run=False, log_dir=pathlib.Path(td)
+                )
+            self.assertEqual(result.status, "fail")
+            self.assertEqual(result.return_code, 3)
+            self.assertGreater(result.duration_sec, 0.0)
+            # stdout 首行是 [PIPELINE] 命令回显，其中本身含有两个字符串，因此按整行比较。
+            self.assertIn("out-line", stdout.getvalue().splitlines())
+            self.assertNotIn("err-line", stdout.getvalue().splitlines())
+            self.assertEqual(stderr.getvalue().splitlines(), ["err-line"])
+            log_text = pathlib.Path(result.log_path).read_text(encoding="utf-8")
+            self.assertIn("out-line", log_text)
+            self.assertIn("err-line", log_text)
+
+    def test_run_command_in_process_calls_tool_main_with_argv(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = pathlib.Path(td)
+            tool = root / "probe_tool.py"
+            tool.write_text(
+                "import sys\n"
+                "def main():\n"
+                "    print('argv=' + ','.join(sys.argv[1:]))\n"
+                "    print('warn=' + ','.join(sys.argv[1:]), file=sys.stderr)\n"
+                "    return 0 if sys.argv[1:] == ['--ok'] else 4\n",
+                encoding="utf-8",
+            )
+            ok_step = PIPELINE.StepResult(
+                name="probe_ok",
+                enabled=True,
+                command=[sys.executable, str(tool), "--ok"],
+            )
+            fail_step = PIPELINE.StepResult(
+                name="probe_fail",
+                enabled=True,
+                command=[sys.executable, str(tool), "--bad"],
+            )
+            stdout = io.StringIO()
+            stderr = io.StringIO()
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                ok = PIPELINE.run_command(
+                    ok_step, dry_run=False, log_dir=root, in_process=True
+                )
+                failed = PIPELINE.run_command(
+                    fail_step, dry_run=False, log_dir=root, in_process=True
+                )
+            self.assertEqual(ok.status, "ok")
+            self.assertEqual(failed.status, "fail")
+            self.assertEqual(failed.return_code, 4)
+            ok_log = pathlib.Path(ok.log_path).read_text(encoding="utf-8")
+            self.assertIn("argv=--ok", ok_log)
+            self.assertIn("warn=--ok", ok_log)
+            self.assertNotIn("warn=", stdout.getvalue())
+            self.assertIn("warn=--ok", stderr.getvalue())
+            self.assertNotIn("_pipeline_step_probe_tool", sys.modules)
+
     def test_source_contract_rejects_mixed_endpoint(self):
         with tempfile.TemporaryDirectory() as td:
             run_dir = pathlib.Path(td)
@@ -291,8 +475,8 @@ class RunDataPipelineTest(unittest.TestCase):
                 encoding="utf-8",
             )
 
-            def fake_run(step, dry_run):
-                del dry_run
+            def fake_run(step, dry_run, log_dir=None, in_process=False):
+                del dry_run, log_dir, in_process
                 step.status = (
                     "fail" if step.name == "walkforward_backtest" else "ok"
                 )
@@ -14,6 +14,10 @@ from unittest import mock
 
 def load_replay_module():
     module_path = pathlib.Path(__file__).with_name("run_replay_validation.py")
+    # test_data_pipeline_tools 也会加载同一模块，同一路径已加载时直接复用。
+    existing = sys.modules.get("run_replay_validation")
+    if existing is not None and getattr(existing, "__file__", None) == str(module_path):
+        return existing
     spec = importlib.util.spec_from_file_location("run_replay_validation", module_path)
     if spec is None or spec.loader is None:
         raise RuntimeError(f"failed to load module: {module_path}")
@@ -153,6 +153,20 @@ class ValidateReportsTest(unittest.TestCase):
             VALIDATE._validate_one(runtime, "runtime_assess", errors)
             self.assertTrue(any("runtime_status_count" in item for item in errors))
 
+    def test_validate_run_meta_rejects_run_id_with_trailing_newline(self):
+        errors = []
+        VALIDATE._validate_run_meta(
+            {
+                "run_id": "20260214T143928Z\n",
+                "action": "assess",
+                "stage": "S3",
+                "overall_status": "",
+            },
+            errors,
+        )
+        self.assertEqual(len(errors), 1)
+        self.assertIn("run_meta.run_id 非法", errors[0])
+
     def test_allow_missing_returns_zero(self):
         with tempfile.TemporaryDirectory() as td:
             root = pathlib.Path(td)
@@ -11,14 +11,30 @@ Goals:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
-
-RUN_ID_RE = re.compile(r"^\d{8}T\d{6}Z$")
+from typing import Any, Callable, Dict, List, Optional
+
+
+RUN_ID_RE = re.compile(r"\d{8}T\d{6}Z")
+VERDICTS = frozenset({"PASS", "PASS_WITH_ACTIONS", "FAIL"})
+# run_meta 在运行尚未出结论时允许 overall_status 为空串。
+RUN_META_OVERALL_STATUSES = VERDICTS | {""}
+SUMMARY_TYPES = frozenset({"daily", "weekly"})
+RUNTIME_ASSESS_REQUIRED_METRICS = (
+    "runtime_status_count",
+    "critical_count",
+    "ws_unhealthy_count",
+    "self_evolution_action_count",
+    "self_evolution_virtual_action_count",
+    "self_evolution_counterfactual_action_count",
+    "self_evolution_counterfactual_update_count",
+    "self_evolution_factor_ic_action_count",
+    "self_evolution_effective_update_count",
+)
 
 
 def _load_json(path: Path) -> Dict[str, Any]:
@@ -42,51 +58,14 @@ def _require_key(payload: Dict[str, Any], key: str, label: str, errors: List[str
 def _validate_runtime_assess(payload: Dict[str, Any], errors: List[str]) -> None:
     _require_key(payload, "stage", "runtime_assess", errors)
     verdict = _require_key(payload, "verdict", "runtime_assess", errors)
-    if verdict is not None and verdict not in {"PASS", "PASS_WITH_ACTIONS", "FAIL"}:
+    if verdict is not None and verdict not in VERDICTS:
         errors.append(f"runtime_assess.verdict 非法: {verdict}")
 
     metrics = _require_key(payload, "metrics", "runtime_assess", errors)
     metrics_obj = _require_object(metrics, "runtime_assess.metrics", errors)
     if metrics_obj is not None:
-        _require_key(metrics_obj, "runtime_status_count", "runtime_assess.metrics", errors)
-        _require_key(metrics_obj, "critical_count", "runtime_assess.metrics", errors)
-        _require_key(metrics_obj, "ws_unhealthy_count", "runtime_assess.metrics", errors)
-        _require_key(
-            metrics_obj,
-            "self_evolution_action_count",
-            "runtime_assess.metrics",
-            errors,
-        )
-        _require_key(
-            metrics_obj,
-            "self_evolution_virtual_action_count",
-            "runtime_assess.metrics",
-            errors,
-        )
-        _require_key(
-            metrics_obj,
-            "self_evolution_counterfactual_action_count",
-            "runtime_assess.metrics",
-            errors,
-        )
-        _require_key(
-            metrics_obj,
-            "self_evolution_counterfactual_update_count",
-            "runtime_assess.metrics",
-            errors,
-        )
-        _require_key(
-            metrics_obj,
-            "self_evolution_factor_ic_action_count",
-            "runtime_assess.metrics",
-            errors,
-        )
-        _require_key(
-            metrics_obj,
-            "self_evolution_effective_update_count",
-            "runtime_assess.metrics",
-            errors,
-        )
+        for key in RUNTIME_ASSESS_REQUIRED_METRICS:
+            _require_key(metrics_obj, key, "runtime_assess.metrics", errors)
 
     fail_reasons = _require_key(payload, "fail_reasons", "runtime_assess", errors)
     if fail_reasons is not None and not isinstance(fail_reasons, list):
@@ -98,7 +77,7 @@ def _validate_runtime_assess(payload: Dict[str, Any], errors: List[str]) -> None
 
 def _validate_closed_loop_report(payload: Dict[str, Any], errors: List[str]) -> None:
     overall = _require_key(payload, "overall_status", "closed_loop_report", errors)
-    if overall is not None and overall not in {"PASS", "PASS_WITH_ACTIONS", "FAIL"}:
+    if overall is not None and overall not in VERDICTS:
         errors.append(f"closed_loop_report.overall_status 非法: {overall}")
 
     sections = _require_key(payload, "sections", "closed_loop_report", errors)
@@ -119,25 +98,34 @@ def _validate_closed_loop_report(payload: Dict[str, Any], errors: List[str]) ->
 
 def _validate_run_meta(payload: Dict[str, Any], errors: List[str]) -> None:
     run_id = _require_key(payload, "run_id", "run_meta", errors)
-    if isinstance(run_id, str) and not RUN_ID_RE.match(run_id):
+    if isinstance(run_id, str) and not RUN_ID_RE.fullmatch(run_id):
         errors.append(f"run_meta.run_id 非法: {run_id}")
 
     _require_key(payload, "action", "run_meta", errors)
     _require_key(payload, "stage", "run_meta", errors)
     overall = _require_key(payload, "overall_status", "run_meta", errors)
-    if overall is not None and overall not in {"PASS", "PASS_WITH_ACTIONS", "FAIL", ""}:
+    if overall is not None and overall not in RUN_META_OVERALL_STATUSES:
         errors.append(f"run_meta.overall_status 非法: {overall}")
 
 
 def _validate_summary(payload: Dict[str, Any], label: str, errors: List[str]) -> None:
     summary_type = _require_key(payload, "summary_type", label, errors)
-    if summary_type is not None and summary_type not in {"daily", "weekly"}:
+    if summary_type is not None and summary_type not in SUMMARY_TYPES:
         errors.append(f"{label}.summary_type 非法: {summary_type}")
     overall = _require_key(payload, "overall_status", label, errors)
-    if overall is not None and overall not in {"PASS", "PASS_WITH_ACTIONS", "FAIL"}:
+    if overall is not None and overall not in VERDICTS:
         errors.append(f"{label}.overall_status 非法: {overall}")
 
 
+REPORT_VALIDATORS: Dict[str, Callable[..., None]] = {
+    "runtime_assess": _validate_runtime_assess,
+    "closed_loop_report": _validate_closed_loop_report,
+    "run_meta": _validate_run_meta,
+    "daily_summary": functools.partial(_validate_summary, label="daily_summary"),
+    "weekly_summary": functools.partial(_validate_summary, label="weekly_summary"),
+}
+
+
 def _validate_one(
     path: Path,
     kind: str,
@@ -156,14 +144,9 @@ def _validate_one(
     if obj is None:
         return
 
-    if kind == "runtime_assess":
-        _validate_runtime_assess(obj, errors)
-    elif kind == "closed_loop_report":
-        _validate_closed_loop_report(obj, errors)
-    elif kind == "run_meta":
-        _validate_run_meta(obj, errors)
-    elif kind in {"daily_summary", "weekly_summary"}:
-        _validate_summary(obj, kind, errors)
+    validator = REPORT_VALIDATORS.get(kind)
+    if validator is not None:
+        validator(obj, errors=errors)
 
 
 def parse_args() -> argparse.Namespace: